@@ -0,0 +1 @@
+"""Benchmarking tools for puzzle solutions."""
@@ -0,0 +1,64 @@
+"""Checks of puzzle parts against their budgets on the real inputs.
+
+Part modules declare a soft ``BUDGET`` (see Budget). measure_overruns runs a
+part on its real input and lists what it exceeded by more than the tolerance.
+The ``budget`` tests drive it through a pytest plugin kept with the tests, as
+pytest is only a dev dependency.
+"""
+
+from aoc.bench.timing import BenchmarkConfig
+from aoc.runner import BUDGET_TOLERANCE, RunOptions, load_part, run_part
+from aoc.scheduler import find_days
+
+# Quick parts are timed a few times for a stable median, slow ones once
+TIMING = BenchmarkConfig(warmup=0, repeat=1, min_time=0.5, max_repeat=5)
+
+
+def budgeted_parts(year: int) -> list[tuple[int, int]]:
+    """List the parts of a year that declare a budget.
+
+    Args:
+        year: Puzzle year
+
+    Returns:
+        (day, part) pairs in day order
+
+    """
+    return [
+        (day, part)
+        for day in find_days(year)
+        for part in (1, 2)
+        if getattr(load_part(year, day, part), "BUDGET", None) is not None
+    ]
+
+
+def measure_overruns(
+    year: int, day: int, part: int, tolerance: float = BUDGET_TOLERANCE
+) -> list[str]:
+    """Run a part on its real input and check it against its budget.
+
+    Time and memory are measured in separate runs, as tracing allocations
+    slows the solver down.
+
+    Args:
+        year: Puzzle year
+        day: Puzzle day
+        part: Part number
+        tolerance: Factor the part may exceed each budget by
+
+    Returns:
+        One description per exceeded budget (empty when within budget or
+        without a budget)
+
+    """
+    budget = getattr(load_part(year, day, part), "BUDGET", None)
+    if budget is None:
+        return []
+    overruns = []
+    if budget.time is not None:
+        options = RunOptions(bench=TIMING, budget_tolerance=tolerance)
+        overruns += run_part(year, day, part, options).over_budget
+    if budget.memory is not None:
+        options = RunOptions(memory=True, budget_tolerance=tolerance)
+        overruns += run_part(year, day, part, options).over_budget
+    return overruns
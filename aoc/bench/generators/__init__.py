@@ -0,0 +1,157 @@
+"""Seeded, scalable synthetic puzzle inputs.
+
+The committed inputs are small (some are a single integer), so they say little
+about how solvers scale. Each ``yearYYYY`` module of this package defines one
+``dayNN(scale, rng)`` function per puzzle, mirroring the ``yearYYYY/dayNN``
+layout of the solutions. It returns a valid input whose size grows linearly
+with ``scale`` (what one unit is depends on the day, see each function) and,
+where feasible, a reference computing the expected answers independently of
+the solvers.
+
+Example:
+    generated = generate(2016, 7, scale=50_000, seed=1)
+    assert str(part1.solve(generated.text)) == generated.answers[0]
+
+Usage:
+    python -m aoc.bench.generators 2016 7 --scale 50000 --seed 1 > input.txt
+
+"""
+
+import argparse
+import importlib
+import random
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import cached_property
+from types import ModuleType
+
+# Expected answers of (part 1, part 2), None for a part without a reference
+type Answers = tuple[str | None, str | None]
+
+
+@dataclass
+class GeneratedInput:
+    """A synthetic puzzle input.
+
+    Attributes:
+        text: The puzzle input
+        reference: Computes the expected answers (None if no part has one).
+            Some references take a while, so they run on first use of
+            ``answers``.
+
+    """
+
+    text: str
+    reference: Callable[[], Answers] | None = field(default=None, repr=False)
+
+    @cached_property
+    def answers(self) -> Answers:
+        """Expected answers of both parts, as strings."""
+        return self.reference() if self.reference is not None else (None, None)
+
+
+type Generator = Callable[[int, random.Random], GeneratedInput]
+
+
+def load_generators(year: int) -> ModuleType:
+    """Import the generator module of a year.
+
+    Args:
+        year: Puzzle year
+
+    Returns:
+        The imported yearYYYY module
+
+    Raises:
+        ValueError: If there are no generators for the year
+
+    """
+    try:
+        return importlib.import_module(f"aoc.bench.generators.year{year}")
+    except ModuleNotFoundError:
+        msg = f"No input generators for {year}"
+        raise ValueError(msg) from None
+
+
+def available_days(year: int) -> list[int]:
+    """List the days of a year that have a generator.
+
+    Args:
+        year: Puzzle year
+
+    Returns:
+        Sorted day numbers (empty if the year has no generators)
+
+    """
+    try:
+        module = load_generators(year)
+    except ValueError:
+        return []
+    return sorted(
+        int(name[3:])
+        for name in vars(module)
+        if name.startswith("day") and name[3:].isdigit()
+    )
+
+
+def generate(year: int, day: int, scale: int, seed: int = 0) -> GeneratedInput:
+    """Generate an input of a puzzle.
+
+    The same year, day, scale and seed always give the same input.
+
+    Args:
+        year: Puzzle year
+        day: Puzzle day (1-25)
+        scale: Size of the input, in the day's unit (at least 1)
+        seed: Seed of the random generator
+
+    Returns:
+        The generated input and its reference answers
+
+    Raises:
+        ValueError: If the scale is not positive or the day has no generator
+
+    """
+    if scale < 1:
+        msg = f"Scale must be at least 1, got {scale}"
+        raise ValueError(msg)
+    generator: Generator | None = getattr(load_generators(year), f"day{day:02d}", None)
+    if generator is None:
+        msg = f"No input generator for {year} day {day}"
+        raise ValueError(msg)
+    rng = random.Random(seed)  # noqa: S311 - benchmark data, not secrets
+    return generator(scale, rng)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print a generated input, and its answers on stderr.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code
+
+    """
+    parser = argparse.ArgumentParser(prog="python -m aoc.bench.generators")
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    parser.add_argument("--scale", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--answers", action="store_true", help="print the reference answers"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        generated = generate(args.year, args.day, args.scale, args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+    sys.stdout.write(generated.text + "\n")
+    if args.answers:
+        for part, answer in enumerate(generated.answers, start=1):
+            print(
+                f"Part {part}: {answer if answer is not None else '-'}", file=sys.stderr
+            )
+    return 0
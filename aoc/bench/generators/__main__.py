@@ -0,0 +1,7 @@
+"""Entry point of ``python -m aoc.bench.generators``."""
+
+import sys
+
+from aoc.bench.generators import main
+
+sys.exit(main())
@@ -0,0 +1,617 @@
+"""Input generators for Advent of Code 2016.
+
+Answers come from references written independently of the solvers: the
+answer is known by construction (days 4, 6, 9, 12), follows from a closed form
+(days 15, 16, 19) or comes from a direct simulation. Days whose work is fixed
+by the puzzle rather than the input (5, 13, 14, 17) ignore the scale, and the
+MD5 hunts (5, 14, 17) and the day 11 search have no reference.
+"""
+
+import itertools
+import operator
+import random
+import re
+import string
+from collections import Counter, deque
+
+from aoc.bench.generators import Answers, GeneratedInput
+
+# Smallest scale of a scaling run, sized for a few milliseconds per part. Days
+# ignoring the scale and the exponential searches of days 11 and 15 are left out.
+SCALING_BASES = {
+    1: 1000,
+    2: 100,
+    3: 1000,
+    4: 200,
+    6: 1000,
+    7: 200,
+    8: 500,
+    9: 500,
+    10: 200,
+    12: 20,
+    16: 1000,
+    18: 10,
+    19: 10_000,
+    20: 1000,
+}
+
+_LOWER = string.ascii_lowercase
+_ORDINALS = ("first", "second", "third", "fourth")
+
+
+def _word(rng: random.Random, low: int, high: int) -> str:
+    """Draw a random lowercase word of low to high letters."""
+    return "".join(rng.choices(_LOWER, k=rng.randint(low, high)))
+
+
+def _walk_answers(instructions: list[tuple[str, int]]) -> Answers:
+    """Distance of the end and of the first revisited block of a day 1 walk."""
+    dx, dy = 0, 1
+    x = y = 0
+    visited = {(0, 0)}
+    first_revisit = None
+    for turn, blocks in instructions:
+        dx, dy = (dy, -dx) if turn == "R" else (-dy, dx)
+        if first_revisit is None:
+            for step in range(1, blocks + 1):
+                point = (x + dx * step, y + dy * step)
+                if point in visited:
+                    first_revisit = abs(point[0]) + abs(point[1])
+                    break
+                visited.add(point)
+        x, y = x + dx * blocks, y + dy * blocks
+    return str(abs(x) + abs(y)), str(first_revisit or 0)
+
+
+def day01(scale: int, rng: random.Random) -> GeneratedInput:
+    """Generate a walk of ``scale`` turns."""
+    instructions = [(rng.choice("LR"), rng.randint(1, 200)) for _ in range(scale)]
+    text = ", ".join(f"{turn}{blocks}" for turn, blocks in instructions)
+    return GeneratedInput(text, lambda: _walk_answers(instructions))
+
+
+_SQUARE = ("123", "456", "789")
+_DIAMOND = ("  1  ", " 234 ", "56789", " ABC ", "  D  ")
+_MOVES = {"U": (0, -1), "D": (0, 1), "L": (-1, 0), "R": (1, 0)}
+
+
+def _keypad_code(layout: tuple[str, ...], lines: list[str]) -> str:
+    """Code typed by following each line from the previous button."""
+    keys = {
+        (x, y): key
+        for y, row in enumerate(layout)
+        for x, key in enumerate(row)
+        if key != " "
+    }
+    x, y = next(point for point, key in keys.items() if key == "5")
+    code = []
+    for line in lines:
+        for move in line:
+            dx, dy = _MOVES[move]
+            if (x + dx, y + dy) in keys:
+                x, y = x + dx, y + dy
+        code.append(keys[x, y])
+    return "".join(code)
+
+
+def day02(scale: int, rng: random.Random) -> GeneratedInput:
+    """Generate ``scale`` lines of 300 to 600 moves."""
+    lines = [
+        "".join(rng.choices("UDLR", k=rng.randint(300, 600))) for _ in range(scale)
+    ]
+    return GeneratedInput(
+        "\n".join(lines),
+        lambda: (_keypad_code(_SQUARE, lines), _keypad_code(_DIAMOND, lines)),
+    )
+
+
+def _triangles(rows: list[tuple[int, ...]]) -> int:
+    """Count the possible triangles among side triples."""
+    return sum(a + b + c > 2 * max(a, b, c) for a, b, c in rows)
+
+
+def day03(scale: int, rng: random.Random) -> GeneratedInput:
+    """Generate ``scale`` rows of sides, rounded up to a multiple of three."""
+    count = -(-scale // 3) * 3
+    rows = [tuple(rng.randint(1, 999) for _ in range(3)) for _ in range(count)]
+
+    def reference() -> Answers:
+        columns = [
+            tuple(rows[i + k][column] for k in range(3))
+            for i in range(0, count, 3)
+            for column in range(3)
+        ]
+        return str(_triangles(rows)), str(_triangles(columns))
+
+    text = "\n".join(f"{a:5d}{b:5d}{c:5d}" for a, b, c in rows)
+    return GeneratedInput(text, reference)
+
+
+def _checksum(name: str) -> str:
+    """Five most common letters of a room name, ties in alphabetical order."""
+    counts = Counter(name.replace("-", ""))
+    return "".join(sorted(counts, key=lambda letter: (-counts[letter], letter))[:5])
+
+
+def _shift(text: str, sector: int) -> str:
+    """Rotate the letters of a text by a sector ID."""
+    return "".join(
+        "-" if char == "-" else _LOWER[(_LOWER.index(char) + sector) % 26]
+        for char in text
+    )
+
+
+def day04(scale: int, rng: random.Random) -> GeneratedInput:
+    """Generate ``scale`` rooms, about half real, one storing North Pole objects."""
+    rooms = []
+    real_sum = 0
+    for _ in range(scale - 1):
+        name = ""
+        while len(set(name) - {"-"}) < 5:
+            name = "-".join(_word(rng, 3, 10) for _ in range(rng.randint(2, 5)))
+        sector = rng.randint(100, 999)
+        checksum = _checksum(name)
+        if rng.random() < 0.5:
+            real_sum += sector
+        else:
+            decoy = checksum
+            while decoy == checksum:
+                decoy = "".join(sorted(rng.sample(_LOWER, 5)))
+            checksum = decoy
+        rooms.append(f"{name}-{sector}[{checksum}]")
+
+    sector = rng.randint(100, 999)
+    name = _shift("northpole-object-storage", -sector)
+    rooms.insert(rng.randint(0, len(rooms)), f"{name}-{sector}[{_checksum(name)}]")
+    answers = (str(real_sum + sector), str(sector))
+    return GeneratedInput("\n".join(rooms), lambda: answers)
+
+
+def day05(scale: int, rng: random.Random) -> GeneratedInput:  # noqa: ARG001
+    """Generate a door ID (the scale is ignored: the hash search is fixed)."""
+    return GeneratedInput(_word(rng, 8, 8))
+
+
+def day06(scale: int, rng: random.Random) -> GeneratedInput:
+    """Generate about ``scale`` messages of 8 letters.
+
+    Each column has one letter twice more frequent than the others and one
+    letter less frequent, so both answers are unambiguous.
+    """
+    per_letter = max(2, scale // 26)
+    columns = []
+    most, least = [], []
+    for _ in range(8):
+        letters = rng.sample(_LOWER, 26)
+        most.append(letters[0])
+        least.append(letters[1])
+        column = (
+            [letters[0]] * (per_letter + 2)
+            + [letters[1]] * (per_letter - 1)
+            + [letter for letter in letters[2:] for _ in range(per_letter)]
+        )
+        rng.shuffle(column)
+        columns.append(column)
+    text = "\n".join("".join(row) for row in zip(*columns, strict=True))
+    answers = ("".join(most), "".join(least))
+    return GeneratedInput(text, lambda: answers)
+
+
+def _has_abba(text: str) -> bool:
+    """Tell whether a text contains an ABBA like "xyyx"."""
+    return any(
+        text[i] == text[i + 3] != text[i + 1] == text[i + 2]
+        for i in range(len(text) - 3)
+    )
+
+
+def _abas(text: str) -> set[str]:
+    """Find the ABAs of a text, as their first two letters."""
+    return {
+        text[i : i + 2]
+        for i in range(len(text) - 2)
+        if text[i] == text[i + 2] != text[i + 1]
+    }
+
+
+def _ip_answers(lines: list[str]) -> Answers:
+    """Count the addresses supporting TLS and SSL."""
+    tls = ssl = 0
+    for line in lines:
+        parts = re.split(r"[\[\]]", line)
+        supernets, hypernets = parts[::2], parts[1::2]
+        if any(map(_has_abba, supernets)) and not any(map(_has_abba, hypernets)):
+            tls += 1
+        abas = set().union(*map(_abas, supernets))
+        # The ABA "xyx" (kept as "xy") needs a BAB "yxy" in a hypernet
+        if any(
+            aba[1] + aba[0] + aba[1] in hypernet
+            for aba in abas
+            for hypernet in hypernets
+        ):
+            ssl += 1
+    return str(tls), str(ssl)
+
+
+def day07(scale: int, rng: random.Random) -> GeneratedInput:
+    """Generate ``scale`` addresses of about 100 characters."""
+    lines = []
+    for _ in range(scale):
+        segments = [_word(rng, 5, 20) for _ in range(2 * rng.randint(1, 3) + 1)]
+        a, b = rng.sample(_LOWER, 2)
+        if rng.random() < 0.3:
+            segments[2 * rng.randrange(len(segments) // 2 + 1)] += a + b + b + a
+        if rng.random() < 0.1:
+            segments[2 * rng.randrange(len(segments) // 2) + 1] += b + a + a + b
+        if rng.random() < 0.3:
+            segments[2 * rng.randrange(len(segments) // 2 + 1)] += a + b + a
+            segments[2 * rng.randrange(len(segments) // 2) + 1] += b + a + b
+        lines.append(
+            "".join(
+                f"[{segment}]" if i % 2 else segment
+                for i, segment in enumerate(segments)
+            )
+        )
+    return GeneratedInput("\n".join(lines), lambda: _ip_answers(lines))
+
+
+def _screen_answers(instructions: list[tuple[str, int, int]]) -> Answers:
+    """Lit pixels and picture of a 50x6 screen."""
+    pixels = [[False] * 50 for _ in range(6)]
+    for op, a, b in instructions:
+        if op == "rect":
+            for y in range(b):
+                pixels[y][:a] = [True] * a
+        elif op == "row":
+            pixels[a] = pixels[a][-b:] + pixels[a][:-b]
+        else:
+            column = [row[a] for row in pixels]
+            for y, row in enumerate(pixels):
+                row[a] = column[(y - b) % 6]
+    picture = "\n".join("".join("#" if p else "." for p in row) for row in pixels)
+    return str(picture.count("#")), picture
+
+
+def day08(scale: int, rng: random.Random) -> GeneratedInput:
+    """Generate ``scale`` screen operations."""
+    instructions = []
+    lines = []
+    for _ in range(scale):
+        kind = rng.random()
+        if kind < 0.3:
+            width, height = rng.randint(1, 10), rng.randint(1, 6)
+            instructions.append(("rect", width, height))
+            lines.append(f"rect {width}x{height}")
+        elif kind < 0.65:
+            row, by = rng.randrange(6), rng.randint(1, 49)
+            instructions.append(("row", row, by))
+            lines.append(f"rotate row y={row} by {by}")
+        else:
+            column, by = rng.randrange(50), rng.randint(1, 5)
+            instructions.append(("column", column, by))
+            lines.append(f"rotate column x={column} by {by}")
+    return GeneratedInput("\n".join(lines), lambda: _screen_answers(instructions))
+
+
+def _compressed(rng: random.Random, depth: int, segments: int) -> tuple[str, int, int]:
+    """Build compressed data with its version 1 and version 2 lengths."""
+    parts = []
+    v1 = v2 = 0
+    for _ in range(segments):
+        if depth and rng.random() < 0.4:
+            body, _, body_v2 = _compressed(rng, depth - 1, rng.randint(1, 3))
+            repeat = rng.randint(1, 9)
+            parts.append(f"({len(body)}x{repeat}){body}")
+            v1 += len(body) * repeat
+            v2 += body_v2 * repeat
+        else:
+            plain = "".join(rng.choices(string.ascii_uppercase, k=rng.randint(1, 10)))
+            parts.append(plain)
+            v1 += len(plain)
+            v2 += len(plain)
+    return "".join(parts), v1, v2
+
+
+def day09(scale: int, rng: random.Random) -> GeneratedInput:
+    """Generate ``scale`` top-level segments, with markers nested up to 3 deep."""
+    text, v1, v2 = _compressed(rng, 3, scale)
+    return GeneratedInput(text, lambda: (str(v1), str(v2)))
+
+
+def _factory_answers(lines: list[str]) -> Answers:
+    """Run a bot factory with a work list."""
+    holding: dict[int, list[int]] = {}
+    rules: dict[int, tuple[str, int, str, int]] = {}
+    for line in lines:
+        numbers = list(map(int, re.findall(r"\d+", line)))
+        if line.startswith("value"):
+            holding.setdefault(numbers[1], []).append(numbers[0])
+        else:
+            kinds = re.findall(r"(bot|output) \d+", line)[1:]
+            rules[numbers[0]] = (kinds[0], numbers[1], kinds[1], numbers[2])
+
+    outputs: dict[int, int] = {}
+    comparer = -1
+    ready = deque(bot for bot, chips in holding.items() if len(chips) == 2)
+    while ready:
+        bot = ready.popleft()
+        low, high = sorted(holding.pop(bot))
+        if (low, high) == (17, 61):
+            comparer = bot
+        low_kind, low_id, high_kind, high_id = rules[bot]
+        for kind, target, chip in ((low_kind, low_id, low), (high_kind, high_id, high)):
+            if kind == "output":
+                outputs[target] = chip
+            else:
+                holding.setdefault(target, []).append(chip)
+                if len(holding[target]) == 2:
+                    ready.append(target)
+    return str(comparer), str(outputs[0] * outputs[1] * outputs[2])
+
+
+def day10(scale: int, rng: random.Random) -> GeneratedInput:
+    """Generate a network of ``scale`` bots.
+
+    Bots form a random DAG in which every bot receives exactly two chips. One
+    bot is handed chips 17 and 61 directly and sends them to separate
+    outputs, so it is the only one comparing them.
+    """
+    bots = max(scale, 3)
+    ids = rng.sample(range(bots * 2), bots)  # Bot IDs in topological order
+    free = [2] * bots  # Input slots not yet fed by another bot
+    free[0] = 0  # The 17/61 bot gets both chips from value instructions
+    outputs = itertools.count()
+    lines = []
+    for i in range(bots):
+        targets = []
+        for _ in range(2):
+            # A few tries at a later bot with a free input, else an output
+            tries = (
+                [rng.randrange(i + 1, bots) for _ in range(3)] if i + 1 < bots else []
+            )
+            receiver = next((j for j in tries if free[j]), None)
+            if i and receiver is not None:
+                free[receiver] -= 1
+                targets.append(f"bot {ids[receiver]}")
+            else:
+                targets.append(f"output {next(outputs)}")
+        lines.append(f"bot {ids[i]} gives low to {targets[0]} and high to {targets[1]}")
+
+    chips = rng.sample(
+        [v for v in range(1, 4 * bots + 100) if v not in (17, 61)], sum(free)
+    )
+    values = [(17, ids[0]), (61, ids[0])]
+    values += zip(
+        chips, (ids[i] for i in range(bots) for _ in range(free[i])), strict=True
+    )
+    lines += [f"value {chip} goes to bot {bot}" for chip, bot in values]
+    rng.shuffle(lines)
+    return GeneratedInput("\n".join(lines), lambda: _factory_answers(lines))
+
+
+def _floor_text(floor: int, items: list[str]) -> str:
+    """Describe the contents of a floor like the puzzle does."""
+    if not items:
+        listing = "nothing relevant"
+    elif len(items) == 1:
+        listing = items[0]
+    elif len(items) == 2:  # No comma between two items
+        listing = " and ".join(items)
+    else:
+        listing = ", ".join(items[:-1]) + ", and " + items[-1]
+    return f"The {_ORDINALS[floor]} floor contains {listing}."
+
+
+def day11(scale: int, rng: random.Random) -> GeneratedInput:
+    """Generate ``scale`` generator/microchip pairs, each pair on one of floors 1-3."""
+    elements: set[str] = set()
+    while len(elements) < scale:
+        elements.add(_word(rng, 6, 9))
+    floors: list[list[str]] = [[], [], [], []]
+    for element in sorted(elements):
+        floor = rng.randrange(3)
+        floors[floor] += [f"a {element} generator", f"a {element}-compatible microchip"]
+    for items in floors:
+        rng.shuffle(items)
+    return GeneratedInput(
+        "\n".join(_floor_text(f, items) for f, items in enumerate(floors))
+    )
+
+
+def _multiply_block(x: int, y: int) -> list[str]:
+    """Assembunny adding x * y to register a, using b and d."""
+    return [
+        f"cpy {x} b",
+        f"cpy {y} d",
+        "inc a",
+        "dec d",
+        "jnz d -2",
+        "dec b",
+        "jnz b -5",
+    ]
+
+
+def day12(scale: int, rng: random.Random) -> GeneratedInput:
+    """Generate ``scale`` multiply loops, plus one run only when c starts at 1."""
+    extra = (rng.randint(2, 30), rng.randint(2, 30))
+    blocks = [(rng.randint(2, 30), rng.randint(2, 30)) for _ in range(scale)]
+    program = ["jnz c 2", "jnz 1 8", *_multiply_block(*extra)]
+    for x, y in blocks:
+        program += _multiply_block(x, y)
+    total = sum(x * y for x, y in blocks)
+    answers = (str(total), str(total + extra[0] * extra[1]))
+    return GeneratedInput("\n".join(program), lambda: answers)
+
+
+def _maze_answers(favorite: int) -> Answers | None:
+    """Distance to 31,39 and places within 50 steps (None if 31,39 is walled off)."""
+
+    def is_open(x: int, y: int) -> bool:
+        value = x * x + 3 * x + 2 * x * y + y + y * y + favorite
+        return x >= 0 and y >= 0 and value.bit_count() % 2 == 0
+
+    distances = {(1, 1): 0}
+    queue = deque([(1, 1)])
+    while queue:
+        x, y = queue.popleft()
+        steps = distances[x, y]
+        if steps > 1000:  # The target is much closer when reachable
+            break
+        for point in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if point not in distances and is_open(*point):
+                distances[point] = steps + 1
+                queue.append(point)
+        if (31, 39) in distances and steps >= 50:  # Every place within 50 is known
+            within = sum(d <= 50 for d in distances.values())
+            return str(distances[31, 39]), str(within)
+    return None
+
+
+def day13(scale: int, rng: random.Random) -> GeneratedInput:  # noqa: ARG001
+    """Generate a favorite number with 31,39 reachable (the scale is ignored)."""
+    while True:
+        favorite = rng.randint(1000, 9999)
+        if (answers := _maze_answers(favorite)) is not None:
+            break
+    return GeneratedInput(str(favorite), lambda: answers)
+
+
+def day14(scale: int, rng: random.Random) -> GeneratedInput:  # noqa: ARG001
+    """Generate a salt (the scale is ignored: the key search is fixed)."""
+    return GeneratedInput(_word(rng, 8, 8))
+
+
+def _primes(count: int, skip: int) -> list[int]:
+    """List the first primes, leaving one out."""
+    primes: list[int] = []
+    for n in itertools.count(2):
+        if len(primes) == count:
+            return primes
+        if n != skip and all(n % p for p in primes if p * p <= n):
+            primes.append(n)
+    return primes
+
+
+def _crt(discs: list[tuple[int, int, int]]) -> int:
+    """First time all discs line up, by the Chinese remainder theorem."""
+    time, step = 0, 1
+    for number, positions, start in discs:
+        while (start + time + number) % positions:
+            time += step
+        step *= positions
+    return time
+
+
+def day15(scale: int, rng: random.Random) -> GeneratedInput:
+    """Generate ``scale`` discs of distinct prime sizes.
+
+    The first time the capsule gets through is around the product of the
+    sizes, so brute-force solvers slow down exponentially with the scale.
+    """
+    sizes = _primes(scale, skip=11)  # Part 2 adds a disc of 11 positions
+    rng.shuffle(sizes)
+    discs = [(i, size, rng.randrange(size)) for i, size in enumerate(sizes, start=1)]
+    text = "\n".join(
+        f"Disc #{i} has {size} positions; at time=0, it is at position {start}."
+        for i, size, start in discs
+    )
+    return GeneratedInput(
+        text, lambda: (str(_crt(discs)), str(_crt([*discs, (len(discs) + 1, 11, 0)])))
+    )
+
+
+def _disk_checksum(state: str, length: int) -> str:
+    """Checksum of a dragon-curve disk.
+
+    A checksum digit covers a chunk of 2^k bits and is 1 when the chunk has
+    an even number of ones.
+    """
+    flip = str.maketrans("01", "10")
+    while len(state) < length:
+        state = state + "0" + state[::-1].translate(flip)
+    chunk = length & -length
+    return "".join(
+        "1" if state.count("1", i, i + chunk) % 2 == 0 else "0"
+        for i in range(0, length, chunk)
+    )
+
+
+def day16(scale: int, rng: random.Random) -> GeneratedInput:
+    """Generate an initial state of ``scale`` bits."""
+    state = "".join(rng.choices("01", k=scale))
+    return GeneratedInput(
+        state,
+        lambda: (_disk_checksum(state, 272), _disk_checksum(state, 35651584)),
+    )
+
+
+def day17(scale: int, rng: random.Random) -> GeneratedInput:  # noqa: ARG001
+    """Generate a passcode (the scale is ignored: the vault grid is fixed)."""
+    return GeneratedInput(_word(rng, 8, 8))
+
+
+def _safe_tiles(row: str, rows: int) -> int:
+    """Count safe tiles (a trap when exactly one upper neighbour is a trap)."""
+    traps = row.translate(str.maketrans(".^", "\0\1")).encode()
+    safe = 0
+    for _ in range(rows):
+        safe += traps.count(0)
+        traps = bytes(map(operator.xor, b"\0" + traps[:-1], traps[1:] + b"\0"))
+    return safe
+
+
+def day18(scale: int, rng: random.Random) -> GeneratedInput:
+    """Generate a first row of ``scale`` tiles."""
+    row = "".join(rng.choices(".^", k=scale))
+    return GeneratedInput(
+        row, lambda: (str(_safe_tiles(row, 40)), str(_safe_tiles(row, 400000)))
+    )
+
+
+def _josephus(elves: int) -> Answers:
+    """Winners of both games in closed form."""
+    left = 2 * (elves - (1 << (elves.bit_length() - 1))) + 1
+    power = 1  # Largest power of three up to the number of elves
+    while power * 3 <= elves:
+        power *= 3
+    if elves == power:
+        across = elves
+    elif elves - power <= power:
+        across = elves - power
+    else:
+        across = 2 * elves - 3 * power
+    return str(left), str(across)
+
+
+def day19(scale: int, rng: random.Random) -> GeneratedInput:
+    """Generate a circle of ``scale`` to ``2 * scale`` elves."""
+    elves = rng.randint(scale, 2 * scale)
+    return GeneratedInput(str(elves), lambda: _josephus(elves))
+
+
+def _firewall_answers(ranges: list[tuple[int, int]]) -> Answers:
+    """Lowest allowed address and number of allowed addresses."""
+    lowest = None
+    allowed = 0
+    next_free = 0
+    for start, end in sorted(ranges):
+        if start > next_free:
+            lowest = next_free if lowest is None else lowest
+            allowed += start - next_free
+        next_free = max(next_free, end + 1)
+    if next_free <= 2**32 - 1:
+        lowest = next_free if lowest is None else lowest
+        allowed += 2**32 - next_free
+    return str(lowest), str(allowed)
+
+
+def day20(scale: int, rng: random.Random) -> GeneratedInput:
+    """Generate ``scale`` blocked ranges, leaving gaps between them."""
+    top = 2**32 - 1
+    width = 2 * 2**32 // scale
+    ranges = []
+    for _ in range(scale):
+        start = rng.randint(0, top)
+        ranges.append((start, min(top, start + rng.randint(0, width))))
+    text = "\n".join(f"{start}-{end}" for start, end in ranges)
+    return GeneratedInput(text, lambda: _firewall_answers(ranges))
@@ -0,0 +1,487 @@
+"""SQLite history of benchmark runs with regression detection.
+
+Every benchmark run is stored with the git commit, Python version and machine
+it ran on, along with the raw wall and CPU time samples of each part. Two runs
+are compared per part with a Mann-Whitney U test, so only statistically
+significant slowdowns are flagged.
+
+Usage:
+    python -m aoc.bench.history list
+    python -m aoc.bench.history compare BASELINE_ID [CANDIDATE_ID]
+"""
+
+import argparse
+import hashlib
+import math
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from aoc.helpers import get_cache_dir
+from aoc.types import PartResult, SolveResult
+
+# Largest product of sample sizes tested with the exact distribution of U
+EXACT_LIMIT = 400
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    git_commit TEXT,
+    python_version TEXT NOT NULL,
+    machine_id TEXT NOT NULL,
+    note TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS parts (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    answer TEXT,
+    PRIMARY KEY (run_id, year, day, part)
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    year INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    part INTEGER NOT NULL,
+    kind TEXT NOT NULL CHECK (kind IN ('wall', 'cpu')),
+    ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS samples_by_run ON samples (run_id, kind);
+"""
+
+
+def git_commit() -> str | None:
+    """Get the current commit of the repository, suffixed when dirty.
+
+    Returns:
+        Commit hash (with "-dirty" if there are local changes), or None if
+        git is unavailable
+
+    """
+    root = Path(__file__).parent.parent.parent
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],  # noqa: S607
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if status.strip() else commit
+
+
+def machine_id() -> str:
+    """Get a stable, anonymous identifier of the current machine.
+
+    Returns:
+        Short hex digest of the host name, CPU architecture and CPU model
+
+    """
+    description = "|".join(
+        (platform.node(), platform.machine(), platform.processor(), platform.system())
+    )
+    return hashlib.sha256(description.encode()).hexdigest()[:16]
+
+
+def _u_counts(n1: int, n2: int) -> list[int]:
+    """Count the orderings of two tie-free samples giving each value of U.
+
+    Args:
+        n1: Size of the first sample
+        n2: Size of the second sample
+
+    Returns:
+        Number of orderings with U = 0, 1, ..., n1 * n2
+
+    """
+    # counts[j][u]: orderings of i values from the first sample and j from the
+    # second with U = u, built up one value of the first sample at a time
+    counts = [[1] for _ in range(n2 + 1)]
+    for _ in range(n1):
+        previous = counts
+        counts = [[] for _ in range(n2 + 1)]
+        for j in range(n2 + 1):
+            # The largest value is from the first sample (beating all j) or
+            # from the second one
+            above = previous[j]
+            below = counts[j - 1] if j else []
+            size = max(len(above) + j, len(below))
+            row = [0] * size
+            for u, count in enumerate(above):
+                row[u + j] += count
+            for u, count in enumerate(below):
+                row[u] += count
+            counts[j] = row
+    return counts[n2]
+
+
+def min_p_value(n1: int, n2: int) -> float:
+    """Smallest two-sided p-value the U test can give for two sample sizes.
+
+    Args:
+        n1: Size of the first sample
+        n2: Size of the second sample
+
+    Returns:
+        p-value of two samples that do not overlap at all
+
+    """
+    return min(1.0, 2 / math.comb(n1 + n2, n1))
+
+
+def mann_whitney_p(a: list[int], b: list[int]) -> float:
+    """Two-sided p-value of the Mann-Whitney U test.
+
+    Small samples without ties get the exact distribution of U, as the normal
+    approximation overstates their p-values (two disjoint runs of five would
+    never reach 1%). Larger ones use the normal approximation with tie and
+    continuity corrections.
+
+    Args:
+        a: First sample
+        b: Second sample
+
+    Returns:
+        Probability of a rank difference at least this large if both samples
+        come from the same distribution
+
+    """
+    n1, n2 = len(a), len(b)
+    combined = sorted([(value, 0) for value in a] + [(value, 1) for value in b])
+    n = n1 + n2
+
+    # Average ranks over ties
+    rank_sum_a = 0.0
+    tie_term = 0
+    i = 0
+    while i < n:
+        j = i
+        while j < n and combined[j][0] == combined[i][0]:
+            j += 1
+        average_rank = (i + j + 1) / 2  # Ranks are 1-based
+        rank_sum_a += average_rank * sum(1 for _, side in combined[i:j] if side == 0)
+        tie_term += (j - i) ** 3 - (j - i)
+        i = j
+
+    u = rank_sum_a - n1 * (n1 + 1) / 2
+    if tie_term == 0 and n1 * n2 <= EXACT_LIMIT:
+        counts = _u_counts(n1, n2)
+        tail = sum(counts[: int(min(u, n1 * n2 - u)) + 1])
+        return min(1.0, 2 * tail / math.comb(n1 + n2, n1))
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+
+    z = (abs(u - mean) - 0.5) / math.sqrt(variance)
+    return min(1.0, 2 * (1 - statistics.NormalDist().cdf(max(z, 0.0))))
+
+
+@dataclass
+class RunInfo:
+    """Metadata of a stored benchmark run.
+
+    Attributes:
+        id: Run identifier
+        started_at: ISO timestamp (UTC) of when the run was recorded
+        git_commit: Commit the run was made on (None if unknown)
+        python_version: Python version used
+        machine_id: Identifier of the machine from machine_id()
+        note: Free-form description
+
+    """
+
+    id: int
+    started_at: str
+    git_commit: str | None
+    python_version: str
+    machine_id: str
+    note: str
+
+
+@dataclass
+class Comparison:
+    """Timing comparison of one part between two runs.
+
+    Attributes:
+        year: Year of the puzzle
+        day: Day of the puzzle
+        part: Part number
+        baseline_ns: Median time in the baseline run
+        candidate_ns: Median time in the candidate run
+        ratio: candidate_ns / baseline_ns
+        p_value: Mann-Whitney U p-value of the difference
+        verdict: "regression", "improvement", "unchanged" or "inconclusive"
+            (too few samples to ever be significant at the chosen level)
+
+    """
+
+    year: int
+    day: int
+    part: int
+    baseline_ns: float
+    candidate_ns: float
+    ratio: float
+    p_value: float
+    verdict: str
+
+
+class BenchmarkHistory:
+    """Benchmark runs stored in a local SQLite database."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Open (and create if needed) the database.
+
+        Args:
+            path: Database file (defaults to benchmarks.sqlite3 in the cache dir)
+
+        """
+        self.path = path or get_cache_dir() / "benchmarks.sqlite3"
+        self.db = sqlite3.connect(self.path)
+        self.db.execute("PRAGMA foreign_keys = ON")
+        self.db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.db.close()
+
+    def record_run(self, results: list[SolveResult], note: str = "") -> int:
+        """Store the timing samples of a benchmark run.
+
+        Args:
+            results: Results from run_day/run_year in benchmark mode (parts
+                without timing distributions are skipped)
+            note: Free-form description of the run
+
+        Returns:
+            Identifier of the new run
+
+        """
+        parts = [
+            PartResult(r.year, r.day, part, answer, time, stats)
+            for r in results
+            for part, answer, time, stats in (
+                (1, r.part1_answer, r.part1_time, r.part1_stats),
+                (2, r.part2_answer, r.part2_time, r.part2_stats),
+            )
+        ]
+        return self.record_parts(parts, note)
+
+    def record_parts(self, parts: list[PartResult], note: str = "") -> int:
+        """Store the timing samples of individually benchmarked parts.
+
+        Args:
+            parts: Part results in benchmark mode (parts without timing
+                distributions are skipped)
+            note: Free-form description of the run
+
+        Returns:
+            Identifier of the new run
+
+        """
+        with self.db:
+            cursor = self.db.execute(
+                "INSERT INTO runs (started_at, git_commit, python_version,"
+                " machine_id, note) VALUES (?, ?, ?, ?, ?)",
+                (
+                    datetime.now(UTC).isoformat(timespec="seconds"),
+                    git_commit(),
+                    platform.python_version(),
+                    machine_id(),
+                    note,
+                ),
+            )
+            run_id = cursor.lastrowid
+            assert run_id is not None  # noqa: S101 - always set after INSERT
+
+            for result in parts:
+                if result.stats is None:
+                    continue
+                key = (run_id, result.year, result.day, result.part)
+                answer = None if result.answer is None else str(result.answer)
+                self.db.execute(
+                    "INSERT INTO parts VALUES (?, ?, ?, ?, ?)", (*key, answer)
+                )
+                self.db.executemany(
+                    "INSERT INTO samples VALUES (?, ?, ?, ?, ?, ?)",
+                    [(*key, "wall", ns) for ns in result.stats.wall.samples]
+                    + [(*key, "cpu", ns) for ns in result.stats.cpu.samples],
+                )
+
+        return run_id
+
+    def runs(self) -> list[RunInfo]:
+        """List stored runs, oldest first.
+
+        Returns:
+            Metadata of every run
+
+        """
+        rows = self.db.execute(
+            "SELECT id, started_at, git_commit, python_version, machine_id, note"
+            " FROM runs ORDER BY id"
+        )
+        return [RunInfo(*row) for row in rows]
+
+    def samples(
+        self, run_id: int, kind: str = "wall"
+    ) -> dict[tuple[int, int, int], list[int]]:
+        """Get the timing samples of a run.
+
+        Args:
+            run_id: Run identifier
+            kind: "wall" or "cpu"
+
+        Returns:
+            Mapping from (year, day, part) to samples in nanoseconds
+
+        """
+        samples: dict[tuple[int, int, int], list[int]] = {}
+        rows = self.db.execute(
+            "SELECT year, day, part, ns FROM samples WHERE run_id = ? AND kind = ?",
+            (run_id, kind),
+        )
+        for year, day, part, ns in rows:
+            samples.setdefault((year, day, part), []).append(ns)
+        return samples
+
+    def compare(
+        self,
+        baseline: int,
+        candidate: int,
+        kind: str = "wall",
+        alpha: float = 0.01,
+        threshold: float = 0.05,
+    ) -> list[Comparison]:
+        """Compare the parts two runs have in common.
+
+        A part is a regression (or improvement) when its median changed by
+        more than ``threshold`` and the change is significant at ``alpha``. It
+        is inconclusive when the runs have too few samples for any change to
+        be significant.
+
+        Args:
+            baseline: Run to compare against
+            candidate: Run to check
+            kind: "wall" or "cpu"
+            alpha: Significance level of the Mann-Whitney U test
+            threshold: Minimum relative change of the median to report
+
+        Returns:
+            One Comparison per common part, in day order
+
+        """
+        before = self.samples(baseline, kind)
+        after = self.samples(candidate, kind)
+        comparisons = []
+
+        for key in sorted(before.keys() & after.keys()):
+            baseline_ns = statistics.median(before[key])
+            candidate_ns = statistics.median(after[key])
+            ratio = candidate_ns / baseline_ns if baseline_ns else math.inf
+            p_value = mann_whitney_p(before[key], after[key])
+
+            verdict = "unchanged"
+            if min_p_value(len(before[key]), len(after[key])) >= alpha:
+                verdict = "inconclusive"
+            elif p_value < alpha and ratio > 1 + threshold:
+                verdict = "regression"
+            elif p_value < alpha and ratio < 1 - threshold:
+                verdict = "improvement"
+
+            comparisons.append(
+                Comparison(
+                    *key,
+                    baseline_ns=baseline_ns,
+                    candidate_ns=candidate_ns,
+                    ratio=ratio,
+                    p_value=p_value,
+                    verdict=verdict,
+                )
+            )
+
+        return comparisons
+
+
+def main(argv: list[str] | None = None) -> int:
+    """List runs or compare two runs from the command line.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code: 1 if the comparison found a regression, 0 otherwise
+
+    """
+    parser = argparse.ArgumentParser(prog="python -m aoc.bench.history")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list stored benchmark runs")
+    compare = commands.add_parser("compare", help="compare two benchmark runs")
+    compare.add_argument("baseline", type=int, help="baseline run id")
+    compare.add_argument(
+        "candidate", type=int, nargs="?", help="candidate run id (default: latest)"
+    )
+    compare.add_argument("--cpu", action="store_true", help="compare CPU time")
+    compare.add_argument("--alpha", type=float, default=0.01)
+    compare.add_argument("--threshold", type=float, default=0.05)
+    args = parser.parse_args(argv)
+
+    history = BenchmarkHistory()
+    try:
+        runs = history.runs()
+        if args.command == "list":
+            for run in runs:
+                print(
+                    f"{run.id:4d}  {run.started_at}  {(run.git_commit or '-')[:12]:12}"
+                    f"  py{run.python_version}  {run.machine_id}  {run.note}"
+                )
+            return 0
+
+        candidate = args.candidate or (runs[-1].id if runs else 0)
+        comparisons = history.compare(
+            args.baseline,
+            candidate,
+            kind="cpu" if args.cpu else "wall",
+            alpha=args.alpha,
+            threshold=args.threshold,
+        )
+    finally:
+        history.close()
+
+    print(f"Run {candidate} vs baseline {args.baseline}")
+    for c in comparisons:
+        flag = {"regression": "✗", "improvement": "✓", "inconclusive": "?"}.get(
+            c.verdict, " "
+        )
+        print(
+            f"{flag} {c.year} day {c.day:2d} part {c.part}: "
+            f"{c.baseline_ns / 1e6:10.3f}ms -> {c.candidate_ns / 1e6:10.3f}ms "
+            f"({c.ratio:6.2f}x, p={c.p_value:.3g}) {c.verdict}"
+        )
+    if any(c.verdict == "inconclusive" for c in comparisons):
+        print(
+            f"Some parts have too few samples to be significant at {args.alpha}; "
+            "benchmark with a larger --repeat",
+            file=sys.stderr,
+        )
+    return int(any(c.verdict == "regression" for c in comparisons))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""Import-time report of the solving path, in the style of ``-X importtime``.
+
+Usage:
+    python -m aoc.bench.importtime [MODULE ...]
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Printed to stderr right before the measured imports, to skip interpreter startup
+MARKER = "aoc-importtime-start"
+
+# Modules imported when running a solution by hand, through the runner or
+# with run_day/run_year (which load the scheduler and cache only when called)
+SOLVER_PATH = ("aoc.helpers", "aoc.spans", "aoc.runner", "aoc.display")
+
+# Import budget of the solver path, in microseconds, checked by the tests
+STARTUP_BUDGET_US = 40_000
+
+
+class ImportRecord(NamedTuple):
+    """Cost of importing one module."""
+
+    module: str
+    self_us: int  # Time spent executing the module itself
+    cumulative_us: int  # Including the modules it imported first
+    depth: int  # Nesting level, 0 for modules imported by the measured statement
+
+
+class ImportReport(NamedTuple):
+    """Import costs of a set of modules in a fresh interpreter."""
+
+    modules: tuple[str, ...]
+    records: list[ImportRecord]  # In import completion order, like -X importtime
+
+    @property
+    def total_us(self) -> int:
+        """Total time spent importing the measured modules."""
+        return sum(r.cumulative_us for r in self.records if r.depth == 0)
+
+    @property
+    def third_party(self) -> list[str]:
+        """Top-level packages loaded that are neither stdlib nor aoc."""
+        packages = {r.module.split(".")[0] for r in self.records}
+        allowed = sys.stdlib_module_names | {"aoc"}
+        return sorted(p for p in packages if p not in allowed and not p.startswith("_"))
+
+
+def measure_imports(modules: tuple[str, ...] = SOLVER_PATH) -> ImportReport:
+    """Import modules in a fresh interpreter and collect their import times.
+
+    Args:
+        modules: Dotted names of the modules to import
+
+    Returns:
+        Per-module import costs, excluding interpreter startup
+
+    Raises:
+        subprocess.CalledProcessError: If one of the modules fails to import
+
+    """
+    code = f"import sys; sys.stderr.write('{MARKER}\\n'); import {', '.join(modules)}"
+    process = subprocess.run(  # noqa: S603 - our own interpreter and module names
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    records = []
+    lines = process.stderr.splitlines()
+    for line in lines[lines.index(MARKER) + 1 :]:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        records.append(
+            ImportRecord(
+                module=name.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(name) - len(name.lstrip()) - 1) // 2,
+            )
+        )
+    return ImportReport(modules, records)
+
+
+def format_import_report(report: ImportReport, min_us: int = 0) -> str:
+    """Render an import report as an indented tree.
+
+    Args:
+        report: Report to render
+        min_us: Hide modules whose cumulative time is below this
+
+    Returns:
+        Text with one line per module and a total
+
+    """
+    lines = [f"{'self [us]':>10} | {'cumulative':>10} | imported package"]
+    lines.extend(
+        f"{r.self_us:>10} | {r.cumulative_us:>10} | {'  ' * r.depth}{r.module}"
+        for r in report.records
+        if r.cumulative_us >= min_us
+    )
+    lines.append(
+        f"Total: {report.total_us / 1000:.1f}ms for {', '.join(report.modules)} "
+        f"(budget {STARTUP_BUDGET_US / 1000:.0f}ms for the solver path)"
+    )
+    if report.third_party:
+        lines.append(f"Third-party packages loaded: {', '.join(report.third_party)}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print the import-time report of the given modules.
+
+    Args:
+        argv: Modules to import (defaults to the solver path)
+
+    Returns:
+        Exit code: 1 if the solver path is over budget, 0 otherwise
+
+    """
+    modules = tuple(argv if argv is not None else sys.argv[1:]) or SOLVER_PATH
+    report = measure_imports(modules)
+    print(format_import_report(report, min_us=100))
+    over_budget = modules == SOLVER_PATH and report.total_us > STARTUP_BUDGET_US
+    return int(over_budget)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""Benchmark of puzzle page conversion against the BeautifulSoup original.
+
+``reference_markdown`` is the conversion ``aoc.markdown`` replaced: a full
+BeautifulSoup tree plus markdownify on each article. It needs the
+``beautifulsoup4`` and ``markdownify`` dev dependencies and is kept to check
+that the stdlib extractor produces the same markdown.
+
+Usage:
+    python -m aoc.bench.markdown [YEAR] [--repeat N]
+"""
+
+import argparse
+import re
+import sys
+import time
+
+from aoc.fakeserver import Puzzle
+from aoc.helpers import get_year_dir
+from aoc.markdown import generate_puzzle_markdown
+
+
+def reference_markdown(html: str, day: int) -> str:
+    """Convert a puzzle page the way aoc.markdown used to, with BeautifulSoup.
+
+    Args:
+        html: Raw HTML from fetch_puzzle()
+        day: Day of the puzzle (1-25)
+
+    Returns:
+        Markdown content for puzzle.md
+
+    Raises:
+        ValueError: If HTML structure doesn't match expected format
+
+    """
+    # Dev dependencies, only needed for comparisons
+    from bs4 import BeautifulSoup
+    from markdownify import markdownify as md
+
+    soup = BeautifulSoup(html, "html.parser")
+    title_tag = soup.find("h2")
+    if not title_tag:
+        msg = "Could not find puzzle title (h2 tag)"
+        raise ValueError(msg)
+    match = re.match(r"---\s*Day\s*\d+:\s*(.+?)\s*---", title_tag.get_text())
+    if not match:
+        msg = f"Unexpected title format: {title_tag.get_text()}"
+        raise ValueError(msg)
+    articles = soup.find_all("article", class_="day-desc")
+    if not articles:
+        msg = "Could not find any article tags with class 'day-desc'"
+        raise ValueError(msg)
+
+    parts = [f"# Day {day}: {match.group(1)}\n"]
+    for i, article in enumerate(articles, 1):
+        article_md = md(str(article), heading_style="atx")
+        article_md = re.sub(r"^##\s*---.*?---\s*\n+", "", article_md)
+        part_name = "Part One" if i == 1 else "Part Two"
+        parts.append(f"\n## {part_name}\n\n{article_md.strip()}\n")
+        answer_tag = article.find_next_sibling("p")
+        if answer_tag and (code_tag := answer_tag.find("code")):
+            parts.append(f"\n**Your puzzle answer was `{code_tag.get_text()}`.**\n")
+    return "\n".join(parts)
+
+
+def sample_pages(year: int) -> dict[int, str]:
+    """Render the committed puzzles of a year as the site serves them.
+
+    Args:
+        year: Year of the puzzles
+
+    Returns:
+        Page HTML by day, for every day with a puzzle.md
+
+    """
+    pages = {}
+    for path in sorted(get_year_dir(year).glob("day*/puzzle.md")):
+        day = int(path.parent.name.removeprefix("day"))
+        pages[day] = Puzzle(year, day, path.read_text()).page()
+    return pages
+
+
+def time_conversion(pages: dict[int, str], repeat: int, uncached: bool) -> float:
+    """Time the conversion of every page, best of several rounds.
+
+    Args:
+        pages: Page HTML by day
+        repeat: Number of rounds
+        uncached: Whether to defeat the markdown cache (by varying the HTML)
+
+    Returns:
+        Best round, in seconds
+
+    """
+    best = float("inf")
+    for round_number in range(repeat):
+        # A trailing comment changes the hash without changing the markdown
+        salt = f"<!-- {round_number} -->" if uncached else ""
+        start = time.perf_counter()
+        for day, html in pages.items():
+            generate_puzzle_markdown(html + salt, day)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print conversion times of the extractor, its cache and the reference.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code: 1 if the extractor and the reference disagree, 0 otherwise
+
+    """
+    parser = argparse.ArgumentParser(prog="python -m aoc.bench.markdown")
+    parser.add_argument("year", type=int, nargs="?", default=2016)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    pages = sample_pages(args.year)
+    print(f"{len(pages)} pages from {args.year}, best of {args.repeat}")
+    extractor = time_conversion(pages, args.repeat, uncached=True)
+    print(f"  html.parser extractor: {extractor * 1000:8.2f} ms")
+    cached = time_conversion(pages, args.repeat, uncached=False)
+    print(f"  cached:                {cached * 1000:8.2f} ms")
+
+    try:
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            expected = {
+                day: reference_markdown(html, day) for day, html in pages.items()
+            }
+            best = min(best, time.perf_counter() - start)
+    except ImportError:
+        print("  BeautifulSoup reference: not installed")
+        return 0
+    print(f"  BeautifulSoup reference: {best * 1000:6.2f} ms ({best / extractor:.1f}x)")
+    differing = [
+        d
+        for d, html in pages.items()
+        if generate_puzzle_markdown(html, d) != expected[d]
+    ]
+    if differing:
+        print(f"  Output differs on days {differing}")
+    return int(bool(differing))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
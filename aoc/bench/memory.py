@@ -0,0 +1,135 @@
+"""Peak memory and allocation site tracking with tracemalloc and the RSS peak."""
+
+import resource
+import sys
+import threading
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from aoc.types import MemoryStats
+
+# Sampling period of the peak watcher, in seconds
+POLL_INTERVAL = 0.01
+# Take a new snapshot when traced memory grew by this factor since the last one
+SNAPSHOT_GROWTH = 1.25
+# Linux exposes the RSS high-water mark of the process and a way to reset it
+PROC_STATUS = Path("/proc/self/status")
+CLEAR_REFS = Path("/proc/self/clear_refs")
+# Files whose allocations come from the watcher thread rather than the solver
+WATCHER_FILES = (__file__, tracemalloc.__file__, "*/threading.py", "*weakref*.py")
+
+
+class _PeakSnapshotter(threading.Thread):
+    """Background thread keeping a snapshot taken close to the traced peak.
+
+    tracemalloc only reports the peak size, not what was allocated at that
+    moment, so the watcher polls the traced size and snapshots whenever it
+    grows past the largest snapshot seen so far.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.stop = threading.Event()
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.snapshot_size = 0
+
+    def run(self) -> None:
+        while not self.stop.wait(POLL_INTERVAL):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self.snapshot_size * SNAPSHOT_GROWTH:
+                self.snapshot = tracemalloc.take_snapshot()
+                self.snapshot_size = current
+
+
+def reset_peak_rss() -> bool:
+    """Reset the maximum resident set size of the current process.
+
+    Only Linux allows it. Elsewhere the peak covers the whole life of the
+    process, including whatever ran in it before.
+
+    Returns:
+        True if later max_rss calls only cover what runs from now on
+
+    """
+    try:
+        CLEAR_REFS.write_text("5")
+    except OSError:
+        return False
+    return True
+
+
+def max_rss() -> int:
+    """Get the maximum resident set size of the current process.
+
+    Returns:
+        Peak RSS in bytes since the process started or the last
+        reset_peak_rss
+
+    """
+    try:
+        status = PROC_STATUS.read_text()
+    except OSError:
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS reports bytes
+        return rss if sys.platform == "darwin" else rss * 1024
+    # getrusage keeps the peak from before a reset, VmHWM does not
+    line = next(line for line in status.splitlines() if line.startswith("VmHWM:"))
+    return int(line.split()[1]) * 1024
+
+
+def measure_memory(
+    func: Callable[[str], Any], arg: str, top: int = 5
+) -> tuple[Any, MemoryStats]:
+    """Call a solver while tracing its memory allocations.
+
+    Tracing slows Python allocations down noticeably, so timings taken at the
+    same time are inflated.
+
+    Args:
+        func: Solver to measure
+        arg: Argument passed to the solver
+        top: Number of allocation sites to report
+
+    Returns:
+        Tuple of (answer, memory statistics)
+
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    watcher = _PeakSnapshotter()
+    watcher.snapshot_size = baseline
+    watcher.start()
+    # Parts solved earlier in this process would otherwise set the peak
+    rss_reset = reset_peak_rss()
+
+    try:
+        answer = func(arg)
+        _, peak = tracemalloc.get_traced_memory()
+        final = tracemalloc.take_snapshot()
+    finally:
+        watcher.stop.set()
+        watcher.join()
+        if not already_tracing:
+            tracemalloc.stop()
+
+    # Fall back to the final state for solvers too quick to be sampled
+    snapshot = watcher.snapshot or final
+    # Hide the watcher thread's own allocations
+    snapshot = snapshot.filter_traces(
+        [tracemalloc.Filter(False, pattern) for pattern in WATCHER_FILES]
+    )
+    sites = [
+        (f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", stat.size)
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+    stats = MemoryStats(
+        peak_traced=peak - baseline,
+        max_rss=max_rss() if rss_reset else None,
+        top_allocations=sites,
+    )
+    return answer, stats
@@ -0,0 +1,124 @@
+"""Deterministic profiling of puzzle parts with cProfile."""
+
+import cProfile
+import pstats
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from aoc.helpers import get_cache_dir
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+class ProfileEntry(NamedTuple):
+    """Aggregated statistics of one profiled function."""
+
+    function: str  # e.g. "aoc/puzzles/year2016/day11/part1.py:97(is_valid_state)"
+    ncalls: int
+    tottime: float  # Seconds spent in the function itself
+    cumtime: float  # Seconds spent in the function and its callees
+
+
+def profile_path(year: int, day: int, part: int) -> Path:
+    """Get the .pstats file of a puzzle part, creating its directory.
+
+    Args:
+        year: Year of the puzzle
+        day: Day of the puzzle (1-25)
+        part: Part number (1 or 2)
+
+    Returns:
+        Path to the part's .pstats file in the cache dir
+
+    """
+    directory = get_cache_dir() / "profiles" / f"year{year}"
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / f"day{day:02d}_part{part}.pstats"
+
+
+def profile_call(func: Callable[[str], Any], arg: str, path: Path) -> Any:
+    """Call a solver under cProfile and save the statistics.
+
+    Args:
+        func: Solver to profile
+        arg: Argument passed to the solver
+        path: .pstats file to write
+
+    Returns:
+        The solver's answer
+
+    """
+    profiler = cProfile.Profile()
+    answer = profiler.runcall(func, arg)
+    profiler.dump_stats(path)
+    return answer
+
+
+def _describe(file: str, line: int, name: str) -> str:
+    """Format a pstats function key readably.
+
+    Args:
+        file: Source file ("~" for built-ins)
+        line: First line of the function
+        name: Function name
+
+    Returns:
+        "path:line(name)" with paths relative to the project when possible
+
+    """
+    if file == "~":
+        return name  # Built-ins, e.g. "<built-in method _hashlib.openssl_md5>"
+    path = Path(file)
+    if path.is_relative_to(PROJECT_ROOT):
+        path = path.relative_to(PROJECT_ROOT)
+    return f"{path}:{line}({name})"
+
+
+def top_functions(
+    path: Path, limit: int = 10, sort: str = "cumulative"
+) -> list[ProfileEntry]:
+    """Rank the functions of a saved profile.
+
+    Args:
+        path: .pstats file to read
+        limit: Number of functions to return
+        sort: "cumulative" (time including callees) or "own" (time in the
+            function body only)
+
+    Returns:
+        The top functions, most expensive first
+
+    """
+    raw = pstats.Stats(str(path)).stats  # type: ignore[attr-defined]
+    entries = [
+        ProfileEntry(_describe(*key), ncalls, tottime, cumtime)
+        for key, (_, ncalls, tottime, cumtime, _) in raw.items()
+    ]
+    index = 3 if sort == "cumulative" else 2
+    entries.sort(key=lambda entry: entry[index], reverse=True)
+    return entries[:limit]
+
+
+def format_profile(path: Path, limit: int = 10) -> str:
+    """Render the top functions by cumulative and own time as tables.
+
+    Args:
+        path: .pstats file to read
+        limit: Number of functions per table
+
+    Returns:
+        Markdown tables ready to print
+
+    """
+    lines: list[str] = []
+    for sort, title in (("cumulative", "cumulative time"), ("own", "own time")):
+        lines.append(f"Top {limit} by {title}:")
+        lines.append("|   ncalls |  own (s) |  cum (s) | function")
+        lines.append("| -------- | -------- | -------- | --------")
+        lines.extend(
+            f"| {e.ncalls:8d} | {e.tottime:8.3f} | {e.cumtime:8.3f} | {e.function}"
+            for e in top_functions(path, limit, sort)
+        )
+        lines.append("")
+    return "\n".join(lines)
@@ -0,0 +1,105 @@
+"""Microbenchmark of submission response classification.
+
+Each sample is a message the site answers submissions with, wrapped in a page
+shell of about the size of the real one.
+
+Usage:
+    python -m aoc.bench.responses [--number N]
+"""
+
+import argparse
+import sys
+import timeit
+
+from aoc.submit import SubmissionResult, parse_response
+
+_SHELL = (
+    '<!DOCTYPE html>\n<html lang="en-us">\n<head>\n<meta charset="utf-8"/>\n'
+    "<title>Day 1 - Advent of Code 2016</title>\n"
+    + '<link rel="stylesheet" type="text/css" href="/static/style.css"/>\n' * 8
+    + "</head><!--\n"
+    + "Oh, hello!  Funny seeing you here.\n" * 20
+    + "-->\n"
+    '<body>\n<header><div><h1 class="title-global"><a href="/">Advent of'
+    " Code</a></h1><nav><ul>"
+    + "".join(
+        f'<li><a href="/2016/{page}">[{page}]</a></li>'
+        for page in ("about", "events", "shop", "settings", "log out", "leaderboard")
+    )
+    + '</ul></nav></div></header>\n<div id="sidebar">'
+    + "<p>Our sponsors help make Advent of Code possible.</p>" * 10
+    + "</div>\n<main>\n<article><p>{message}</p></article>\n</main>\n"
+    "<script>window.addEventListener('click', function() {{}});</script>\n"
+    "</body>\n</html>\n"
+)
+
+SAMPLES = {
+    "correct": 'That\'s the right answer!  You are <span class="day-success">one'
+    " gold star</span> closer to saving Christmas.",
+    "wrong, too high": "That's not the right answer; your answer is too high.  If"
+    " you're stuck, make sure you're using the full input data.  Please wait one"
+    " minute before trying again.",
+    "wrong, lockout": "That's not the right answer; your answer is too low.  Because"
+    " you have guessed incorrectly 4 times on this puzzle, please wait 5 minutes"
+    " before trying again.",
+    "too soon": "You gave an answer too recently; you have to wait after"
+    " submitting an answer before trying again.  You have 1m 5s left to wait.",
+    "already solved": "You don't seem to be solving the right level.  Did you"
+    " already complete it?",
+}
+
+
+def sample_pages() -> dict[str, str]:
+    """Build full response pages of every sample message.
+
+    Returns:
+        Page HTML by sample name
+
+    """
+    return {
+        name: _SHELL.replace("{message}", message).replace("{{}}", "{}")
+        for name, message in SAMPLES.items()
+    }
+
+
+def time_classification(html: str, number: int) -> tuple[float, SubmissionResult]:
+    """Time parse_response on one page.
+
+    Args:
+        html: Response page
+        number: Calls per measurement (best of five measurements is kept)
+
+    Returns:
+        Tuple of (microseconds per call, result)
+
+    """
+    best = min(timeit.repeat(lambda: parse_response(html), number=number, repeat=5))
+    return best / number * 1e6, parse_response(html)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print the classification time and result of each sample.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code
+
+    """
+    parser = argparse.ArgumentParser(prog="python -m aoc.bench.responses")
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    for name, html in sample_pages().items():
+        micros, result = time_classification(html, args.number)
+        hint = f", {result.hint}" if result.hint else ""
+        print(
+            f"{name:16} {len(html):6d} B {micros:7.2f} us  "
+            f"{result.verdict}{hint}, wait {result.wait:.0f}s"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
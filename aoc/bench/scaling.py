@@ -0,0 +1,233 @@
+"""Empirical complexity of solvers on growing synthetic inputs.
+
+Each part runs on generated inputs of geometrically growing scale (see
+``aoc.bench.generators``). Time and peak traced memory are fitted against the
+scale as a power law, ``cost ~ scale ** k``, by least squares in log-log space.
+The generators grow their inputs linearly with the scale, so ``k`` is the
+empirical exponent of the input size: about 1 for a linear solver, 2 for a
+quadratic one. Parts whose exponent exceeds 1 by more than a tolerance are
+flagged as super-linear.
+
+Usage:
+    python -m aoc.bench.scaling 2016
+    python -m aoc.bench.scaling 2016 -d 10 -p 1 --steps 5 --factor 2
+"""
+
+import argparse
+import math
+import statistics
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from aoc.bench.generators import generate, load_generators
+from aoc.bench.memory import measure_memory
+from aoc.bench.timing import BenchmarkConfig, benchmark
+from aoc.runner import load_part
+
+# Repeat quick runs for a stable minimum, but run slow ones only once
+TIMING = BenchmarkConfig(warmup=0, repeat=1, min_time=0.2, max_repeat=50)
+# Peaks below this are interpreter noise (frames, small caches), not the solver
+MEMORY_FLOOR = 64 * 1024
+# Exponents above 1 + this are flagged (n log n fits at about 1.1 to 1.2)
+DEFAULT_TOLERANCE = 0.3
+
+
+class ScalingPoint(NamedTuple):
+    """Cost of a part on one generated input."""
+
+    scale: int  # Generator scale
+    input_size: int  # Length of the input, in characters
+    time_ns: float  # Fastest wall time, the least disturbed by noise
+    peak_bytes: int  # Peak memory traced during one run
+
+
+@dataclass
+class ScalingReport:
+    """Empirical complexity of one part.
+
+    Attributes:
+        year: Year of the puzzle
+        day: Day of the puzzle
+        part: Part number
+        points: Measurements, by increasing scale
+        time_exponent: Fitted exponent of the wall time
+        memory_exponent: Fitted exponent of the peak traced memory
+
+    """
+
+    year: int
+    day: int
+    part: int
+    points: list[ScalingPoint]
+    time_exponent: float
+    memory_exponent: float
+
+    def super_linear(self, tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+        """List the resources growing faster than the input.
+
+        Args:
+            tolerance: Allowed excess of an exponent over 1
+
+        Returns:
+            "time" and/or "memory"
+
+        """
+        exponents = {"time": self.time_exponent, "memory": self.memory_exponent}
+        return [name for name, k in exponents.items() if k > 1 + tolerance]
+
+
+def fit_exponent(
+    sizes: Sequence[float], costs: Sequence[float], floor: float = 1.0
+) -> float:
+    """Fit ``cost ~ size ** k`` by least squares on the logarithms.
+
+    Args:
+        sizes: Input sizes (positive)
+        costs: Costs measured at each size
+        floor: Costs are raised to at least this before fitting, so that
+            negligible measurements fit as constant rather than as noise
+
+    Returns:
+        The exponent k
+
+    Raises:
+        ValueError: If there are fewer than two distinct sizes
+
+    """
+    if len(set(sizes)) < 2:
+        msg = "Need at least two distinct sizes to fit an exponent"
+        raise ValueError(msg)
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(cost, floor)) for cost in costs]
+    return statistics.linear_regression(xs, ys).slope
+
+
+def scaling_days(year: int) -> list[int]:
+    """List the days of a year with a scaling run.
+
+    Args:
+        year: Puzzle year
+
+    Returns:
+        Sorted day numbers (empty if the year has no generators)
+
+    """
+    try:
+        return sorted(getattr(load_generators(year), "SCALING_BASES", {}))
+    except ValueError:
+        return []
+
+
+def measure_scaling(
+    year: int,
+    day: int,
+    part: int,
+    steps: int = 4,
+    factor: int = 2,
+    seed: int = 0,
+) -> ScalingReport:
+    """Run a part on growing inputs and fit its time and memory exponents.
+
+    The scales are the day's base scale times ``factor ** i`` for i in
+    ``range(steps)``. Timing and memory are measured in separate runs, as
+    tracing allocations slows the solver down.
+
+    Args:
+        year: Puzzle year
+        day: Puzzle day
+        part: Part number
+        steps: Number of input sizes
+        factor: Growth of the scale between sizes
+        seed: Seed of the generators
+
+    Returns:
+        The measurements and fitted exponents
+
+    Raises:
+        ValueError: If the day has no scaling run or the steps cannot be fitted
+
+    """
+    if steps < 2 or factor < 2:
+        msg = f"Need at least 2 steps growing by at least 2, got {steps}x{factor}"
+        raise ValueError(msg)
+    base = getattr(load_generators(year), "SCALING_BASES", {}).get(day)
+    if base is None:
+        msg = f"{year} day {day} has no scaling run"
+        raise ValueError(msg)
+    solve = load_part(year, day, part).solve
+
+    points = []
+    for step in range(steps):
+        scale = base * factor**step
+        text = generate(year, day, scale, seed).text
+        _, timing = benchmark(solve, text, TIMING)
+        _, memory = measure_memory(solve, text, top=0)
+        points.append(
+            ScalingPoint(scale, len(text), timing.wall.min_ns, memory.peak_traced)
+        )
+
+    scales = [point.scale for point in points]
+    return ScalingReport(
+        year,
+        day,
+        part,
+        points,
+        time_exponent=fit_exponent(scales, [point.time_ns for point in points]),
+        memory_exponent=fit_exponent(
+            scales, [point.peak_bytes for point in points], floor=MEMORY_FLOOR
+        ),
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Measure and report the empirical exponents of a year's parts.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code: 1 if a part is super-linear, 0 otherwise
+
+    """
+    parser = argparse.ArgumentParser(prog="python -m aoc.bench.scaling")
+    parser.add_argument("year", type=int)
+    parser.add_argument("-d", "--day", type=int, help="only this day")
+    parser.add_argument("-p", "--part", type=int, choices=[1, 2], help="only this part")
+    parser.add_argument("--steps", type=int, default=4, help="number of input sizes")
+    parser.add_argument("--factor", type=int, default=2, help="growth between sizes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    days = [args.day] if args.day else scaling_days(args.year)
+    parts = [args.part] if args.part else [1, 2]
+    flagged = False
+
+    for day in days:
+        for part in parts:
+            try:
+                report = measure_scaling(
+                    args.year, day, part, args.steps, args.factor, args.seed
+                )
+            except ValueError as e:
+                parser.error(str(e))
+            first, last = report.points[0], report.points[-1]
+            worse = report.super_linear(args.tolerance)
+            flagged = flagged or bool(worse)
+            print(
+                f"{'✗' if worse else ' '} {args.year} day {day:2d} part {part}: "
+                f"time n^{report.time_exponent:.2f}, "
+                f"memory n^{report.memory_exponent:.2f} "
+                f"(scale {first.scale}-{last.scale}, "
+                f"{first.time_ns / 1e6:.3f}ms -> {last.time_ns / 1e6:.3f}ms, "
+                f"{first.peak_bytes / 1024:.0f} -> {last.peak_bytes / 1024:.0f} KiB)"
+                + (f" super-linear {' and '.join(worse)}" if worse else ""),
+                flush=True,
+            )
+    return int(flagged)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Repeated, statistically summarized timing of solver calls."""
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from aoc.types import BenchmarkStats, TimingStats
+
+
+@dataclass(frozen=True)
+class BenchmarkConfig:
+    """How to benchmark a solver.
+
+    Measurement repeats until at least ``repeat`` samples were taken and at
+    least ``min_time`` seconds were spent measuring, capped at ``max_repeat``
+    samples.
+
+    Attributes:
+        warmup: Untimed calls made before measuring
+        repeat: Minimum number of timed calls
+        min_time: Minimum total measuring time in seconds
+        max_repeat: Maximum number of timed calls
+
+    """
+
+    warmup: int = 1
+    repeat: int = 5
+    min_time: float = 0.0
+    max_repeat: int = 1000
+
+    def __post_init__(self) -> None:
+        """Validate the settings.
+
+        Raises:
+            ValueError: If no sample could be taken
+
+        """
+        if self.repeat < 1 or self.max_repeat < self.repeat:
+            msg = f"Need 1 <= repeat <= max_repeat, got {self.repeat}/{self.max_repeat}"
+            raise ValueError(msg)
+
+
+def benchmark(
+    func: Callable[[str], Any], arg: str, config: BenchmarkConfig
+) -> tuple[Any, BenchmarkStats]:
+    """Call a solver repeatedly and collect wall and CPU time distributions.
+
+    Args:
+        func: Solver to benchmark (typically a part module's solve)
+        arg: Argument passed to every call
+        config: Warm-up, repeat and minimum time settings
+
+    Returns:
+        Tuple of (answer from the last call, timing distributions)
+
+    """
+    for _ in range(config.warmup):
+        func(arg)
+
+    wall: list[int] = []
+    cpu: list[int] = []
+    min_time_ns = int(config.min_time * 1e9)
+    answer: Any = None
+    start = time.perf_counter_ns()
+
+    while len(wall) < config.max_repeat and (
+        len(wall) < config.repeat or time.perf_counter_ns() - start < min_time_ns
+    ):
+        cpu_start = time.process_time_ns()
+        wall_start = time.perf_counter_ns()
+        answer = func(arg)
+        wall_end = time.perf_counter_ns()
+        cpu_end = time.process_time_ns()
+        wall.append(wall_end - wall_start)
+        cpu.append(cpu_end - cpu_start)
+
+    stats = BenchmarkStats(
+        wall=TimingStats.from_samples(wall), cpu=TimingStats.from_samples(cpu)
+    )
+    return answer, stats
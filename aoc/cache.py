@@ -0,0 +1,193 @@
+"""Content-addressed on-disk cache of puzzle part results.
+
+A result is keyed by a hash of the part module's source, the source of every
+``aoc.puzzles`` module it imports (transitively), and the input bytes. Editing
+a solver, a module it imports or the input therefore invalidates exactly the
+affected entries, and a year sweep only recomputes what changed.
+"""
+
+import ast
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from aoc.helpers import get_cache_dir, get_puzzle_dir
+from aoc.types import PartResult, PartStatus
+
+PUZZLES_ROOT = Path(__file__).parent / "puzzles"
+PUZZLES_PACKAGE = "aoc.puzzles"
+
+
+def _module_path(name: str) -> Path | None:
+    """Find the source file of an ``aoc.puzzles`` module without importing it.
+
+    Args:
+        name: Dotted module name (e.g. "aoc.puzzles.year2016.day04.part1")
+
+    Returns:
+        Path to the module or package source, or None if it is not a module
+        (e.g. a class imported with ``from module import Class``)
+
+    """
+    base = PUZZLES_ROOT.joinpath(*name.removeprefix(PUZZLES_PACKAGE + ".").split("."))
+    module = base.with_suffix(".py")
+    if module.is_file():
+        return module
+    package = base / "__init__.py"
+    if package.is_file():
+        return package
+    return None
+
+
+def _puzzle_imports(source: bytes) -> set[str]:
+    """List the ``aoc.puzzles`` modules a source file may import.
+
+    Args:
+        source: Python source code
+
+    Returns:
+        Dotted names of imported modules, plus ``module.name`` candidates for
+        ``from module import name`` statements
+
+    """
+    names: set[str] = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module)
+            names.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return {name for name in names if name.startswith(PUZZLES_PACKAGE + ".")}
+
+
+def source_closure(year: int, day: int, part: int) -> dict[str, Path]:
+    """Find a part module and every ``aoc.puzzles`` module it depends on.
+
+    Args:
+        year: Year of the puzzle
+        day: Day of the puzzle (1-25)
+        part: Part number (1 or 2)
+
+    Returns:
+        Mapping from module name to source path
+
+    """
+    root = f"{PUZZLES_PACKAGE}.year{year}.day{day:02d}.part{part}"
+    closure: dict[str, Path] = {}
+    pending = [root]
+
+    while pending:
+        name = pending.pop()
+        if name in closure:
+            continue
+        path = _module_path(name)
+        if path is None:
+            continue
+        closure[name] = path
+        pending.extend(_puzzle_imports(path.read_bytes()))
+
+    return closure
+
+
+def part_key(year: int, day: int, part: int) -> str:
+    """Compute the cache key of a part from its sources and input.
+
+    Args:
+        year: Year of the puzzle
+        day: Day of the puzzle (1-25)
+        part: Part number (1 or 2)
+
+    Returns:
+        Hex digest identifying the part's code and input
+
+    """
+    digest = hashlib.sha256(f"{year}/{day}/{part}\0".encode())
+    for name, path in sorted(source_closure(year, day, part).items()):
+        digest.update(f"{name}\0".encode())
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    digest.update((get_puzzle_dir(year, day) / "input.txt").read_bytes())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Stores part answers and timings as small JSON files, one per key.
+
+    Least recently used entries are evicted once the total size of the cache
+    exceeds ``max_bytes``.
+    """
+
+    def __init__(self, path: Path | None = None, max_bytes: int = 1024**2) -> None:
+        """Open (and create if needed) the cache directory.
+
+        Args:
+            path: Directory to use (defaults to results/ in the cache dir)
+            max_bytes: Size above which old entries are evicted
+
+        """
+        self.path = path or get_cache_dir() / "results"
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def _entry(self, key: str) -> Path:
+        return self.path / f"{key}.json"
+
+    def get(self, key: str, year: int, day: int, part: int) -> PartResult | None:
+        """Look up a stored result.
+
+        Args:
+            key: Key from part_key()
+            year: Year of the puzzle
+            day: Day of the puzzle (1-25)
+            part: Part number (1 or 2)
+
+        Returns:
+            The cached result, or None on a miss
+
+        """
+        entry = self._entry(key)
+        try:
+            data = json.loads(entry.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        os.utime(entry)  # Mark as recently used for eviction
+        return PartResult(
+            year=year,
+            day=day,
+            part=part,
+            answer=data["answer"],
+            time=data["time"],
+            cached=True,
+        )
+
+    def put(self, key: str, result: PartResult) -> None:
+        """Store a successful result and evict old entries if needed.
+
+        Args:
+            key: Key from part_key(), computed before the part ran
+            result: Result to store (ignored unless its status is OK)
+
+        """
+        if result.status is not PartStatus.OK:
+            return
+        entry = self._entry(key)
+        tmp = entry.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"answer": result.answer, "time": result.time}))
+        tmp.replace(entry)
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until under the size limit."""
+        entries = sorted(self.path.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        total = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            total -= entry.stat().st_size
+            entry.unlink()
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        for entry in self.path.glob("*.json"):
+            entry.unlink()
@@ -0,0 +1,647 @@
+"""Command-line entry point printing machine-readable results.
+
+Every selected part becomes one record, written as JSON Lines (one object per
+line, with raw timing samples and allocation sites) or CSV (scalar columns
+only), ready for dashboards to ingest.
+
+Usage:
+    aoc run 2016 --days 1-5 --format csv
+    aoc bench 2016 --days 11 --part 2 --repeat 20
+    aoc profile 2016 --days 14
+    aoc variants 2016 --days 16,18 --set-default
+    aoc sync 2015-2016
+    aoc submit 2016 1 1 161
+    aoc unlock 2024 1
+    aoc importtime
+"""
+
+import argparse
+import csv
+import json
+import sys
+from dataclasses import asdict, replace
+from datetime import UTC, datetime
+from typing import Any, TextIO
+
+from aoc.bench.timing import BenchmarkConfig
+from aoc.cache import ResultCache
+from aoc.runner import BUDGET_TOLERANCE, RunOptions, load_part
+from aoc.scheduler import (
+    DEFAULT_LIMITS,
+    NO_LIMITS,
+    Job,
+    ResourceLimits,
+    find_days,
+    run_jobs,
+)
+from aoc.types import PartResult, PartStatus, TimingStats
+from aoc.variants import VariantDefaults, implementations
+
+# Scalar columns, in CSV order; JSON Lines records may carry more
+CSV_FIELDS = [
+    "year",
+    "day",
+    "part",
+    "variant",
+    "status",
+    "answer",
+    "error",
+    "time_s",
+    "parse_time_s",
+    "cached",
+    "over_budget",
+    *(
+        f"{kind}_{stat}_ns"
+        for kind in ("wall", "cpu")
+        for stat in ("min", "median", "mean", "stdev", "iqr")
+    ),
+    "samples",
+    "peak_traced_bytes",
+    "max_rss_bytes",
+    "profile",
+]
+
+
+def _parse_ranges(text: str, low: int, high: int, noun: str) -> list[int]:
+    """Parse a selector of numbers and inclusive ranges such as "1,3,10-12".
+
+    Args:
+        text: Comma-separated numbers and inclusive ranges
+        low: Smallest number allowed
+        high: Largest number allowed
+        noun: What the numbers are, for error messages ("day", "year")
+
+    Returns:
+        Sorted, de-duplicated numbers
+
+    Raises:
+        argparse.ArgumentTypeError: If the selector is malformed or out of range
+
+    """
+    numbers: set[int] = set()
+    for item in text.split(","):
+        start, _, end = item.partition("-")
+        try:
+            first, last = int(start), int(end or start)
+        except ValueError as e:
+            msg = f"Invalid {noun} selector {text!r}"
+            raise argparse.ArgumentTypeError(msg) from e
+        # Checked before expanding, so a typo cannot queue a huge range
+        if first > last or first < low or last > high:
+            msg = f"{noun.capitalize()}s must be between {low} and {high}, got {text!r}"
+            raise argparse.ArgumentTypeError(msg)
+        numbers.update(range(first, last + 1))
+    return sorted(numbers)
+
+
+def parse_days(text: str) -> list[int]:
+    """Parse a day selector such as "1,3,10-12".
+
+    Args:
+        text: Comma-separated days and inclusive ranges
+
+    Returns:
+        Sorted, de-duplicated days
+
+    Raises:
+        argparse.ArgumentTypeError: If the selector is malformed or out of range
+
+    """
+    return _parse_ranges(text, 1, 25, "day")
+
+
+def parse_years(text: str) -> list[int]:
+    """Parse a year selector such as "2015,2017-2019".
+
+    Args:
+        text: Comma-separated years and inclusive ranges
+
+    Returns:
+        Sorted, de-duplicated years, from the first Advent of Code (2015) to
+        the current year
+
+    Raises:
+        argparse.ArgumentTypeError: If the selector is malformed or out of range
+
+    """
+    return _parse_ranges(text, 2015, datetime.now(UTC).year, "year")
+
+
+def select_jobs(year: int, days: list[int] | None, parts: list[int]) -> list[Job]:
+    """Build the jobs of the selected days and parts.
+
+    Args:
+        year: Year of the puzzles
+        days: Days to run (None for every day with a solution)
+        parts: Parts to run
+
+    Returns:
+        Jobs in day and part order
+
+    Raises:
+        ValueError: If a selected day has no solution
+
+    """
+    available = find_days(year)
+    missing = sorted(set(days or ()) - set(available))
+    if missing:
+        msg = f"No solutions for {year} day(s) {', '.join(map(str, missing))}"
+        raise ValueError(msg)
+    return [Job(year, day, part) for day in days or available for part in parts]
+
+
+def _timing_fields(kind: str, stats: TimingStats) -> dict[str, float]:
+    """Flatten a timing distribution into record fields.
+
+    Args:
+        kind: "wall" or "cpu"
+        stats: Distribution to flatten
+
+    Returns:
+        Fields named like "wall_median_ns"
+
+    """
+    return {
+        f"{kind}_min_ns": stats.min_ns,
+        f"{kind}_median_ns": stats.median_ns,
+        f"{kind}_mean_ns": stats.mean_ns,
+        f"{kind}_stdev_ns": stats.stdev_ns,
+        f"{kind}_iqr_ns": stats.iqr_ns,
+    }
+
+
+def part_record(result: PartResult, top: int = 10) -> dict[str, Any]:
+    """Turn a part result into a flat, JSON-serializable record.
+
+    Args:
+        result: Result to convert
+        top: Number of profiled functions to include
+
+    Returns:
+        Record with the CSV_FIELDS that apply, plus raw samples, allocation
+        sites, span trees and profiled functions when available
+
+    """
+    record: dict[str, Any] = {
+        "year": result.year,
+        "day": result.day,
+        "part": result.part,
+        "variant": result.variant,
+        "status": result.status.value,
+        "answer": result.answer,
+        "error": result.error,
+        "time_s": result.time,
+        "parse_time_s": result.parse_time,
+        "cached": result.cached,
+        "over_budget": "; ".join(result.over_budget) or None,
+    }
+    if result.stats is not None:
+        record |= _timing_fields("wall", result.stats.wall)
+        record |= _timing_fields("cpu", result.stats.cpu)
+        record["samples"] = len(result.stats.wall.samples)
+        record["wall_samples_ns"] = result.stats.wall.samples
+        record["cpu_samples_ns"] = result.stats.cpu.samples
+    if result.memory is not None:
+        record["peak_traced_bytes"] = result.memory.peak_traced
+        record["max_rss_bytes"] = result.memory.max_rss
+        record["top_allocations"] = [
+            {"site": site, "bytes": size}
+            for site, size in result.memory.top_allocations
+        ]
+    if result.spans is not None:
+        record["spans"] = asdict(result.spans)
+    if result.profile is not None:
+        # Reading profiles needs pstats, which plain runs never load
+        from aoc.bench.profile import top_functions
+
+        record["profile"] = str(result.profile)
+        record["top_functions"] = [
+            entry._asdict() for entry in top_functions(result.profile, top)
+        ]
+    return record
+
+
+def write_records(records: list[dict[str, Any]], fmt: str, out: TextIO) -> None:
+    """Write records as JSON Lines or CSV.
+
+    Args:
+        records: Records from part_record
+        fmt: "jsonl" or "csv"
+        out: Stream to write to
+
+    """
+    if fmt == "jsonl":
+        out.writelines(json.dumps(record) + "\n" for record in records)
+        return
+
+    writer = csv.DictWriter(out, CSV_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(records)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Create the argument parser with all of its commands.
+
+    Returns:
+        Configured parser
+
+    """
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("year", type=int, help="puzzle year, e.g. 2016")
+    common.add_argument(
+        "-d", "--days", type=parse_days, help="days to run, e.g. 1,3,10-12 (all)"
+    )
+    common.add_argument(
+        "-p", "--part", type=int, choices=(1, 2), action="append", help="(both)"
+    )
+    common.add_argument("-f", "--format", choices=("jsonl", "csv"), default="jsonl")
+    common.add_argument(
+        "-j", "--workers", type=int, help="worker processes (one per CPU)"
+    )
+    common.add_argument(
+        "--timeout", type=float, default=DEFAULT_LIMITS.timeout, help="seconds per part"
+    )
+    common.add_argument(
+        "--variant", help="implementation to run (this machine's default)"
+    )
+    common.add_argument(
+        "--budget-tolerance",
+        type=float,
+        default=BUDGET_TOLERANCE,
+        help=f"factor over a part's budget still counted as noise ({BUDGET_TOLERANCE})",
+    )
+    common.add_argument(
+        "--no-limits",
+        action="store_true",
+        help="run without time and memory limits (in-process with -j 1)",
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="aoc", description="Run Advent of Code solutions."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", parents=[common], help="solve and time once")
+    run.add_argument("--no-cache", action="store_true", help="ignore cached results")
+    run.add_argument(
+        "--memory", action="store_true", help="track peak memory and allocations"
+    )
+    run.add_argument(
+        "--spans", action="store_true", help="record the phases solvers mark"
+    )
+
+    bench = commands.add_parser(
+        "bench", parents=[common], help="repeat parts and report distributions"
+    )
+    defaults = BenchmarkConfig()
+    bench.add_argument("--warmup", type=int, default=defaults.warmup)
+    bench.add_argument("--repeat", type=int, default=defaults.repeat)
+    bench.add_argument("--min-time", type=float, default=defaults.min_time)
+    bench.add_argument("--max-repeat", type=int, default=defaults.max_repeat)
+    bench.add_argument("--note", default="", help="description stored with the run")
+    bench.add_argument(
+        "--no-record", action="store_true", help="skip the benchmark history"
+    )
+    bench.set_defaults(workers=1)
+
+    variants = commands.add_parser(
+        "variants",
+        parents=[common],
+        help="check that the implementations of parts agree and race them",
+    )
+    variants.add_argument("--warmup", type=int, default=defaults.warmup)
+    variants.add_argument("--repeat", type=int, default=defaults.repeat)
+    variants.add_argument("--min-time", type=float, default=defaults.min_time)
+    variants.add_argument("--max-repeat", type=int, default=defaults.max_repeat)
+    variants.add_argument(
+        "--set-default",
+        action="store_true",
+        help="make the fastest implementation this machine's default",
+    )
+    variants.set_defaults(workers=1)
+
+    profile = commands.add_parser(
+        "profile", parents=[common], help="run under cProfile"
+    )
+    profile.add_argument("--top", type=int, default=10, help="functions per part (10)")
+
+    sync = commands.add_parser("sync", help="download missing puzzles and inputs")
+    sync.add_argument("years", type=parse_years, help="years, e.g. 2015-2017")
+    sync.add_argument("-d", "--days", type=parse_days, help="days, e.g. 1-5 (all)")
+    sync.add_argument("-j", "--workers", type=int, default=4, help="downloads (4)")
+    sync.add_argument("--no-inputs", action="store_true", help="skip input.txt")
+    sync.add_argument("--no-puzzles", action="store_true", help="skip puzzle.md")
+
+    submit = commands.add_parser(
+        "submit", help="submit an answer, checked against the local ledger"
+    )
+    for name in ("year", "day", "part"):
+        submit.add_argument(name, type=int)
+    submit.add_argument("answer")
+
+    unlock = commands.add_parser(
+        "unlock", help="wait for a puzzle to unlock and fetch it at once"
+    )
+    unlock.add_argument("year", type=int)
+    unlock.add_argument("day", type=int)
+
+    importtime = commands.add_parser(
+        "importtime", help="report the import time of the solving path"
+    )
+    importtime.add_argument(
+        "modules", nargs="*", help="modules to import (the solver path)"
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the selected parts and print one record per part, or sync.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code: 1 if any part did not finish with an answer, 3 if all did
+        but some exceeded their budget, 0 otherwise
+
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    handlers = {
+        "sync": _sync,
+        "submit": _submit,
+        "unlock": _unlock,
+        "importtime": _importtime,
+    }
+    if args.command in handlers:
+        return handlers[args.command](args)
+
+    try:
+        jobs = select_jobs(args.year, args.days, sorted(set(args.part or (1, 2))))
+    except ValueError as e:
+        parser.error(str(e))
+
+    bench = None
+    if args.command in ("bench", "variants"):
+        try:
+            bench = BenchmarkConfig(
+                warmup=args.warmup,
+                repeat=args.repeat,
+                min_time=args.min_time,
+                max_repeat=args.max_repeat,
+            )
+        except ValueError as e:
+            parser.error(str(e))
+    options = RunOptions(
+        bench=bench,
+        profile=args.command == "profile",
+        memory=getattr(args, "memory", False),
+        spans=getattr(args, "spans", False),
+        budget_tolerance=args.budget_tolerance,
+        variant=args.variant,
+    )
+    limits = (
+        NO_LIMITS
+        if args.no_limits
+        else ResourceLimits(timeout=args.timeout, memory=DEFAULT_LIMITS.memory)
+    )
+    if args.command == "variants":
+        return _race_variants(args, jobs, options, limits)
+
+    use_cache = args.command == "run" and not args.no_cache
+    outcomes = run_jobs(
+        jobs,
+        workers=args.workers,
+        options=options,
+        limits=limits,
+        cache=ResultCache() if use_cache else None,
+    )
+    results = [outcomes[job] for job in jobs]
+
+    write_records(
+        [part_record(result, getattr(args, "top", 10)) for result in results],
+        args.format,
+        sys.stdout,
+    )
+
+    if bench is not None and not args.no_record:
+        # Only benchmark runs need sqlite and git, so keep them off the import path
+        from aoc.bench.history import BenchmarkHistory
+
+        history = BenchmarkHistory()
+        try:
+            run_id = history.record_parts(results, args.note)
+        finally:
+            history.close()
+        print(f"Recorded benchmark run {run_id}", file=sys.stderr)
+
+    over_budget = _report_overruns(results)
+    if any(result.status is not PartStatus.OK for result in results):
+        return 1
+    return 3 if over_budget else 0
+
+
+def _report_overruns(results: list[PartResult]) -> bool:
+    """Print the budgets parts exceeded on stderr, apart from the records.
+
+    Args:
+        results: Results of the run
+
+    Returns:
+        Whether any part was over budget
+
+    """
+    over_budget = [result for result in results if result.over_budget]
+    for result in over_budget:
+        for overrun in result.over_budget:
+            print(
+                f"Over budget: {result.year} day {result.day} part {result.part}: "
+                f"{overrun}",
+                file=sys.stderr,
+            )
+    return bool(over_budget)
+
+
+def _race_variants(
+    args: argparse.Namespace,
+    jobs: list[Job],
+    options: RunOptions,
+    limits: ResourceLimits,
+) -> int:
+    """Benchmark every implementation of the selected parts side by side.
+
+    Prints one record per part and implementation, then a ranking of each
+    part with several implementations on stderr.
+
+    Args:
+        args: Parsed arguments of the variants command
+        jobs: Parts to race
+        options: Benchmark settings (the variant is filled in per run)
+        limits: Wall-clock and address-space limits for each run
+
+    Returns:
+        Exit code: 1 if a run failed or implementations disagree, 0 otherwise
+
+    """
+    names = {job: list(implementations(load_part(*job))) for job in jobs}
+    results: dict[Job, dict[str, PartResult]] = {job: {} for job in jobs}
+    for name in dict.fromkeys(n for job_names in names.values() for n in job_names):
+        selected = [job for job in jobs if name in names[job]]
+        outcomes = run_jobs(
+            selected,
+            workers=args.workers,
+            options=replace(options, variant=name),
+            limits=limits,
+        )
+        for job in selected:
+            results[job][name] = outcomes[job]
+
+    write_records(
+        [part_record(result) for job in jobs for result in results[job].values()],
+        args.format,
+        sys.stdout,
+    )
+
+    defaults = VariantDefaults()
+    failed = False
+    for job, runs in results.items():
+        label = f"{job.year} day {job.day} part {job.part}"
+        if any(result.status is not PartStatus.OK for result in runs.values()):
+            failed = True
+        elif len({str(result.answer) for result in runs.values()}) > 1:
+            failed = True
+            found = ", ".join(f"{name}={r.answer}" for name, r in runs.items())
+            print(f"✗ {label}: implementations disagree ({found})", file=sys.stderr)
+        elif len(runs) > 1:
+            ranked = sorted(runs, key=lambda name: runs[name].time)
+            fastest = runs[ranked[0]].time
+            print(
+                f"{label}: "
+                + ", ".join(
+                    f"{name} {runs[name].time * 1e3:.3f}ms "
+                    f"({runs[name].time / fastest:.1f}x)"
+                    for name in ranked
+                ),
+                file=sys.stderr,
+            )
+            if args.set_default:
+                defaults.set(*job, ranked[0])
+                print(
+                    f"Default of {label} on this machine: {ranked[0]}",
+                    file=sys.stderr,
+                )
+    if args.set_default:
+        defaults.save()
+    return int(failed)
+
+
+def _sync(args: argparse.Namespace) -> int:
+    """Mirror missing puzzle pages and inputs.
+
+    Args:
+        args: Parsed arguments of the sync command
+
+    Returns:
+        Exit code: 1 if any download failed, 0 otherwise
+
+    """
+    # HTTP and HTML libraries are only needed for syncing
+    from aoc.sync import SyncStatus, sync
+
+    items = sync(
+        args.years,
+        days=args.days or range(1, 26),
+        workers=args.workers,
+        inputs=not args.no_inputs,
+        puzzles=not args.no_puzzles,
+    )
+    counts = dict.fromkeys(SyncStatus, 0)
+    for item in items:
+        counts[item.status] += 1
+    print(", ".join(f"{count} {status.value}" for status, count in counts.items()))
+    return int(counts[SyncStatus.FAILED] > 0)
+
+
+def _submit(args: argparse.Namespace) -> int:
+    """Submit one answer and print the verdict as a JSON record.
+
+    Args:
+        args: Parsed arguments of the submit command
+
+    Returns:
+        Exit code: 0 if the answer is correct (or the part already solved)
+
+    """
+    # HTTP libraries are only needed for submitting
+    from aoc.http import AoCClient
+    from aoc.submit import Verdict, submit
+
+    with AoCClient() as client:
+        result = submit(client, args.year, args.day, args.part, args.answer)
+    record = {
+        "year": args.year,
+        "day": args.day,
+        "part": args.part,
+        "answer": args.answer,
+        "verdict": result.verdict.value,
+        "wait_s": result.wait,
+        "hint": result.hint and result.hint.value,
+        "detail": result.detail,
+    }
+    print(json.dumps(record))
+    return int(result.verdict not in (Verdict.CORRECT, Verdict.ALREADY_SOLVED))
+
+
+def _unlock(args: argparse.Namespace) -> int:
+    """Fetch a puzzle at unlock, save it and print the latencies as JSON.
+
+    Args:
+        args: Parsed arguments of the unlock command
+
+    Returns:
+        Exit code
+
+    """
+    # HTTP and HTML libraries are only needed for fetching
+    from aoc.http import AoCClient
+    from aoc.markdown import save_puzzle_markdown
+    from aoc.unlock import UnlockFetcher
+
+    with AoCClient() as client:
+        fetcher = UnlockFetcher(client)
+        try:
+            result = fetcher.fetch_at_unlock(args.year, args.day)
+        finally:
+            fetcher.close()
+    save_puzzle_markdown(result.puzzle, args.year, args.day)
+
+    record = {
+        "year": args.year,
+        "day": args.day,
+        "sent_at": result.sent_at,
+        "clock_offset_s": [result.offset.low, result.offset.high],
+        "puzzle_latency_s": result.puzzle_latency._asdict(),
+        "input_latency_s": result.input_latency._asdict(),
+    }
+    print(json.dumps(record))
+    return 0
+
+
+def _importtime(args: argparse.Namespace) -> int:
+    """Print the import-time report of the solving path or given modules.
+
+    Args:
+        args: Parsed arguments of the importtime command
+
+    Returns:
+        Exit code: 1 if the solver path is over its import budget, 0 otherwise
+
+    """
+    # The report runs a fresh interpreter and is only needed here
+    from aoc.bench import importtime
+
+    return importtime.main(args.modules)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+"""Warm solver daemon answering solve requests over a Unix domain socket.
+
+The daemon keeps ``aoc.puzzles`` modules and puzzle inputs loaded between
+requests, so solving a fast day costs milliseconds instead of an interpreter
+start, imports and input reading. A module is reloaded only when its source,
+or the source of an ``aoc.puzzles`` module it imports, changes on disk.
+
+The protocol is one JSON object per line in each direction:
+    -> {"op": "solve", "year": 2016, "day": 1, "part": 1}
+    <- {"status": "OK", "answer": 161, "time": 0.0001, "reloaded": false}
+
+Usage:
+    python -m aoc.daemon serve
+    python -m aoc.daemon solve 2016 1 1
+    python -m aoc.daemon stop
+"""
+
+import argparse
+import importlib
+import json
+import socket
+import socketserver
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any, NamedTuple
+
+from aoc.helpers import get_cache_dir, read_puzzle_input, timer
+
+
+def default_socket_path() -> Path:
+    """Get the socket path used when none is given.
+
+    Returns:
+        Path to daemon.sock in the cache dir
+
+    """
+    return get_cache_dir() / "daemon.sock"
+
+
+class _LoadedPart(NamedTuple):
+    """A part module with the source versions it was loaded from."""
+
+    module: ModuleType
+    versions: dict[Path, int]  # Source path -> mtime_ns at load time
+
+
+def _versions(paths: list[Path]) -> dict[Path, int]:
+    """Get the modification times of source files.
+
+    Args:
+        paths: Files to stat
+
+    Returns:
+        Mapping from path to mtime in nanoseconds (-1 if the file is gone)
+
+    """
+    versions = {}
+    for path in paths:
+        try:
+            versions[path] = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            versions[path] = -1
+    return versions
+
+
+class SolverDaemon:
+    """In-memory store of solver modules, reloaded on change.
+
+    Inputs are memoized by aoc.inputs, which re-reads them when they change.
+    """
+
+    def __init__(self) -> None:
+        """Start with nothing loaded."""
+        self.parts: dict[tuple[int, int, int], _LoadedPart] = {}
+        self.stopping = False
+
+    def _module(self, year: int, day: int, part: int) -> tuple[ModuleType, bool]:
+        """Get a part module, reloading it if its sources changed.
+
+        Args:
+            year: Year of the puzzle
+            day: Day of the puzzle (1-25)
+            part: Part number (1 or 2)
+
+        Returns:
+            Tuple of (module, whether it was (re)loaded for this request)
+
+        """
+        key = (year, day, part)
+        loaded = self.parts.get(key)
+        if loaded is not None and _versions(list(loaded.versions)) == loaded.versions:
+            return loaded.module, False
+
+        # Only the server needs this; keeps the solve client quick to start
+        from aoc.cache import source_closure
+
+        closure = source_closure(year, day, part)
+        # Drop the whole closure so dependencies are re-executed too
+        for name in closure:
+            sys.modules.pop(name, None)
+        versions = _versions(list(closure.values()))
+        module = importlib.import_module(
+            f"aoc.puzzles.year{year}.day{day:02d}.part{part}"
+        )
+        self.parts[key] = _LoadedPart(module, versions)
+        return module, True
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Answer one request.
+
+        Args:
+            request: Decoded request object
+
+        Returns:
+            Response object to send back
+
+        """
+        op = request.get("op", "solve")
+        if op == "ping":
+            return {"status": "OK", "loaded": len(self.parts)}
+        if op == "stop":
+            self.stopping = True
+            return {"status": "OK"}
+        if op != "solve":
+            return {"status": "ERROR", "error": f"Unknown op {op!r}"}
+
+        try:
+            year, day, part = (int(request[k]) for k in ("year", "day", "part"))
+            module, reloaded = self._module(year, day, part)
+            puzzle_input = read_puzzle_input(year, day)
+            with timer() as t:
+                answer = module.solve(puzzle_input)
+        except Exception as e:  # noqa: BLE001 - report failures to the client
+            return {"status": "ERROR", "error": f"{type(e).__name__}: {e}"}
+        return {"status": "OK", "answer": answer, "time": t[0], "reloaded": reloaded}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads JSON requests line by line and writes JSON responses."""
+
+    server: "_DaemonServer"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                response: dict[str, Any] = {"status": "ERROR", "error": str(e)}
+            else:
+                response = self.server.daemon.handle(request)
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+            if self.server.daemon.stopping:
+                return
+
+
+class _DaemonServer(socketserver.UnixStreamServer):
+    """Single-threaded server: solvers are CPU bound and share modules."""
+
+    def __init__(self, path: Path, daemon: SolverDaemon) -> None:
+        self.daemon = daemon
+        super().__init__(str(path), _RequestHandler)
+
+
+def _is_running(path: Path) -> bool:
+    """Check whether a daemon is listening on a socket path.
+
+    Args:
+        path: Socket path
+
+    Returns:
+        True if a connection succeeds
+
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+def serve(path: Path | None = None) -> None:
+    """Run the daemon until a stop request arrives.
+
+    Args:
+        path: Socket path (defaults to daemon.sock in the cache dir)
+
+    Raises:
+        RuntimeError: If another daemon already listens on the socket
+
+    """
+    path = path or default_socket_path()
+    if path.exists():
+        if _is_running(path):
+            msg = f"A solver daemon is already running on {path}"
+            raise RuntimeError(msg)
+        path.unlink()  # Left behind by a daemon that died
+
+    daemon = SolverDaemon()
+    with _DaemonServer(path, daemon) as server:
+        path.chmod(0o600)
+        print(f"Solver daemon listening on {path}")
+        try:
+            while not daemon.stopping:
+                server.handle_request()
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def request(message: dict[str, Any], path: Path | None = None) -> dict[str, Any]:
+    """Send one request to a running daemon.
+
+    Args:
+        message: Request object
+        path: Socket path (defaults to daemon.sock in the cache dir)
+
+    Returns:
+        Response object
+
+    Raises:
+        ConnectionError: If no daemon is listening
+
+    """
+    path = path or default_socket_path()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except OSError as e:
+            msg = f"No solver daemon on {path}; run: python -m aoc.daemon serve"
+            raise ConnectionError(msg) from e
+        with sock.makefile("rwb") as stream:
+            stream.write(json.dumps(message).encode() + b"\n")
+            stream.flush()
+            response: dict[str, Any] = json.loads(stream.readline())
+    return response
+
+
+def solve(year: int, day: int, part: int, path: Path | None = None) -> dict[str, Any]:
+    """Ask a running daemon to solve a puzzle part.
+
+    Args:
+        year: Year of the puzzle
+        day: Day of the puzzle (1-25)
+        part: Part number (1 or 2)
+        path: Socket path (defaults to daemon.sock in the cache dir)
+
+    Returns:
+        Response with status, answer, time and whether the module was reloaded
+
+    """
+    return request({"op": "solve", "year": year, "day": day, "part": part}, path)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Serve, query or stop the daemon from the command line.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code
+
+    """
+    parser = argparse.ArgumentParser(prog="python -m aoc.daemon")
+    parser.add_argument("--socket", type=Path, help="socket path")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve", help="run the daemon in the foreground")
+    commands.add_parser("stop", help="stop a running daemon")
+    solve_parser = commands.add_parser("solve", help="solve a puzzle part")
+    for name in ("year", "day", "part"):
+        solve_parser.add_argument(name, type=int)
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.socket)
+        return 0
+    if args.command == "stop":
+        request({"op": "stop"}, args.socket)
+        return 0
+
+    response = solve(args.year, args.day, args.part, args.socket)
+    if response["status"] != "OK":
+        print(response["error"], file=sys.stderr)
+        return 1
+    print(response["answer"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
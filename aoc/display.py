@@ -1,78 +1,179 @@
 """Display and run functions for AoC solver results."""
 
-import importlib
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from aoc.bench.timing import BenchmarkConfig
+from aoc.runner import RunOptions, run_part
+from aoc.types import (
+    BenchmarkStats,
+    DayContext,
+    MemoryStats,
+    PartResult,
+    PartStatus,
+    SolveResult,
+    SpanNode,
+)
+
+if TYPE_CHECKING:
+    # The scheduler pulls in multiprocessing, only needed by run_year
+    from aoc.scheduler import ResourceLimits
+
+
+def run_day(
+    year: int,
+    day: int,
+    bench: BenchmarkConfig | None = None,
+    use_cache: bool = True,
+    profile: bool = False,
+    memory: bool = False,
+    spans: bool = False,
+) -> SolveResult:
+    """Run both parts of a puzzle and collect results.
 
-from aoc.helpers import read_puzzle_input, timer
-from aoc.types import SolveResult
-
+    Benchmark runs are recorded in the benchmark history database. Profiled
+    runs print the top functions of each part, and span runs the tree of
+    phases the solvers marked.
 
-def run_day(year: int, day: int) -> SolveResult:
-    """Run both parts of a puzzle and collect results.
+    Parts following the parse-once protocol share one parse and their
+    intermediate work through a DayContext.
 
     Args:
         year: Year of the puzzle
         day: Day of the puzzle (1-25)
+        bench: Benchmark settings (None to time each part once)
+        use_cache: Answer from the result cache when the solver and input are
+            unchanged (measured runs always recompute)
+        profile: Run each part under cProfile and save a .pstats file
+        memory: Track peak memory, max RSS and top allocation sites of each
+            part (slows solvers down)
+        spans: Record the spans each part's solver marks its phases with
 
     Returns:
         SolveResult with answers and execution times
 
     """
-    # Import part1 and part2 modules dynamically
-    part1 = importlib.import_module(f"aoc.puzzles.year{year}.day{day:02d}.part1")
-    part2 = importlib.import_module(f"aoc.puzzles.year{year}.day{day:02d}.part2")
-
-    puzzle_input = read_puzzle_input(year, day)
-
-    # Run part 1
-    with timer() as t1:
-        answer1 = part1.solve(puzzle_input)
-
-    # Run part 2
-    with timer() as t2:
-        answer2 = part2.solve(puzzle_input)
-
-    return SolveResult(
-        year=year,
-        day=day,
-        part1_answer=answer1,
-        part1_time=t1[0],
-        part2_answer=answer2,
-        part2_time=t2[0],
-    )
-
-
-def run_year(year: int) -> list[SolveResult]:
+    # Deferred: hashing sources and inputs is only needed once a day runs
+    from aoc.cache import ResultCache, part_key
+
+    options = RunOptions(bench=bench, profile=profile, memory=memory, spans=spans)
+    cache = ResultCache() if use_cache and options.cacheable else None
+    context = DayContext()
+    parts: list[PartResult] = []
+
+    for part in (1, 2):
+        if cache is None:
+            parts.append(run_part(year, day, part, options, context))
+            continue
+        key = part_key(year, day, part)
+        part_result = cache.get(key, year, day, part)
+        if part_result is None:
+            part_result = run_part(year, day, part, options, context)
+            cache.put(key, part_result)
+        parts.append(part_result)
+
+    result = SolveResult.from_parts(*parts)
+    if bench is not None:
+        _record_benchmark([result])
+    if profile:
+        display_profiles([result])
+    if spans:
+        display_spans([result])
+    return result
+
+
+def run_year(
+    year: int,
+    workers: int | None = None,
+    bench: BenchmarkConfig | None = None,
+    limits: "ResourceLimits | None" = None,
+    use_cache: bool = True,
+    profile: bool = False,
+    memory: bool = False,
+    spans: bool = False,
+) -> list[SolveResult]:
     """Run all available puzzles for a year.
 
+    Every part is scheduled as its own job in a supervised child process,
+    slowest known parts first, so the year takes about as long as its slowest
+    part. Parts exceeding their limits are killed and reported as TIMEOUT or
+    OOM while the other days keep running. Benchmark runs are recorded in the
+    benchmark history database, profiled runs print the top functions of
+    each part and span runs the tree of phases of each day.
+
     Args:
         year: Year to run puzzles for
+        workers: Number of concurrent worker processes (None for one per CPU).
+            Use 1 when benchmarking to keep parts from competing for CPUs.
+        bench: Benchmark settings (None to time each part once)
+        limits: Wall-clock and address-space limits for each part (None for
+            DEFAULT_LIMITS)
+        use_cache: Answer from the result cache when a part's solver and input
+            are unchanged (measured runs always recompute)
+        profile: Run each part under cProfile and save a .pstats file
+        memory: Track peak memory, max RSS and top allocation sites of each
+            part (slows solvers down)
+        spans: Record the spans each part's solver marks its phases with
 
     Returns:
-        List of SolveResults, one per completed day
+        List of SolveResults in day order, one per day that did not fail
 
     """
+    # Deferred: multiprocessing is only needed to run a whole year
+    from aoc.cache import ResultCache
+    from aoc.scheduler import DEFAULT_LIMITS, Job, find_days, run_jobs
+
+    days = find_days(year)
+    jobs = [Job(year, day, part) for day in days for part in (1, 2)]
+    options = RunOptions(bench=bench, profile=profile, memory=memory, spans=spans)
+    cache = ResultCache() if use_cache and options.cacheable else None
+    outcomes = run_jobs(
+        jobs,
+        workers=workers,
+        options=options,
+        limits=DEFAULT_LIMITS if limits is None else limits,
+        cache=cache,
+    )
+
     results: list[SolveResult] = []
-    year_dir = Path(f"aoc/puzzles/year{year}")
+    for day in days:
+        part1, part2 = outcomes[Job(year, day, 1)], outcomes[Job(year, day, 2)]
+        failed = [p for p in (part1, part2) if p.status is PartStatus.ERROR]
+        if failed:
+            print(f"✗ Day {day:2d}: Failed - {failed[0].error}")
+            continue
+
+        result = SolveResult.from_parts(part1, part2)
+        results.append(result)
+        p1 = _format_status(result.part1_answer, result.part1_status)
+        p2 = _format_status(result.part2_answer, result.part2_status)
+        print(f"✓ Day {day:2d}: Part 1 = {p1}, Part 2 = {p2}")
+
+    if bench is not None:
+        _record_benchmark(results)
+    if profile:
+        display_profiles(results)
+    if spans:
+        display_spans(results)
+    return results
+
 
-    if not year_dir.exists():
-        return results
+def _record_benchmark(results: list[SolveResult]) -> None:
+    """Store benchmark results in the history database.
 
-    # Find all day directories
-    for day_dir in sorted(year_dir.glob("day*")):
-        day = int(day_dir.name[3:])  # Extract day number from "day01"
+    Args:
+        results: Results with timing distributions
 
-        # Check if both part1.py and part2.py exist
-        if (day_dir / "part1.py").exists() and (day_dir / "part2.py").exists():
-            try:
-                result = run_day(year, day)
-                results.append(result)
-                p1, p2 = result.part1_answer, result.part2_answer
-                print(f"✓ Day {day:2d}: Part 1 = {p1}, Part 2 = {p2}")
-            except (ImportError, AttributeError, FileNotFoundError) as e:
-                print(f"✗ Day {day:2d}: Failed - {e}")
+    """
+    # Only benchmark runs need sqlite and git, so keep them off the import path
+    from aoc.bench.history import BenchmarkHistory
 
-    return results
+    history = BenchmarkHistory()
+    try:
+        run_id = history.record_run(results)
+    finally:
+        history.close()
+    print(f"Recorded benchmark run {run_id}")
 
 
 def _format_answer(answer: int | str | None) -> str:
@@ -94,6 +195,110 @@ def _format_answer(answer: int | str | None) -> str:
     return ans_str
 
 
+def _format_status(answer: int | str | None, status: PartStatus) -> int | str | None:
+    """Replace the answer of a part that was stopped by its status.
+
+    Args:
+        answer: Answer of the part
+        status: Outcome of the part
+
+    Returns:
+        The answer, or the status name (e.g. "TIMEOUT") if it did not finish
+
+    """
+    return answer if status is PartStatus.OK else status.value
+
+
+def _format_ns(ns: float) -> str:
+    """Format a duration in nanoseconds with a readable unit.
+
+    Args:
+        ns: Duration in nanoseconds
+
+    Returns:
+        Formatted duration (e.g. "12.3ms")
+
+    """
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("µs", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.3g}{unit}"
+    return f"{ns:.0f}ns"
+
+
+def _format_time(
+    time: float,
+    stats: BenchmarkStats | None,
+    cpu: bool = False,
+    cached: bool = False,
+) -> str:
+    """Format a part's time, as median ± IQR when benchmarked.
+
+    Args:
+        time: Single-run time in seconds
+        stats: Timing distributions (None if not benchmarked)
+        cpu: Show the CPU time distribution instead of wall time
+        cached: Mark the time as coming from the result cache
+
+    Returns:
+        Formatted time string
+
+    """
+    if stats is None:
+        if time <= 0:
+            return "-"
+        return f"{time:.3f}s (cached)" if cached else f"{time:.3f}s"
+    dist = stats.cpu if cpu else stats.wall
+    return f"{_format_ns(dist.median_ns)} ± {_format_ns(dist.iqr_ns)}"
+
+
+def _format_bytes(size: int | None) -> str:
+    """Format a memory size with a binary unit.
+
+    Args:
+        size: Size in bytes (None if not measured)
+
+    Returns:
+        Formatted size (e.g. "35.2MiB")
+
+    """
+    if size is None:
+        return "-"
+    for unit, scale in (("GiB", 1024**3), ("MiB", 1024**2), ("KiB", 1024)):
+        if size >= scale:
+            return f"{size / scale:.1f}{unit}"
+    return f"{size}B"
+
+
+def _format_parse_time(parse_time: float | None) -> str:
+    """Format the parse time of a part.
+
+    Args:
+        parse_time: Seconds spent parsing (None if the solver parses in solve)
+
+    Returns:
+        Formatted time, "-" if unknown
+
+    """
+    return "-" if parse_time is None else _format_ns(parse_time * 1e9)
+
+
+def _memory_columns(part: int, memory: MemoryStats | None) -> dict[str, str]:
+    """Build the memory columns of one part.
+
+    Args:
+        part: Part number
+        memory: Memory usage of the part (None if not tracked)
+
+    Returns:
+        Mapping from column header to formatted value
+
+    """
+    return {
+        f"Part {part} Peak": _format_bytes(memory.peak_traced if memory else None),
+        f"Part {part} RSS": _format_bytes(memory.max_rss if memory else None),
+    }
+
+
 def _calculate_column_widths(
     rows: list[dict[str, str]], headers: list[str]
 ) -> dict[str, int]:
@@ -153,6 +358,11 @@ def display_result_table(results: list[SolveResult]) -> None:
 
     Automatically adjusts column widths to fit content.
     Handles multiline answers (e.g., ASCII art) by displaying them in code blocks.
+    Benchmarked results show times as median ± IQR, with extra CPU time columns.
+    Parts stopped by the runner show TIMEOUT or OOM instead of an answer.
+    Memory-tracked results get peak traced memory and max RSS columns, and
+    days parsing once get the parse time of each part (included in its time).
+    Parts over their budget are listed below the table, apart from failures.
 
     Args:
         results: List of solve results to display
@@ -166,19 +376,50 @@ def display_result_table(results: list[SolveResult]) -> None:
 
     # Prepare table data
     headers = ["Day", "Part 1 Answer", "Part 2 Answer", "Part 1 Time", "Part 2 Time"]
+    benchmarked = any(r.part1_stats or r.part2_stats for r in results)
+    if benchmarked:
+        headers += ["Part 1 CPU", "Part 2 CPU"]
+    tracked = any(r.part1_memory or r.part2_memory for r in results)
+    if tracked:
+        headers += ["Part 1 Peak", "Part 1 RSS", "Part 2 Peak", "Part 2 RSS"]
+    parsed = any(
+        r.part1_parse_time is not None or r.part2_parse_time is not None
+        for r in results
+    )
+    if parsed:
+        headers += ["Part 1 Parse", "Part 2 Parse"]
     rows = []
 
     for result in results:
-        p1_time = f"{result.part1_time:.3f}s" if result.part1_time > 0 else "-"
-        p2_time = f"{result.part2_time:.3f}s" if result.part2_time > 0 else "-"
-
-        rows.append({
+        row = {
             "Day": str(result.day),
-            "Part 1 Answer": _format_answer(result.part1_answer),
-            "Part 2 Answer": _format_answer(result.part2_answer),
-            "Part 1 Time": p1_time,
-            "Part 2 Time": p2_time,
-        })
+            "Part 1 Answer": _format_answer(
+                _format_status(result.part1_answer, result.part1_status)
+            ),
+            "Part 2 Answer": _format_answer(
+                _format_status(result.part2_answer, result.part2_status)
+            ),
+            "Part 1 Time": _format_time(
+                result.part1_time, result.part1_stats, cached=result.part1_cached
+            ),
+            "Part 2 Time": _format_time(
+                result.part2_time, result.part2_stats, cached=result.part2_cached
+            ),
+        }
+        if benchmarked:
+            row["Part 1 CPU"] = _format_time(
+                result.part1_time, result.part1_stats, cpu=True
+            )
+            row["Part 2 CPU"] = _format_time(
+                result.part2_time, result.part2_stats, cpu=True
+            )
+        if tracked:
+            row |= _memory_columns(1, result.part1_memory)
+            row |= _memory_columns(2, result.part2_memory)
+        if parsed:
+            row["Part 1 Parse"] = _format_parse_time(result.part1_parse_time)
+            row["Part 2 Parse"] = _format_parse_time(result.part2_parse_time)
+        rows.append(row)
 
     # Calculate column widths and print table
     col_widths = _calculate_column_widths(rows, headers)
@@ -195,3 +436,109 @@ def display_result_table(results: list[SolveResult]) -> None:
         _print_table_row(row, headers, col_widths)
 
     print()
+    _display_overruns(results)
+
+
+def _display_overruns(results: list[SolveResult]) -> None:
+    """List the parts that exceeded their budget.
+
+    Args:
+        results: Results to report on
+
+    """
+    overruns = [
+        f"- Day {result.day} Part {part}: {overrun}"
+        for result in results
+        for part, over_budget in (
+            (1, result.part1_over_budget),
+            (2, result.part2_over_budget),
+        )
+        for overrun in over_budget
+    ]
+    if overruns:
+        print("Over budget:")
+        print("\n".join(overruns))
+        print()
+
+
+def display_profiles(results: list[SolveResult], limit: int = 10) -> None:
+    """Print the top functions of every profiled part.
+
+    Args:
+        results: Results from a profiled run
+        limit: Number of functions to show per ranking
+
+    """
+    # pstats is only needed for profiled runs
+    from aoc.bench.profile import format_profile
+
+    for result in results:
+        profiles: list[tuple[int, Path | None]] = [
+            (1, result.part1_profile),
+            (2, result.part2_profile),
+        ]
+        for part, path in profiles:
+            if path is None:
+                continue
+            print(f"\n## {result.year} Day {result.day} Part {part} ({path})\n")
+            print(format_profile(path, limit))
+
+
+def _format_span_tree(root: SpanNode) -> list[str]:
+    """Draw a span tree with each node's time and share of the root's time.
+
+    Nodes whose children do not cover all of their time get an "(other)"
+    child holding the rest, so every level adds up to its parent.
+
+    Args:
+        root: Root of the tree
+
+    Returns:
+        One line per node, indented as a tree
+
+    """
+    rows: list[tuple[str, SpanNode]] = []
+
+    def walk(node: SpanNode, prefix: str, branch: str, indent: str) -> None:
+        rows.append((prefix + branch + node.name, node))
+        children = list(node.children.values())
+        if children and (rest := node.ns - sum(c.ns for c in children)) > 0:
+            children.append(SpanNode("(other)", rest, 1))
+        for i, child in enumerate(children):
+            last = i == len(children) - 1
+            walk(
+                child,
+                prefix + indent,
+                "└── " if last else "├── ",
+                "    " if last else "│   ",
+            )
+
+    walk(root, "", "", "")
+    width = max(len(label) for label, _ in rows)
+    total = root.ns or 1
+    return [
+        f"{label.ljust(width)}  {_format_ns(node.ns):>7}  {node.ns / total:6.1%}"
+        + (f"  ({node.calls} calls)" if node.calls > 1 else "")
+        for label, node in rows
+    ]
+
+
+def display_spans(results: list[SolveResult]) -> None:
+    """Print the span tree of every day, with shares of the day's total time.
+
+    Args:
+        results: Results from a run recording spans
+
+    """
+    for result in results:
+        parts = [s for s in (result.part1_spans, result.part2_spans) if s is not None]
+        if not parts:
+            continue
+        day = SpanNode(
+            f"Day {result.day}",
+            ns=sum(part.ns for part in parts),
+            calls=1,
+            children={part.name: part for part in parts},
+        )
+        print(f"\n## {result.year} Day {result.day} Spans\n")
+        print("\n".join(_format_span_tree(day)))
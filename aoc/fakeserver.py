@@ -0,0 +1,518 @@
+"""Local stand-in for adventofcode.com, serving the committed puzzles.
+
+Puzzle pages are rendered from each day's puzzle.md, inputs are served from
+input.txt, and submitted answers are judged against the answers recorded in
+puzzle.md. Latency, random or scripted server errors, 429 rate limiting and
+submission cooldowns can be configured, so AoCClient's retries, caching and
+throughput can be tested and benchmarked offline.
+
+Usage:
+    python -m aoc.fakeserver serve --port 8000 --latency 0.05 --error-rate 0.1
+    python -m aoc.fakeserver bench --requests 200 --workers 8
+"""
+
+import argparse
+import hashlib
+import html
+import random
+import re
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from email.utils import formatdate
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from aoc.helpers import get_puzzle_dir
+
+_PAGE = re.compile(r"^/(\d{4})/day/(\d{1,2})(/input|/answer)?$")
+_INLINE = re.compile(r"`([^`]+)`|\*([^*]+)\*|\[([^]]+)\]\(([^)\s]+)\)")
+
+# Wait imposed by a wrong answer, as on the real site
+WRONG_ANSWER_WAIT = 60.0
+
+
+@dataclass
+class FakeServerConfig:
+    """Behaviour of the stand-in server.
+
+    Attributes:
+        latency: Seconds added before every response
+        error_rate: Fraction of requests answered with 503 at random
+        rate_limit: Requests per second allowed before answering 429 with
+            Retry-After (None for no limit)
+        seed: Seed of the error injection
+        clock: Server clock, used for Date headers, puzzle unlocks and
+            submission cooldowns
+
+    """
+
+    latency: float = 0.0
+    error_rate: float = 0.0
+    rate_limit: float | None = None
+    seed: int = 0
+    clock: Callable[[], float] = field(default=time.time)
+
+
+def _inline(text: str) -> str:
+    """Render inline code, emphasis and links of a markdown line.
+
+    Args:
+        text: Markdown text
+
+    Returns:
+        HTML text
+
+    """
+
+    def replace(match: re.Match[str]) -> str:
+        code, emphasis, text, href = match.groups()
+        if code is not None:
+            return f"<code>{code}</code>"
+        if emphasis is not None:
+            return f"<em>{emphasis}</em>"
+        return f'<a href="{href}" target="_blank">{text}</a>'
+
+    return _INLINE.sub(replace, html.escape(text, quote=False))
+
+
+def _render_blocks(markdown: str) -> str:
+    """Render the paragraphs, lists and code blocks of a puzzle part.
+
+    Args:
+        markdown: Markdown of one part, without its heading and answer
+
+    Returns:
+        HTML blocks
+
+    """
+    blocks: list[str] = []
+    lines = markdown.strip().splitlines()
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if line.startswith("```"):
+            end = lines.index("```", i + 1) if "```" in lines[i + 1 :] else len(lines)
+            code = html.escape("\n".join(lines[i + 1 : end]), quote=False)
+            blocks.append(f"<pre><code>{code}\n</code></pre>")
+            i = end + 1
+        elif line.startswith(("* ", "- ")):
+            items = []
+            while i < len(lines) and lines[i].startswith(("* ", "- ")):
+                items.append(f"<li>{_inline(lines[i][2:])}</li>")
+                i += 1
+            blocks.append("<ul>" + "".join(items) + "</ul>")
+        elif line.strip():
+            blocks.append(f"<p>{_inline(line)}</p>")
+            i += 1
+        else:
+            i += 1
+    return "\n".join(blocks)
+
+
+class Puzzle:
+    """A committed puzzle as the site would serve it."""
+
+    def __init__(self, year: int, day: int, markdown: str) -> None:
+        """Parse a puzzle.md file.
+
+        Args:
+            year: Year of the puzzle
+            day: Day of the puzzle (1-25)
+            markdown: Contents of puzzle.md
+
+        Raises:
+            ValueError: If the title line is missing
+
+        """
+        match = re.match(r"# Day \d+: (.+)", markdown)
+        if not match:
+            msg = f"No title in puzzle.md of {year} day {day}"
+            raise ValueError(msg)
+        self.year = year
+        self.day = day
+        self.title = match.group(1).strip()
+        self.parts: list[str] = []
+        self.answers: list[str | None] = []
+        sections = re.split(r"^## Part (?:One|Two)\s*$", markdown, flags=re.MULTILINE)
+        for section in sections[1:]:
+            answer = re.search(r"\*\*Your puzzle answer was `(.+?)`\.\*\*", section)
+            self.answers.append(answer.group(1) if answer else None)
+            self.parts.append(section[: answer.start()] if answer else section)
+
+    def page(self) -> str:
+        """Render the puzzle page.
+
+        Returns:
+            HTML shaped like the site's day page
+
+        """
+        body = []
+        for number, (text, answer) in enumerate(
+            zip(self.parts, self.answers, strict=True), 1
+        ):
+            heading = (
+                f"--- Day {self.day}: {html.escape(self.title)} ---"
+                if number == 1
+                else "--- Part Two ---"
+            )
+            body.append(
+                f'<article class="day-desc"><h2>{heading}</h2>\n'
+                f"{_render_blocks(text)}\n</article>"
+            )
+            if answer is not None:
+                body.append(
+                    f"<p>Your puzzle answer was <code>{html.escape(answer)}</code>.</p>"
+                )
+        return (
+            '<!DOCTYPE html>\n<html lang="en-us"><head>'
+            f"<title>Day {self.day} - Advent of Code {self.year}</title></head>"
+            "<body><main>\n" + "\n".join(body) + "\n</main></body></html>\n"
+        )
+
+
+def _answer_page(message: str) -> str:
+    """Wrap a submission message like the site does.
+
+    Args:
+        message: Message paragraph contents
+
+    Returns:
+        HTML of the answer response page
+
+    """
+    return (
+        "<!DOCTYPE html>\n<html><body><main>\n"
+        f"<article><p>{message}</p></article>\n</main></body></html>\n"
+    )
+
+
+class FakeAoCServer(ThreadingHTTPServer):
+    """Threaded HTTP server answering like adventofcode.com."""
+
+    daemon_threads = True
+
+    def __init__(self, config: FakeServerConfig | None = None, port: int = 0) -> None:
+        """Bind to a local port (not serving yet).
+
+        Args:
+            config: Behaviour of the server
+            port: Port to listen on (0 for any free port)
+
+        """
+        self.config = config or FakeServerConfig()
+        self.log: list[tuple[str, str, int]] = []  # (method, path, status)
+        self.solved: set[tuple[int, int, int]] = set()
+        self.cooldowns: dict[tuple[int, int], float] = {}
+        self._faults: deque[int] = deque()
+        # Reproducible fault injection, not cryptography
+        self._random = random.Random(self.config.seed)  # noqa: S311
+        self._recent: deque[float] = deque()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        super().__init__(("127.0.0.1", port), _Handler)
+
+    @property
+    def url(self) -> str:
+        """Base URL to give AoCClient."""
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def fail_next(self, status: int, times: int = 1) -> None:
+        """Answer the next requests with an error status.
+
+        Args:
+            status: HTTP status to reply with (e.g. 500 or 503)
+            times: Number of requests to fail
+
+        """
+        with self._lock:
+            self._faults.extend([status] * times)
+
+    def _injected_status(self) -> int | None:
+        """Pick the error status of the current request, if any.
+
+        Returns:
+            Status to fail with, or None to serve the request
+
+        """
+        with self._lock:
+            if self._faults:
+                return self._faults.popleft()
+            if self.config.rate_limit is not None:
+                now = time.monotonic()
+                while self._recent and self._recent[0] <= now - 1:
+                    self._recent.popleft()
+                if len(self._recent) >= self.config.rate_limit:
+                    return 429
+                self._recent.append(now)
+            if self._random.random() < self.config.error_rate:
+                return 503
+        return None
+
+    def start(self) -> "FakeAoCServer":
+        """Serve requests on a background thread.
+
+        Returns:
+            The server itself
+
+        """
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> "FakeAoCServer":
+        """Start serving.
+
+        Returns:
+            The server itself
+
+        """
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop serving."""
+        self.stop()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes requests of the stand-in server."""
+
+    server: FakeAoCServer
+    protocol_version = "HTTP/1.1"
+
+    def date_time_string(self, timestamp: float | None = None) -> str:
+        return formatdate(timestamp or self.server.config.clock(), usegmt=True)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass  # Requests are recorded in server.log instead
+
+    def _reply(
+        self, status: int, body: str = "", headers: dict[str, str] | None = None
+    ) -> None:
+        payload = b"" if self.command == "HEAD" else body.encode()
+        # Logged before replying, so the log is complete once a client has
+        # read the response
+        with self.server._lock:
+            self.server.log.append((self.command, self.path, status))
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _handle(self) -> None:
+        if self.server.config.latency:
+            time.sleep(self.server.config.latency)
+        if (status := self.server._injected_status()) is not None:
+            too_many = status == HTTPStatus.TOO_MANY_REQUESTS
+            self._reply(status, "", {"Retry-After": "1"} if too_many else {})
+            return
+
+        match = _PAGE.match(self.path)
+        if self.path == "/":
+            self._reply(200, "<html><body>Advent of Code</body></html>")
+        elif match is None:
+            self._reply(404, "404 Not Found")
+        else:
+            self._serve_day(int(match.group(1)), int(match.group(2)), match.group(3))
+
+    def _serve_day(self, year: int, day: int, route: str | None) -> None:
+        """Serve the page, input or answer route of a puzzle.
+
+        Args:
+            year: Year of the puzzle
+            day: Day of the puzzle
+            route: None for the page, "/input" or "/answer"
+
+        """
+        puzzle_dir = get_puzzle_dir(year, day)
+        # Imported here to keep the requests library out of plain serving
+        from aoc.http import unlock_time
+
+        if (
+            unlock_time(year, day).timestamp() > self.server.config.clock()
+            or not (puzzle_dir / "puzzle.md").exists()
+        ):
+            self._reply(404, "404 Not Found")
+            return
+
+        if route is not None and "session=" not in self.headers.get("Cookie", ""):
+            self._reply(
+                400,
+                "Puzzle inputs differ by user.  Please log in to get your puzzle"
+                " input.",
+            )
+            return
+        puzzle = Puzzle(year, day, (puzzle_dir / "puzzle.md").read_text())
+
+        if route is None:
+            page = puzzle.page()
+            etag = '"' + hashlib.sha256(page.encode()).hexdigest()[:16] + '"'
+            if self.headers.get("If-None-Match") == etag:
+                self._reply(304, "", {"ETag": etag})
+            else:
+                self._reply(200, page, {"ETag": etag})
+        elif route == "/input":
+            self._reply(200, (puzzle_dir / "input.txt").read_text())
+        elif self.command == "POST":
+            self._reply(200, self._judge(puzzle))
+        else:
+            self._reply(405, "Method Not Allowed")
+
+    def _judge(self, puzzle: Puzzle) -> str:
+        """Judge a submitted answer like the site does.
+
+        Args:
+            puzzle: Puzzle the answer is for
+
+        Returns:
+            HTML of the answer response page
+
+        """
+        length = int(self.headers.get("Content-Length", 0))
+        form = parse_qs(self.rfile.read(length).decode())
+        level = int(form.get("level", ["1"])[0])
+        answer = form.get("answer", [""])[0].strip()
+        key = (puzzle.year, puzzle.day)
+        now = self.server.config.clock()
+
+        with self.server._lock:
+            solved = (*key, level) in self.server.solved
+            left = self.server.cooldowns.get(key, 0.0) - now
+            if solved or level > len(puzzle.answers):
+                return _answer_page(
+                    "You don't seem to be solving the right level.  Did you already"
+                    " complete it?"
+                )
+            if left > 0:
+                minutes, seconds = divmod(round(left), 60)
+                wait = f"{minutes}m {seconds}s" if minutes else f"{seconds}s"
+                return _answer_page(
+                    "You gave an answer too recently; you have to wait after"
+                    " submitting an answer before trying again.  You have"
+                    f" {wait} left to wait."
+                )
+
+            expected = puzzle.answers[level - 1]
+            if answer == expected:
+                self.server.solved.add((*key, level))
+                return _answer_page(
+                    'That\'s the right answer!  You are <span class="day-success">'
+                    "one gold star</span> closer to saving Christmas."
+                )
+            self.server.cooldowns[key] = now + WRONG_ANSWER_WAIT
+
+        direction = ""
+        if (
+            expected is not None
+            and answer.lstrip("-").isdigit()
+            and expected.lstrip("-").isdigit()
+        ):
+            direction = " too high" if int(answer) > int(expected) else " too low"
+        hint = f"; your answer is{direction}" if direction else ""
+        return _answer_page(
+            f"That's not the right answer{hint}.  If you're stuck, make sure you're"
+            " using the full input data.  Please wait one minute before trying"
+            " again."
+        )
+
+    do_GET = _handle  # noqa: N815 - names required by BaseHTTPRequestHandler
+    do_HEAD = _handle  # noqa: N815
+    do_POST = _handle  # noqa: N815
+
+
+def benchmark_client(
+    requests: int = 200, workers: int = 8, latency: float = 0.01
+) -> str:
+    """Measure AoCClient throughput against a local server.
+
+    Args:
+        requests: Number of input fetches
+        workers: Number of threads sharing the client
+        latency: Server latency per request, in seconds
+
+    Returns:
+        Summary line with throughput and retries
+
+    """
+    # The client is only needed when benchmarking it
+    from aoc.http import AoCClient, RetryPolicy, TokenBucket
+
+    config = FakeServerConfig(latency=latency, error_rate=0.05)
+    with FakeAoCServer(config) as server:
+        client = AoCClient(
+            "bench",
+            base_url=server.url,
+            limiter=TokenBucket(rate=1e6, capacity=1e6),
+            retry=RetryPolicy(attempts=5, base_delay=0.001),
+            pool_size=workers,
+            cache=False,
+        )
+        start = time.perf_counter()
+        with client, ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(lambda _: client.fetch_input(2016, 1), range(requests)))
+        elapsed = time.perf_counter() - start
+        sent = len(server.log)
+
+    return (
+        f"{requests} fetches in {elapsed:.2f}s ({requests / elapsed:.0f}/s) with "
+        f"{workers} workers, {sent - requests} retries after injected errors"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Serve the stand-in site or benchmark the client against it.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code
+
+    """
+    parser = argparse.ArgumentParser(prog="python -m aoc.fakeserver")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="serve until interrupted")
+    serve.add_argument("--port", type=int, default=8000)
+    serve.add_argument("--latency", type=float, default=0.0)
+    serve.add_argument("--error-rate", type=float, default=0.0)
+    serve.add_argument("--rate-limit", type=float)
+    bench = commands.add_parser("bench", help="measure client throughput")
+    bench.add_argument("--requests", type=int, default=200)
+    bench.add_argument("--workers", type=int, default=8)
+    bench.add_argument("--latency", type=float, default=0.01)
+    args = parser.parse_args(argv)
+
+    if args.command == "bench":
+        print(benchmark_client(args.requests, args.workers, args.latency))
+        return 0
+
+    config = FakeServerConfig(
+        latency=args.latency, error_rate=args.error_rate, rate_limit=args.rate_limit
+    )
+    server = FakeAoCServer(config, port=args.port)
+    print(f"Serving the committed puzzles on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,32 @@
-"""Helper utilities for the AoC solver."""
+"""Helper utilities for the AoC solver.
 
-import re
+This module is imported by every solution, so it must only depend on the
+standard library. HTML and markdown handling lives in aoc.markdown.
+"""
+
+import os
 import shutil
 import time
 from collections.abc import Iterator
 from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
+
+# Moved to aoc.markdown, still importable from here without the import cost
+_MARKDOWN_EXPORTS = ("generate_puzzle_markdown", "save_puzzle_markdown")
+
+
+def get_year_dir(year: int) -> Path:
+    """Get the directory holding all puzzles of a year.
+
+    Args:
+        year: Year of the puzzles
+
+    Returns:
+        Path to the year directory
 
-from bs4 import BeautifulSoup
-from markdownify import markdownify as md
+    """
+    return Path(__file__).parent / "puzzles" / f"year{year}"
 
 
 def get_puzzle_dir(year: int, day: int) -> Path:
@@ -22,7 +40,23 @@ def get_puzzle_dir(year: int, day: int) -> Path:
         Path to the puzzle directory
 
     """
-    return Path(__file__).parent / "puzzles" / f"year{year}" / f"day{day:02d}"
+    return get_year_dir(year) / f"day{day:02d}"
+
+
+def get_cache_dir() -> Path:
+    """Get the directory for local runner state (timings, caches, ...).
+
+    Defaults to ``.cache`` at the project root and can be overridden with the
+    AOC_CACHE_DIR environment variable. The directory is created if missing.
+
+    Returns:
+        Path to the cache directory
+
+    """
+    override = os.environ.get("AOC_CACHE_DIR")
+    path = Path(override) if override else Path(__file__).parent.parent / ".cache"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
 
 
 def ensure_puzzle_dir(year: int, day: int) -> Path:
@@ -41,6 +75,22 @@ def ensure_puzzle_dir(year: int, day: int) -> Path:
     return path
 
 
+def write_atomic(path: Path, text: str) -> None:
+    """Write a text file through a temporary file renamed into place.
+
+    An interrupted write leaves the previous file, or none, but never a
+    truncated one that later runs would take as complete.
+
+    Args:
+        path: File to write
+        text: New contents
+
+    """
+    partial = path.with_suffix(".part")
+    partial.write_text(text)
+    partial.replace(path)
+
+
 def wipe_puzzle(year: int, day: int) -> None:
     """Delete all puzzle files and tests for fresh start.
 
@@ -72,89 +122,13 @@ def read_puzzle_input(year: int, day: int) -> str:
         day: Day of the puzzle (1-25)
 
     Returns:
-        Raw input text with trailing whitespace stripped
-
-    """
-    input_path = get_puzzle_dir(year, day) / "input.txt"
-    return input_path.read_text().strip()
-
-
-def generate_puzzle_markdown(html: str, day: int) -> str:
-    """Generate puzzle markdown from AoC HTML.
-
-    Args:
-        html: Raw HTML from fetch_puzzle()
-        day: Day of the puzzle (1-25)
-
-    Returns:
-        Formatted markdown content for puzzle.md
-
-    Raises:
-        ValueError: If HTML structure doesn't match expected format
+        Raw input text with trailing whitespace stripped, memoized per process
+        until the file changes (see aoc.inputs)
 
     """
-    soup = BeautifulSoup(html, "html.parser")
-
-    # Extract title from first h2
-    title_tag = soup.find("h2")
-    if not title_tag:
-        msg = "Could not find puzzle title (h2 tag)"
-        raise ValueError(msg)
-
-    # Extract title (e.g., "--- Day 2: Bathroom Security ---" -> "Bathroom Security")
-    match = re.match(r"---\s*Day\s*\d+:\s*(.+?)\s*---", title_tag.get_text())
-    if not match:
-        msg = f"Unexpected title format: {title_tag.get_text()}"
-        raise ValueError(msg)
-    title = match.group(1)
-
-    # Find article tags (Part 1 and optionally Part 2)
-    articles = soup.find_all("article", class_="day-desc")
-    if not articles:
-        msg = "Could not find any article tags with class 'day-desc'"
-        raise ValueError(msg)
-
-    parts = [f"# Day {day}: {title}\n"]
-
-    # Process each article (Part 1, Part 2)
-    for i, article in enumerate(articles, 1):
-        # Convert article to markdown
-        article_md = md(str(article), heading_style="atx")
-        # Remove the heading (gets converted to ## by markdownify)
-        article_md = re.sub(r"^##\s*---.*?---\s*\n+", "", article_md)
-
-        part_name = "Part One" if i == 1 else "Part Two"
-        parts.append(f"\n## {part_name}\n\n{article_md.strip()}\n")
-
-        # Look for answer in next sibling <p> tag
-        answer_tag = article.find_next_sibling("p")
-        if answer_tag:
-            # Extract answer from <code> tag within the <p>
-            code_tag = answer_tag.find("code")
-            if code_tag:
-                answer = code_tag.get_text()
-                parts.append(f"\n**Your puzzle answer was `{answer}`.**\n")
-
-    return "\n".join(parts)
-
-
-def save_puzzle_markdown(html: str, year: int, day: int) -> Path:
-    """Generate and save puzzle markdown file.
+    from aoc.inputs import get_input  # Deferred: aoc.inputs builds on this module
 
-    Args:
-        html: Raw HTML from fetch_puzzle()
-        year: Year of the puzzle
-        day: Day of the puzzle (1-25)
-
-    Returns:
-        Path to the saved puzzle.md file
-
-    """
-    markdown = generate_puzzle_markdown(html, day)
-    puzzle_dir = ensure_puzzle_dir(year, day)
-    puzzle_path = puzzle_dir / "puzzle.md"
-    puzzle_path.write_text(markdown)
-    return puzzle_path
+    return get_input(year, day).text
 
 
 @contextmanager
@@ -176,3 +150,24 @@ def timer() -> Iterator[list[float]]:
         yield elapsed
     finally:
         elapsed[0] = time.perf_counter() - start
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily resolve the puzzle markdown helpers from aoc.markdown.
+
+    Args:
+        name: Attribute being looked up
+
+    Returns:
+        The requested function
+
+    Raises:
+        AttributeError: If the name is not a known helper
+
+    """
+    if name in _MARKDOWN_EXPORTS:
+        from aoc import markdown  # Deferred to keep html.parser off the solve path
+
+        return getattr(markdown, name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -1,40 +1,303 @@
 """HTTP client for interacting with Advent of Code."""
 
 import os
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+from aoc.httpcache import CachedPage, HttpCache
 
 # Load environment variables from .env file if it exists
 load_dotenv()
 
+BASE_URL = "https://adventofcode.com"
+
+
+def unlock_time(year: int, day: int) -> datetime:
+    """Get the moment a puzzle is released.
+
+    Puzzles unlock at midnight US Eastern time (UTC-5 in December).
+
+    Args:
+        year: Year of the puzzle
+        day: Day of the puzzle (1-25)
+
+    Returns:
+        Release time as an aware UTC datetime
+
+    """
+    return datetime(year, 12, day, 5, tzinfo=UTC)
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting the rate of requests.
+
+    The bucket holds up to ``capacity`` tokens and refills at ``rate`` tokens
+    per second. Each request takes one token, waiting for a refill when the
+    bucket is empty, so bursts of ``capacity`` requests go out at once and
+    sustained traffic is held to ``rate``.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Create a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+            clock: Monotonic clock in seconds
+            sleep: Function used to wait for tokens
+
+        Raises:
+            ValueError: If the rate or capacity is not positive
+
+        """
+        if rate <= 0 or capacity <= 0:
+            msg = "rate and capacity must be positive"
+            raise ValueError(msg)
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = capacity
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, possibly going into debt.
+
+        Returns:
+            Seconds to wait before the token may be used
+
+        """
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+
+    def acquire(self) -> float:
+        """Wait until a request may be sent.
+
+        Waiting happens outside the lock: each caller reserves its token
+        first, so concurrent callers queue up in order.
+
+        Returns:
+            Seconds spent waiting
+
+        """
+        wait = self._reserve()
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request.
+
+    Attributes:
+        attempts: Maximum number of attempts, including the first one
+        base_delay: Backoff before the first retry, in seconds; doubles on
+            each further retry
+        max_delay: Upper bound on a single backoff, in seconds
+        statuses: HTTP statuses worth retrying (transient server errors)
+
+    """
+
+    attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+    def __post_init__(self) -> None:
+        """Validate the policy.
+
+        Raises:
+            ValueError: If there is not at least one attempt
+
+        """
+        if self.attempts < 1:
+            msg = "attempts must be at least 1"
+            raise ValueError(msg)
+
+    def delay(self, retry: int, retry_after: str | None = None) -> float:
+        """Get the backoff before a retry, with full jitter.
+
+        Args:
+            retry: Number of the retry (0 for the first one)
+            retry_after: Value of the server's Retry-After header, if any
+
+        Returns:
+            Seconds to wait
+
+        """
+        if retry_after is not None and retry_after.isdigit():
+            return min(float(retry_after), self.max_delay)
+        ceiling = min(self.max_delay, self.base_delay * 2**retry)
+        return random.uniform(0, ceiling)  # noqa: S311 - jitter, not cryptography
+
+
+# At most one request per second on average, in bursts of up to five
+DEFAULT_RATE = 1.0
+DEFAULT_BURST = 5.0
+
 
 class AoCClient:
-    """Client for fetching puzzles, inputs, and submitting answers."""
+    """Client for fetching puzzles, inputs, and submitting answers.
+
+    Connections are pooled and kept alive across requests. Each thread gets
+    its own requests.Session, but all of them share one connection pool, one
+    rate limiter and one retry policy, so a client can be shared between
+    threads.
+    """
 
-    def __init__(self) -> None:
-        """Initialize the client with session cookie from environment.
+    def __init__(
+        self,
+        session: str | None = None,
+        base_url: str = BASE_URL,
+        limiter: TokenBucket | None = None,
+        retry: RetryPolicy | None = None,
+        timeout: float = 30,
+        pool_size: int = 10,
+        sleep: Callable[[float], None] = time.sleep,
+        cache: HttpCache | bool = True,
+    ) -> None:
+        """Initialize the client with a session cookie.
+
+        Args:
+            session: Session cookie (defaults to the AOC_SESSION environment
+                variable)
+            base_url: Server to talk to, without a trailing slash
+            limiter: Rate limiter shared by all requests (defaults to
+                DEFAULT_RATE requests per second in bursts of DEFAULT_BURST)
+            retry: Retry policy for transient failures
+            timeout: Timeout of each attempt, in seconds
+            pool_size: Maximum number of kept-alive connections
+            sleep: Function used to wait between retries
+            cache: HTTP cache of pages and inputs (True for a new HttpCache,
+                False to always download)
 
         Raises:
-            ValueError: If AOC_SESSION environment variable is not set
+            ValueError: If no session cookie is given and AOC_SESSION is not set
 
         """
-        self.session = os.environ.get("AOC_SESSION")
+        self.session = session or os.environ.get("AOC_SESSION")
         if not self.session:
             raise ValueError(
                 "AOC_SESSION environment variable not set. "
                 "Get your session cookie from adventofcode.com and set it with: "
                 "export AOC_SESSION='your_session_cookie'"
             )
+        self.base_url = base_url
         self.headers = {
             "User-Agent": "github.com/simon/claude-aoc by simon@example.com",
         }
         self.cookies = {"session": self.session}
-        self.timeout = 30  # 30 second timeout for all requests
+        self.timeout = timeout
+        self.limiter = limiter or TokenBucket(DEFAULT_RATE, DEFAULT_BURST)
+        self.retry = retry or RetryPolicy()
+        self.sleep = sleep
+        self.cache: HttpCache | None = HttpCache() if cache is True else cache or None
+        # Retries are handled here so they go through the rate limiter
+        self.adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=pool_size, max_retries=0
+        )
+        self._local = threading.local()
+
+    @property
+    def http(self) -> requests.Session:
+        """The calling thread's session, sharing the client's connection pool."""
+        http: requests.Session | None = getattr(self._local, "http", None)
+        if http is None:
+            http = requests.Session()
+            http.mount("http://", self.adapter)
+            http.mount("https://", self.adapter)
+            http.headers.update(self.headers)
+            http.cookies.update(self.cookies)
+            self._local.http = http
+        return http
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.adapter.close()
+
+    def __enter__(self) -> "AoCClient":
+        """Use the client as a context manager that closes its connections.
+
+        Returns:
+            The client itself
+
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the client's connections."""
+        self.close()
+
+    def request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        """Send a rate-limited request, retrying transient failures.
+
+        Connection errors, timeouts and the policy's retryable statuses are
+        retried with jittered exponential backoff (or the server's
+        Retry-After); other errors are raised at once.
+
+        Args:
+            method: HTTP method
+            path: Path on the server, starting with "/"
+            **kwargs: Extra arguments for requests.Session.request
+
+        Returns:
+            Successful response
+
+        Raises:
+            requests.HTTPError: If the final response has an error status
+            requests.ConnectionError: If the server stays unreachable
+            requests.Timeout: If the server keeps timing out
+
+        """
+        url = self.base_url + path
+        for attempt in range(self.retry.attempts - 1):
+            self.limiter.acquire()
+            try:
+                response = self.http.request(
+                    method, url, timeout=self.timeout, **kwargs
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                self.sleep(self.retry.delay(attempt))
+                continue
+            if response.status_code not in self.retry.statuses:
+                response.raise_for_status()
+                return response
+            self.sleep(self.retry.delay(attempt, response.headers.get("Retry-After")))
+
+        self.limiter.acquire()
+        response = self.http.request(method, url, timeout=self.timeout, **kwargs)
+        response.raise_for_status()
+        return response
 
     def fetch_puzzle(self, year: int, day: int) -> str:
         """Fetch puzzle HTML.
 
+        With a cache, a stored page is revalidated with a conditional request
+        and only downloaded again if the server reports a change.
+
         Args:
             year: Year of the puzzle
             day: Day of the puzzle (1-25)
@@ -43,16 +306,31 @@ class AoCClient:
             HTML content of the puzzle page
 
         """
-        url = f"https://adventofcode.com/{year}/day/{day}"
-        response = requests.get(
-            url, headers=self.headers, cookies=self.cookies, timeout=self.timeout
+        if self.cache is None:
+            return self.request("GET", f"/{year}/day/{day}").text
+
+        cached = self.cache.load_page(year, day)
+        headers = cached.conditional_headers if cached is not None else {}
+        response = self.request("GET", f"/{year}/day/{day}", headers=headers)
+        if response.status_code == requests.codes.not_modified and cached is not None:
+            self.cache.count("revalidated")
+            return cached.body
+
+        self.cache.count("misses")
+        page = CachedPage(
+            body=response.text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
         )
-        response.raise_for_status()
-        return response.text
+        self.cache.store_page(year, day, page)
+        return page.body
 
     def fetch_input(self, year: int, day: int) -> str:
         """Fetch input data.
 
+        With a cache, inputs are immutable: an existing input.txt is returned
+        without a request, and a downloaded input is saved as input.txt.
+
         Args:
             year: Year of the puzzle
             day: Day of the puzzle (1-25)
@@ -61,12 +339,17 @@ class AoCClient:
             Input data as text
 
         """
-        url = f"https://adventofcode.com/{year}/day/{day}/input"
-        response = requests.get(
-            url, headers=self.headers, cookies=self.cookies, timeout=self.timeout
-        )
-        response.raise_for_status()
-        return response.text
+        if self.cache is not None:
+            text = self.cache.load_input(year, day)
+            if text is not None:
+                self.cache.count("hits")
+                return text
+
+        text = self.request("GET", f"/{year}/day/{day}/input").text
+        if self.cache is not None:
+            self.cache.count("misses")
+            self.cache.store_input(year, day, text)
+        return text
 
     def submit_answer(
         self,
@@ -77,6 +360,9 @@ class AoCClient:
     ) -> str:
         """Submit answer and return response HTML.
 
+        Submissions are never retried on server errors, since a failed
+        response may still have been counted as an attempt.
+
         Args:
             year: Year of the puzzle
             day: Day of the puzzle (1-25)
@@ -87,14 +373,10 @@ class AoCClient:
             HTML response from submission
 
         """
-        url = f"https://adventofcode.com/{year}/day/{day}/answer"
         data = {"level": str(part), "answer": str(answer)}
-        response = requests.post(
-            url,
-            headers=self.headers,
-            cookies=self.cookies,
-            data=data,
-            timeout=self.timeout,
+        self.limiter.acquire()
+        response = self.http.post(
+            f"{self.base_url}/{year}/day/{day}/answer", data=data, timeout=self.timeout
         )
         response.raise_for_status()
         return response.text
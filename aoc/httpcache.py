@@ -0,0 +1,139 @@
+"""On-disk HTTP cache of puzzle pages and inputs.
+
+Puzzle pages are kept with their ETag and Last-Modified validators in a
+``.http-cache`` directory inside each puzzle directory, so they can be
+revalidated with a conditional request: the server answers 304 Not Modified
+until part 2 unlocks. Inputs never change once published, so an existing
+``input.txt`` is served without touching the network.
+"""
+
+import json
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from aoc.helpers import ensure_puzzle_dir, get_puzzle_dir, write_atomic
+
+
+@dataclass
+class CachedPage:
+    """A puzzle page with the validators needed to revalidate it.
+
+    Attributes:
+        body: Page HTML
+        etag: ETag header of the response (None if the server sent none)
+        last_modified: Last-Modified header of the response (None if absent)
+
+    """
+
+    body: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers turning a GET into a conditional request."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class CacheStats:
+    """How requests were answered.
+
+    Attributes:
+        hits: Served from disk without any request (inputs)
+        revalidated: Confirmed fresh by a 304 Not Modified response
+        misses: Downloaded in full
+
+    """
+
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+
+
+class HttpCache:
+    """Pages and inputs stored next to the puzzles they belong to."""
+
+    def __init__(self) -> None:
+        """Start with zeroed statistics."""
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def count(self, outcome: str) -> None:
+        """Count how a request was answered, safely across threads.
+
+        Args:
+            outcome: "hits", "revalidated" or "misses"
+
+        """
+        with self._lock:
+            setattr(self.stats, outcome, getattr(self.stats, outcome) + 1)
+
+    @staticmethod
+    def _page_path(year: int, day: int) -> Path:
+        return get_puzzle_dir(year, day) / ".http-cache" / "puzzle.json"
+
+    def load_page(self, year: int, day: int) -> CachedPage | None:
+        """Get the stored puzzle page.
+
+        Args:
+            year: Year of the puzzle
+            day: Day of the puzzle (1-25)
+
+        Returns:
+            The stored page, or None if there is none (or it is unreadable)
+
+        """
+        try:
+            return CachedPage(**json.loads(self._page_path(year, day).read_text()))
+        except (FileNotFoundError, json.JSONDecodeError, TypeError):
+            return None
+
+    def store_page(self, year: int, day: int, page: CachedPage) -> None:
+        """Store a puzzle page with its validators.
+
+        Args:
+            year: Year of the puzzle
+            day: Day of the puzzle (1-25)
+            page: Page to store
+
+        """
+        path = self._page_path(year, day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(path, json.dumps(asdict(page)))
+
+    @staticmethod
+    def load_input(year: int, day: int) -> str | None:
+        """Get the puzzle input if it was already fetched.
+
+        Args:
+            year: Year of the puzzle
+            day: Day of the puzzle (1-25)
+
+        Returns:
+            Contents of input.txt, or None if it does not exist
+
+        """
+        try:
+            return (get_puzzle_dir(year, day) / "input.txt").read_text()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def store_input(year: int, day: int, text: str) -> None:
+        """Save a freshly fetched input as the puzzle's input.txt.
+
+        Args:
+            year: Year of the puzzle
+            day: Day of the puzzle (1-25)
+            text: Input as served
+
+        """
+        # An interrupted write must never be taken as cached
+        write_atomic(ensure_puzzle_dir(year, day) / "input.txt", text)
@@ -0,0 +1,160 @@
+"""Memoized, memory-mapped access to puzzle inputs.
+
+An input file is mapped once per process and shared by every reader: the
+bytes are exposed as a ``memoryview`` of the mapping (no copy), the text is
+decoded once on first use, and lines can be iterated lazily as slices instead
+of splitting the whole input into a list. Entries are checked against the
+file's size and modification time on each lookup, so an edited input is
+picked up without restarting the process. Inputs are written by renaming a
+new file into place (see ``aoc.httpcache``); a mapped file must not be
+truncated in place while views of it are in use.
+
+Example:
+    puzzle = get_input(2016, 7)
+    for line in puzzle.lines():
+        ...
+    data = puzzle.data  # memoryview over the mapped file
+
+"""
+
+import mmap
+import os
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+from aoc.helpers import get_puzzle_dir
+
+_WHITESPACE = b" \t\n\r\x0b\x0c"
+
+
+def _signature(stat: os.stat_result) -> tuple[int, int, int]:
+    """Identify a version of a file: a rename or rewrite changes it."""
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class PuzzleInput:
+    """One input file, mapped into memory.
+
+    The views cover the input with leading and trailing whitespace removed,
+    like ``read_puzzle_input``.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Map a file.
+
+        Args:
+            path: Input file
+
+        """
+        self.path = path
+        stat = path.stat()
+        self.signature = _signature(stat)
+        self._text: str | None = None
+        self._buffer: mmap.mmap | bytes = b""  # Empty files cannot be mapped
+        with path.open("rb") as file:
+            if stat.st_size:
+                try:
+                    self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                except OSError:
+                    # No address space for a new mapping (e.g. under a memory
+                    # rlimit): a plain read still works
+                    self._buffer = file.read()
+        raw = memoryview(self._buffer)
+        start, end = 0, len(raw)
+        while start < end and raw[start] in _WHITESPACE:
+            start += 1
+        while end > start and raw[end - 1] in _WHITESPACE:
+            end -= 1
+        self._start, self._end = start, end
+
+    @property
+    def data(self) -> memoryview:
+        """Stripped input bytes, a view of the mapped file."""
+        return memoryview(self._buffer)[self._start : self._end]
+
+    @property
+    def text(self) -> str:
+        """Stripped input text, decoded once and shared."""
+        if self._text is None:
+            text = str(self.data, "utf-8")
+            # Same newlines as Path.read_text()
+            self._text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return self._text
+
+    def lines(self) -> Iterator[str]:
+        """Iterate over the lines of the text without building a list.
+
+        Yields:
+            Each line without its newline, as ``text.splitlines()`` would
+
+        """
+        text = self.text
+        start = 0
+        while (end := text.find("\n", start)) != -1:
+            yield text[start:end]
+            start = end + 1
+        if text:
+            yield text[start:]
+
+    def byte_lines(self) -> Iterator[memoryview]:
+        r"""Iterate over the lines of the mapped bytes without copying them.
+
+        Yields:
+            A view of each line, without its ``\n`` or ``\r\n`` ending
+
+        """
+        view = memoryview(self._buffer)
+        find = self._buffer.find
+        start, stop = self._start, self._end
+        while (end := find(b"\n", start, stop)) != -1:
+            line_end = end - 1 if end > start and view[end - 1] == ord("\r") else end
+            yield view[start:line_end]
+            start = end + 1
+        if stop > self._start:
+            yield view[start:stop]
+
+
+_cache: dict[Path, PuzzleInput] = {}
+_cache_lock = threading.Lock()
+
+
+def open_input(path: Path) -> PuzzleInput:
+    """Get the memoized mapping of an input file, reopening it if it changed.
+
+    Args:
+        path: Input file
+
+    Returns:
+        The shared PuzzleInput of the file
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+
+    """
+    stat = path.stat()
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached is None or cached.signature != _signature(stat):
+            cached = _cache[path] = PuzzleInput(path)
+        return cached
+
+
+def get_input(year: int, day: int) -> PuzzleInput:
+    """Get the memoized input of a puzzle.
+
+    Args:
+        year: Year of the puzzle
+        day: Day of the puzzle (1-25)
+
+    Returns:
+        The shared PuzzleInput of the puzzle's input.txt
+
+    """
+    return open_input(get_puzzle_dir(year, day) / "input.txt")
+
+
+def clear_inputs() -> None:
+    """Forget every memoized input."""
+    with _cache_lock:
+        _cache.clear()
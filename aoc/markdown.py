@@ -0,0 +1,542 @@
+"""Conversion of Advent of Code puzzle pages to markdown.
+
+Pages are read in a single pass of the standard library's ``html.parser``:
+the title, the ``article.day-desc`` elements and the answer ``<code>`` that
+follows each article are picked out while parsing, and only the articles are
+kept, as small element trees. The articles are converted with markdownify's
+rules (ATX headings, ``*`` bullets and emphasis, escaped ``*`` and ``_``), so
+the output matches the BeautifulSoup + markdownify conversion it replaces
+(see ``aoc.bench.markdown``).
+
+Converted pages are cached in memory by a hash of their HTML.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from html.parser import HTMLParser
+from pathlib import Path
+
+from aoc.helpers import ensure_puzzle_dir, write_atomic
+
+# Elements that never have children, as parsed by BeautifulSoup
+_VOID = frozenset(
+    {
+        "area", "base", "basefont", "bgsound", "br", "col", "command", "embed",
+        "frame", "hr", "image", "img", "input", "isindex", "keygen", "link",
+        "menuitem", "meta", "nextid", "param", "source", "spacer", "track", "wbr",
+    }
+)  # fmt: skip
+
+# Block elements whose leading and trailing whitespace is dropped
+_BLOCK = frozenset(
+    {
+        "p", "blockquote", "article", "div", "section", "ol", "ul", "li", "dl",
+        "dt", "dd", "table", "thead", "tbody", "tfoot", "tr", "td", "th",
+    }
+)  # fmt: skip
+
+_HEADING = re.compile(r"h(\d+)")
+_WHITESPACE = re.compile(r"[\t ]+")
+_ALL_WHITESPACE = re.compile(r"[\t \r\n]+")
+_NEWLINE_WHITESPACE = re.compile(r"[\t \r\n]*[\r\n][\t \r\n]*")
+_EDGE_NEWLINES = re.compile(r"^(\n*)((?:.*[^\n])?)(\n*)$", re.DOTALL)
+_LINE = re.compile(r"^(.*)", re.MULTILINE)
+_BACKTICKS = re.compile(r"`+")
+
+# Markdown of recently converted pages, keyed by (SHA-256 of the HTML, day)
+_CACHE: OrderedDict[tuple[str, int], str] = OrderedDict()
+_CACHE_SIZE = 64
+_CACHE_LOCK = threading.Lock()
+
+
+class _Comment(str):
+    """An HTML comment, kept only because it counts as a sibling."""
+
+    __slots__ = ()
+
+
+class _Element:
+    """An element of a captured article."""
+
+    __slots__ = ("attrs", "children", "name", "parent")
+
+    def __init__(
+        self, name: str, attrs: dict[str, str], parent: "_Element | None"
+    ) -> None:
+        self.name = name
+        self.attrs = attrs
+        self.parent = parent
+        self.children: list[_Element | str] = []
+
+
+_Node = _Element | str
+
+
+def _is_block(node: _Node | None) -> bool:
+    """Whether whitespace just inside the node is dropped."""
+    return isinstance(node, _Element) and (
+        node.name in _BLOCK or _HEADING.match(node.name) is not None
+    )
+
+
+def _is_block_or_pre(node: _Node | None) -> bool:
+    """Whether whitespace just outside the node is dropped."""
+    return _is_block(node) or (isinstance(node, _Element) and node.name == "pre")
+
+
+def _siblings(nodes: list[_Node], i: int) -> tuple[_Node | None, _Node | None]:
+    """Get the previous and next sibling of the i-th node."""
+    return (
+        nodes[i - 1] if i > 0 else None,
+        nodes[i + 1] if i + 1 < len(nodes) else None,
+    )
+
+
+def _next_content_sibling(element: _Element) -> _Node | None:
+    """Get the next sibling that is an element or non-blank text."""
+    if element.parent is None:
+        return None
+    siblings = element.parent.children
+    for node in siblings[siblings.index(element) + 1 :]:
+        if isinstance(node, _Element) or (
+            not isinstance(node, _Comment) and node.strip()
+        ):
+            return node
+    return None
+
+
+def _chomp(text: str) -> tuple[str, str, str]:
+    """Move the outer spaces of inline markup outside of it."""
+    prefix = " " if text and text[0] == " " else ""
+    suffix = " " if text and text[-1] == " " else ""
+    return prefix, suffix, text.strip()
+
+
+def _inline(symbol: str) -> Callable[[_Element, str, set[str]], str]:
+    """Build the conversion of a simple inline element like <em>."""
+
+    def convert(_: _Element, text: str, tags: set[str]) -> str:
+        if "_noformat" in tags:
+            return text
+        prefix, suffix, text = _chomp(text)
+        return f"{prefix}{symbol}{text}{symbol}{suffix}" if text else ""
+
+    return convert
+
+
+def _convert_a(element: _Element, text: str, tags: set[str]) -> str:
+    if "_noformat" in tags:
+        return text
+    prefix, suffix, text = _chomp(text)
+    if not text:
+        return ""
+    href = element.attrs.get("href")
+    title = element.attrs.get("title")
+    if text.replace(r"\_", "_") == href and not title:
+        return f"<{href}>"
+    title_part = ' "{}"'.format(title.replace('"', r"\"")) if title else ""
+    return f"{prefix}[{text}]({href}{title_part}){suffix}" if href else text
+
+
+def _convert_blockquote(_: _Element, text: str, tags: set[str]) -> str:
+    text = text.strip(" \t\r\n")
+    if "_inline" in tags:
+        return f" {text} "
+    if not text:
+        return "\n"
+    text = _LINE.sub(lambda m: "> " + m.group(1) if m.group(1) else ">", text)
+    return f"\n{text}\n\n"
+
+
+def _convert_br(_: _Element, text: str, tags: set[str]) -> str:
+    if "_inline" in tags:
+        return text + " " if text else " "
+    return "  \n" + text
+
+
+def _convert_code(_: _Element, text: str, tags: set[str]) -> str:
+    if "_noformat" in tags:
+        return text
+    prefix, suffix, text = _chomp(text)
+    if not text:
+        return ""
+    longest = max((len(run) for run in _BACKTICKS.findall(text)), default=0)
+    if longest:
+        text = f" {text} "
+    delimiter = "`" * (longest + 1)
+    return f"{prefix}{delimiter}{text}{delimiter}{suffix}"
+
+
+def _convert_div(_: _Element, text: str, tags: set[str]) -> str:
+    if "_inline" in tags:
+        return f" {text.strip()} "
+    text = text.strip()
+    return f"\n\n{text}\n\n" if text else ""
+
+
+def _convert_heading(element: _Element, text: str, tags: set[str]) -> str:
+    if "_inline" in tags:
+        return text
+    match = _HEADING.match(element.name)
+    level = max(1, min(6, int(match.group(1)))) if match else 1
+    text = _ALL_WHITESPACE.sub(" ", text.strip())
+    return f"\n\n{'#' * level} {text}\n\n"
+
+
+def _convert_img(element: _Element, _: str, tags: set[str]) -> str:
+    alt = element.attrs.get("alt") or ""
+    if "_inline" in tags:
+        return alt
+    src = element.attrs.get("src") or ""
+    title = element.attrs.get("title") or ""
+    title_part = ' "{}"'.format(title.replace('"', r"\"")) if title else ""
+    return f"![{alt}]({src}{title_part})"
+
+
+def _convert_li(element: _Element, text: str, _: set[str]) -> str:
+    text = text.strip()
+    if not text:
+        return "\n"
+    parent = element.parent
+    if parent is not None and parent.name == "ol":
+        start = parent.attrs.get("start", "")
+        number = int(start) if start.isnumeric() else 1
+        for sibling in parent.children:
+            if sibling is element:
+                break
+            if isinstance(sibling, _Element) and sibling.name == "li":
+                number += 1
+        bullet = f"{number}. "
+    else:
+        depth = -1
+        ancestor: _Element | None = element
+        while ancestor is not None:
+            depth += ancestor.name == "ul"
+            ancestor = ancestor.parent
+        bullet = "*+-"[depth % 3] + " "
+    indent = " " * len(bullet)
+    text = _LINE.sub(lambda m: indent + m.group(1) if m.group(1) else "", text)
+    return bullet + text[len(bullet) :] + "\n"
+
+
+def _convert_list(element: _Element, text: str, tags: set[str]) -> str:
+    if "li" in tags:
+        return "\n" + text.rstrip()
+    following = _next_content_sibling(element)
+    before_paragraph = following is not None and (
+        not isinstance(following, _Element) or following.name not in ("ul", "ol")
+    )
+    return "\n\n" + text + ("\n" if before_paragraph else "")
+
+
+def _convert_p(_: _Element, text: str, tags: set[str]) -> str:
+    text = text.strip(" \t\r\n")
+    if "_inline" in tags:
+        return f" {text} "
+    return f"\n\n{text}\n\n" if text else ""
+
+
+def _convert_pre(_: _Element, text: str, __: set[str]) -> str:
+    if not text:
+        return ""
+    text = re.sub(r"[ \n]*$", "", re.sub(r"^[ \n]*\n", "", text))
+    return f"\n\n```\n{text}\n```\n\n"
+
+
+def _drop(*_: object) -> str:
+    return ""
+
+
+_CONVERTERS: dict[str, Callable[[_Element, str, set[str]], str]] = {
+    "a": _convert_a,
+    "article": _convert_div,
+    "b": _inline("**"),
+    "blockquote": _convert_blockquote,
+    "br": _convert_br,
+    "code": _convert_code,
+    "del": _inline("~~"),
+    "div": _convert_div,
+    "em": _inline("*"),
+    "hr": lambda *_: "\n\n---\n\n",
+    "i": _inline("*"),
+    "img": _convert_img,
+    "kbd": _convert_code,
+    "li": _convert_li,
+    "ol": _convert_list,
+    "p": _convert_p,
+    "pre": _convert_pre,
+    "q": lambda _, text, __: f'"{text}"',
+    "s": _inline("~~"),
+    "samp": _convert_code,
+    "script": _drop,
+    "section": _convert_div,
+    "strong": _inline("**"),
+    "style": _drop,
+    "sub": _inline(""),
+    "sup": _inline(""),
+    "ul": _convert_list,
+}
+
+
+def _convert_text(
+    text: str,
+    previous: _Node | None,
+    following: _Node | None,
+    parent: _Element,
+    tags: set[str],
+) -> str:
+    """Normalize and escape a text node.
+
+    Args:
+        text: Text of the node
+        previous: Previous sibling, if any
+        following: Next sibling, if any
+        parent: Element containing the text
+        tags: Names of the enclosing elements and pseudo-tags
+
+    Returns:
+        Markdown text
+
+    """
+    if "pre" not in tags:
+        text = _WHITESPACE.sub(" ", _NEWLINE_WHITESPACE.sub("\n", text))
+    if "_noformat" not in tags:
+        text = text.replace("*", r"\*").replace("_", r"\_")
+    if _is_block_or_pre(previous) or (_is_block(parent) and not previous):
+        text = text.lstrip(" \t\r\n")
+    if _is_block_or_pre(following) or (_is_block(parent) and not following):
+        text = text.rstrip()
+    return text
+
+
+def _join(strings: list[str]) -> str:
+    """Join converted children, collapsing the newlines where they meet.
+
+    Args:
+        strings: Markdown of consecutive children
+
+    Returns:
+        Joined markdown, with at most two newlines between children
+
+    """
+    pieces = [""]
+    for string in filter(None, strings):
+        match = _EDGE_NEWLINES.match(string)
+        assert match is not None  # noqa: S101 - the pattern matches any string
+        leading, content, trailing = match.groups()
+        if pieces[-1] and leading:
+            leading = "\n" * min(2, max(len(pieces.pop()), len(leading)))
+        pieces.extend((leading, content, trailing))
+    return "".join(pieces)
+
+
+def _convert(element: _Element, tags: set[str]) -> str:
+    """Convert an element and its children to markdown.
+
+    Args:
+        element: Element to convert
+        tags: Names of the enclosing elements and pseudo-tags
+
+    Returns:
+        Markdown of the element
+
+    """
+    child_tags = tags | {element.name}
+    if _HEADING.match(element.name):
+        child_tags.add("_inline")
+    if element.name in ("pre", "code", "kbd", "samp"):
+        child_tags.add("_noformat")
+
+    block = _is_block(element)
+    nodes = element.children
+    strings = []
+    for i, node in enumerate(nodes):
+        if isinstance(node, _Element):
+            strings.append(_convert(node, child_tags))
+            continue
+        if isinstance(node, _Comment):
+            continue
+        previous, following = _siblings(nodes, i)
+        # Whitespace next to block boundaries carries no content
+        if not node.strip() and (
+            (block and (not previous or not following))
+            or _is_block_or_pre(previous)
+            or _is_block_or_pre(following)
+        ):
+            continue
+        strings.append(_convert_text(node, previous, following, element, child_tags))
+
+    text = "".join(strings) if "pre" in child_tags else _join(strings)
+    convert = _CONVERTERS.get(element.name)
+    if convert is None and _HEADING.match(element.name):
+        convert = _convert_heading
+    return text if convert is None else convert(element, text, tags)
+
+
+class _PageExtractor(HTMLParser):
+    """Collects the title, articles and answers of a puzzle page in one pass."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.title: str | None = None
+        self.articles: list[_Element] = []
+        self.answers: list[str | None] = []
+        self._stack: list[_Element] = []  # Open elements of the whole page
+        self._article: _Element | None = None
+        self._title: list[str] | None = None
+        self._title_element: _Element | None = None
+        # Articles whose answer is the next <p> sibling, by the article's parent
+        self._pending: list[tuple[int, _Element | None]] = []
+        self._answer_p: tuple[_Element, list[int]] | None = None
+        self._code: tuple[_Element, list[str]] | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        parent = self._stack[-1] if self._stack else None
+        element = _Element(tag, {k: v or "" for k, v in attrs}, parent)
+        if self._article is not None:
+            assert parent is not None  # noqa: S101 - the article is open
+            parent.children.append(element)
+        elif tag == "article" and "day-desc" in element.attrs.get("class", "").split():
+            self._article = element
+            element.parent = None  # Converted on its own
+            self._pending.append((len(self.articles), parent))
+        elif tag == "p" and any(p is parent for _, p in self._pending):
+            waiting = [i for i, p in self._pending if p is parent]
+            self._pending = [(i, p) for i, p in self._pending if p is not parent]
+            self._answer_p = (element, waiting)
+        elif tag == "code" and self._answer_p is not None and self._code is None:
+            self._code = (element, [])
+
+        if tag == "h2" and self.title is None and self._title is None:
+            self._title, self._title_element = [], element
+        if tag in _VOID:
+            self._close(element)
+        else:
+            self._stack.append(element)
+
+    def handle_endtag(self, tag: str) -> None:
+        for i in range(len(self._stack) - 1, -1, -1):
+            if self._stack[i].name == tag:
+                for element in reversed(self._stack[i:]):
+                    self._close(element)
+                del self._stack[i:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        if self._title is not None:
+            self._title.append(data)
+        if self._code is not None:
+            self._code[1].append(data)
+        if self._article is not None and self._stack:
+            children = self._stack[-1].children
+            if children and type(children[-1]) is str:
+                children[-1] += data
+            else:
+                children.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        if self._article is not None and self._stack:
+            self._stack[-1].children.append(_Comment(data))
+
+    def _close(self, element: _Element) -> None:
+        """Finish what an element was being read for."""
+        if element is self._article:
+            self.articles.append(element)
+            self.answers.append(None)
+            self._article = None
+        elif element is self._title_element and self._title is not None:
+            self.title = "".join(self._title)
+            self._title = None
+        if self._code is not None and element is self._code[0]:
+            assert self._answer_p is not None  # noqa: S101 - code is inside it
+            for i in self._answer_p[1]:
+                self.answers[i] = "".join(self._code[1])
+            self._code = None
+        elif self._answer_p is not None and element is self._answer_p[0]:
+            self._answer_p = None
+
+
+def generate_puzzle_markdown(html: str, day: int) -> str:
+    """Generate puzzle markdown from AoC HTML.
+
+    Args:
+        html: Raw HTML from fetch_puzzle()
+        day: Day of the puzzle (1-25)
+
+    Returns:
+        Formatted markdown content for puzzle.md
+
+    Raises:
+        ValueError: If HTML structure doesn't match expected format
+
+    """
+    key = (hashlib.sha256(html.encode()).hexdigest(), day)
+    with _CACHE_LOCK:
+        if (cached := _CACHE.get(key)) is not None:
+            _CACHE.move_to_end(key)
+            return cached
+
+    page = _PageExtractor()
+    page.feed(html)
+    page.close()
+
+    if page.title is None:
+        msg = "Could not find puzzle title (h2 tag)"
+        raise ValueError(msg)
+
+    # Extract title (e.g., "--- Day 2: Bathroom Security ---" -> "Bathroom Security")
+    match = re.match(r"---\s*Day\s*\d+:\s*(.+?)\s*---", page.title)
+    if not match:
+        msg = f"Unexpected title format: {page.title}"
+        raise ValueError(msg)
+    title = match.group(1)
+
+    if not page.articles:
+        msg = "Could not find any article tags with class 'day-desc'"
+        raise ValueError(msg)
+
+    parts = [f"# Day {day}: {title}\n"]
+
+    # Process each article (Part 1, Part 2)
+    for i, (article, answer) in enumerate(
+        zip(page.articles, page.answers, strict=True), 1
+    ):
+        article_md = _convert(article, set()).strip("\n")
+        # Remove the heading (converted to ## like any h2)
+        article_md = re.sub(r"^##\s*---.*?---\s*\n+", "", article_md)
+
+        part_name = "Part One" if i == 1 else "Part Two"
+        parts.append(f"\n## {part_name}\n\n{article_md.strip()}\n")
+
+        if answer is not None:
+            parts.append(f"\n**Your puzzle answer was `{answer}`.**\n")
+
+    markdown = "\n".join(parts)
+    with _CACHE_LOCK:
+        _CACHE[key] = markdown
+        if len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return markdown
+
+
+def save_puzzle_markdown(html: str, year: int, day: int) -> Path:
+    """Generate and save puzzle markdown file.
+
+    Args:
+        html: Raw HTML from fetch_puzzle()
+        year: Year of the puzzle
+        day: Day of the puzzle (1-25)
+
+    Returns:
+        Path to the saved puzzle.md file
+
+    """
+    markdown = generate_puzzle_markdown(html, day)
+    puzzle_dir = ensure_puzzle_dir(year, day)
+    puzzle_path = puzzle_dir / "puzzle.md"
+    # sync skips existing pages, so an interrupted write must not leave one
+    write_atomic(puzzle_path, markdown)
+    return puzzle_path
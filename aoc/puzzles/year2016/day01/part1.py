@@ -3,6 +3,10 @@
 Calculate Manhattan distance to Easter Bunny HQ following turn/walk instructions.
 """
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.01)
+
 
 def solve(puzzle_input: str) -> int:
     """Solve part 1.
@@ -3,6 +3,10 @@
 Find the first location visited twice while following instructions.
 """
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.01)
+
 
 def solve(puzzle_input: str) -> int:
     """Solve part 2.
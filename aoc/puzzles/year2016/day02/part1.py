@@ -3,6 +3,10 @@
 Find the bathroom code by following keypad navigation instructions.
 """
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.01)
+
 
 def solve(puzzle_input: str) -> str:
     """Solve part 1.
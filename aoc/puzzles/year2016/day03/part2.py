@@ -3,6 +3,10 @@
 Count valid triangles reading by columns instead of rows.
 """
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.02)
+
 
 def is_valid_triangle(a: int, b: int, c: int) -> bool:
     """Check if three sides form a valid triangle.
@@ -6,6 +6,12 @@ Validate encrypted room names using checksums.
 import re
 from collections import Counter
 
+from aoc.types import Budget, DayContext
+
+BUDGET = Budget(time=0.05)
+
+type Room = tuple[str, int, str]  # (encrypted_name, sector_id, checksum)
+
 
 def parse_room(room: str) -> tuple[str, int, str]:
     """Parse a room string into its components.
@@ -68,29 +74,61 @@ def is_real_room(room: str) -> bool:
     return checksum == expected_checksum
 
 
-def solve(puzzle_input: str) -> int:
-    """Solve part 1.
+def parse(puzzle_input: str) -> list[Room]:
+    """Parse every room of the input.
+
+    Args:
+        puzzle_input: Raw puzzle input string with one room per line
+
+    Returns:
+        List of (encrypted_name, sector_id, checksum) tuples
+
+    """
+    return [parse_room(line) for line in puzzle_input.strip().split("\n")]
+
+
+def real_rooms(rooms: list[Room]) -> list[Room]:
+    """Keep the rooms whose checksum matches their name.
+
+    Args:
+        rooms: Parsed rooms
+
+    Returns:
+        The real rooms, in input order
+
+    """
+    return [room for room in rooms if compute_checksum(room[0]) == room[2]]
+
+
+def solve_parsed(rooms: list[Room], ctx: DayContext) -> int:
+    """Solve part 1 on parsed rooms.
 
     Approach:
-        Parse each room to extract encrypted name, sector ID, and checksum.
         Compute expected checksum by counting letter frequencies.
         Sum sector IDs of rooms with valid checksums.
 
     Args:
-        puzzle_input: Raw puzzle input string with one room per line
+        rooms: Parsed rooms
+        ctx: Day context (the real rooms are shared with part 2)
 
     Returns:
         The sum of sector IDs for real rooms
 
     """
-    sector_sum = 0
+    return sum(sector_id for _, sector_id, _ in ctx.share(real_rooms, rooms))
+
+
+def solve(puzzle_input: str) -> int:
+    """Solve part 1.
+
+    Args:
+        puzzle_input: Raw puzzle input string with one room per line
 
-    for line in puzzle_input.strip().split("\n"):
-        if is_real_room(line):
-            _, sector_id, _ = parse_room(line)
-            sector_sum += sector_id
+    Returns:
+        The sum of sector IDs for real rooms
 
-    return sector_sum
+    """
+    return solve_parsed(parse(puzzle_input), DayContext())
 
 
 if __name__ == "__main__":
@@ -4,6 +4,10 @@ Decrypt room names using Caesar cipher to find North Pole objects.
 """
 
 from aoc.puzzles.year2016.day04 import part1
+from aoc.puzzles.year2016.day04.part1 import Room, parse
+from aoc.types import Budget, DayContext
+
+BUDGET = Budget(time=0.1)
 
 
 def decrypt_name(encrypted_name: str, sector_id: int) -> str:
@@ -31,35 +35,47 @@ def decrypt_name(encrypted_name: str, sector_id: int) -> str:
     return "".join(decrypted)
 
 
-def solve(puzzle_input: str) -> int:
-    """Solve part 2.
+def solve_parsed(rooms: list[Room], ctx: DayContext) -> int:
+    """Solve part 2 on parsed rooms.
 
     Approach:
-        Filter real rooms using Part 1 validation.
+        Filter real rooms using Part 1 validation (shared with part 1).
         Decrypt each room name using Caesar cipher.
         Find the room containing "northpole" or "north pole" in its name.
         Return its sector ID.
 
     Args:
-        puzzle_input: Raw puzzle input string with one room per line
+        rooms: Parsed rooms
+        ctx: Day context
 
     Returns:
         The sector ID of the room where North Pole objects are stored
 
     """
-    for line in puzzle_input.strip().split("\n"):
-        if part1.is_real_room(line):
-            encrypted_name, sector_id, _ = part1.parse_room(line)
-            decrypted_name = decrypt_name(encrypted_name, sector_id)
+    for encrypted_name, sector_id, _ in ctx.share(part1.real_rooms, rooms):
+        decrypted_name = decrypt_name(encrypted_name, sector_id)
 
-            # Check if this is the North Pole storage room
-            if "northpole" in decrypted_name.replace(" ", ""):
-                return sector_id
+        # Check if this is the North Pole storage room
+        if "northpole" in decrypted_name.replace(" ", ""):
+            return sector_id
 
     # No North Pole room found (shouldn't happen)
     return 0
 
 
+def solve(puzzle_input: str) -> int:
+    """Solve part 2.
+
+    Args:
+        puzzle_input: Raw puzzle input string with one room per line
+
+    Returns:
+        The sector ID of the room where North Pole objects are stored
+
+    """
+    return solve_parsed(parse(puzzle_input), DayContext())
+
+
 if __name__ == "__main__":
     from aoc.helpers import read_puzzle_input
 
@@ -5,6 +5,10 @@ Find password by computing MD5 hashes with incrementing indices.
 
 import hashlib
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=60)
+
 
 def solve(puzzle_input: str) -> str:
     """Solve part 1.
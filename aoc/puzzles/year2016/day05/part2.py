@@ -5,6 +5,10 @@ Find password using position-based MD5 hash decryption.
 
 import hashlib
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=150)
+
 
 def solve(puzzle_input: str) -> str:
     """Solve part 2.
@@ -5,6 +5,10 @@ Decode message by finding least frequent character per column.
 
 from collections import Counter
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.01)
+
 
 def solve(puzzle_input: str) -> str:
     """Solve part 2.
@@ -5,6 +5,10 @@ Count IPv7 addresses that support TLS.
 
 import re
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.1)
+
 
 def has_abba(text: str) -> bool:
     """Check if text contains an ABBA pattern.
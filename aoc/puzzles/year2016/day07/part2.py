@@ -5,6 +5,10 @@ Count IPv7 addresses that support SSL.
 
 import re
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.1)
+
 
 def find_abas(text: str) -> set[str]:
     """Find all ABA patterns in text.
@@ -5,6 +5,10 @@ Count lit pixels after executing screen instructions.
 
 import re
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.01)
+
 
 class Screen:
     """Represents a pixel screen with rotation operations."""
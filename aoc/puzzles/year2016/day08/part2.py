@@ -4,6 +4,9 @@ Read the code displayed on the screen.
 """
 
 from aoc.puzzles.year2016.day08.part1 import Screen
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.02)
 
 
 def render_screen(screen: Screen) -> str:
@@ -3,6 +3,9 @@
 Calculate decompressed length of compressed file.
 """
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.01)
 
 
 def decompress_length(compressed: str) -> int:
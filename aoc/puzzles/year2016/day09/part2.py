@@ -3,6 +3,10 @@
 Calculate decompressed length with recursive marker processing.
 """
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.02)
+
 
 def decompress_length_v2(compressed: str) -> int:
     """Calculate decompressed length with recursive marker processing.
@@ -7,6 +7,10 @@ import re
 from collections import defaultdict
 from typing import TypedDict
 
+from aoc.types import Budget, DayContext
+
+BUDGET = Budget(time=0.02)
+
 
 class BotRule(TypedDict):
     """Bot rule specifying where to send low and high chips."""
@@ -60,33 +64,38 @@ def parse_instructions(
     return bot_rules, initial_assignments
 
 
-def simulate(
+type Factory = tuple[dict[int, BotRule], list[tuple[int, int]]]
+
+
+def run_factory(
     bot_rules: dict[int, BotRule],
     initial_assignments: list[tuple[int, int]],
-    target_low: int,
-    target_high: int,
-) -> int:
-    """Simulate bot factory and find bot comparing target chips.
+    stop_at: tuple[int, int] | None = None,
+) -> tuple[dict[tuple[int, int], int], dict[int, int]]:
+    """Simulate the bot factory, recording every comparison.
 
     Args:
         bot_rules: Dict mapping bot_id to its rule
         initial_assignments: List of (chip_value, bot_id) tuples
-        target_low: Lower target chip value
-        target_high: Higher target chip value
+        stop_at: Stop as soon as a bot compares this (low, high) pair of chips
+            (None to run until no bot holds two chips)
 
     Returns:
-        Bot ID that compares the target chips
+        Tuple of (comparisons, outputs)
+        - comparisons: Dict mapping (low_chip, high_chip) to the first bot
+          comparing them
+        - outputs: Dict mapping output_id to chip value
 
     """
     # Track chips held by each bot
     bot_chips: dict[int, list[int]] = defaultdict(list)
+    comparisons: dict[tuple[int, int], int] = {}
     outputs: dict[int, int] = {}
 
     # Initial chip assignments
     for chip_value, bot_id in initial_assignments:
         bot_chips[bot_id].append(chip_value)
 
-    # Process until we find the target bot
     while True:
         # Find a bot with 2 chips
         active_bot = None
@@ -102,10 +111,11 @@ def simulate(
         # Get the chips and sort them
         chips = sorted(bot_chips[active_bot])
         low_chip, high_chip = chips[0], chips[1]
+        comparisons.setdefault((low_chip, high_chip), active_bot)
 
         # Check if this is the target bot
-        if low_chip == target_low and high_chip == target_high:
-            return active_bot
+        if (low_chip, high_chip) == stop_at:
+            break
 
         # Clear this bot's chips
         bot_chips[active_bot] = []
@@ -125,15 +135,66 @@ def simulate(
         else:
             outputs[rule["high_id"]] = high_chip
 
-    return -1  # Target not found
+    return comparisons, outputs
 
 
-def solve(puzzle_input: str) -> str:
-    """Solve part 1.
+def simulate(
+    bot_rules: dict[int, BotRule],
+    initial_assignments: list[tuple[int, int]],
+    target_low: int,
+    target_high: int,
+) -> int:
+    """Simulate bot factory and find bot comparing target chips.
+
+    Args:
+        bot_rules: Dict mapping bot_id to its rule
+        initial_assignments: List of (chip_value, bot_id) tuples
+        target_low: Lower target chip value
+        target_high: Higher target chip value
+
+    Returns:
+        Bot ID that compares the target chips (-1 if none does)
+
+    """
+    target = (target_low, target_high)
+    comparisons, _ = run_factory(bot_rules, initial_assignments, stop_at=target)
+    return comparisons.get(target, -1)
+
+
+def parse(puzzle_input: str) -> Factory:
+    """Parse the input once for both parts.
+
+    Args:
+        puzzle_input: Raw puzzle input string
+
+    Returns:
+        Tuple of (bot_rules, initial_assignments)
+
+    """
+    return parse_instructions(puzzle_input)
+
+
+def solve_parsed(factory: Factory, ctx: DayContext) -> str:
+    """Solve part 1 on the parsed instructions.
 
     Approach:
-        Parse instructions, then simulate the bot factory until
-        we find the bot that compares chips 61 and 17.
+        Run the whole factory once (shared with part 2) and look up the
+        bot that compared chips 61 and 17.
+
+    Args:
+        factory: Tuple of (bot_rules, initial_assignments)
+        ctx: Day context
+
+    Returns:
+        The bot ID that compares chips 61 and 17
+
+    """
+    comparisons, _ = ctx.share(run_factory, *factory)
+    return str(comparisons.get((17, 61), -1))
+
+
+def solve(puzzle_input: str) -> str:
+    """Solve part 1.
 
     Args:
         puzzle_input: Raw puzzle input string
@@ -142,9 +203,7 @@ def solve(puzzle_input: str) -> str:
         The bot ID that compares chips 61 and 17
 
     """
-    bot_rules, initial_assignments = parse_instructions(puzzle_input)
-    bot_id = simulate(bot_rules, initial_assignments, 17, 61)
-    return str(bot_id)
+    return solve_parsed(parse(puzzle_input), DayContext())
 
 
 if __name__ == "__main__":
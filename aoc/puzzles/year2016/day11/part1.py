@@ -8,6 +8,11 @@ from collections import deque
 from itertools import combinations
 from typing import NamedTuple
 
+from aoc.spans import span
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.5, memory=2 * 2**20)
+
 
 class State(NamedTuple):
     """Represents a state in the search space."""
@@ -250,29 +255,170 @@ def solve(puzzle_input: str) -> str:
         Minimum number of steps
 
     """
-    initial_state = parse_input(puzzle_input)
+    with span("parse"):
+        initial_state = parse_input(puzzle_input)
     goal_items = tuple((3, 3) for _ in initial_state.items)
 
-    queue = deque([(initial_state, 0)])
-    visited = {canonical_state(initial_state)}
+    with span("bfs"):
+        queue = deque([(initial_state, 0)])
+        visited = {canonical_state(initial_state)}
+
+        while queue:
+            state, steps = queue.popleft()
+
+            # Check if we've reached the goal
+            if state.items == goal_items:
+                return str(steps)
+
+            # Generate next states
+            for next_state in get_next_states(state):
+                canon = canonical_state(next_state)
+                if canon not in visited:
+                    visited.add(canon)
+                    queue.append((next_state, steps + 1))
+
+    return "-1"  # No solution found
+
+
+def to_bitboard(state: State) -> tuple[int, ...]:
+    """Pack the items of a state into one bitmask per floor.
+
+    Bit ``i`` stands for the generator of element ``i`` and bit ``n + i`` for
+    its microchip, ``n`` being the number of elements.
+
+    Args:
+        state: State to pack
+
+    Returns:
+        Item bitmask of each floor
+
+    """
+    count = len(state.items)
+    floors = [0, 0, 0, 0]
+    for elem_idx, (gen_floor, chip_floor) in enumerate(state.items):
+        floors[gen_floor] |= 1 << elem_idx
+        floors[chip_floor] |= 1 << (count + elem_idx)
+    return tuple(floors)
+
+
+def is_safe_bitboard(items: int, count: int) -> bool:
+    """Check that no microchip on a floor gets fried, on a bitmask.
+
+    Args:
+        items: Item bitmask of the floor
+        count: Number of elements
+
+    Returns:
+        True if the floor configuration is safe
+
+    """
+    generators = items & ((1 << count) - 1)
+    return not generators or not (items >> count) & ~generators
+
+
+def bitboard_key(
+    elevator: int, floors: tuple[int, ...], count: int
+) -> tuple[int, tuple[tuple[int, int], ...]]:
+    """Canonical form of a packed state, ignoring element identities.
+
+    Args:
+        elevator: Current floor
+        floors: Item bitmask of each floor
+        count: Number of elements
+
+    Returns:
+        Elevator floor and sorted (generator, microchip) floor pairs
+
+    """
+    gen_floors = [0] * count
+    chip_floors = [0] * count
+    for floor_idx, items in enumerate(floors):
+        for elem_idx in range(count):
+            if items >> elem_idx & 1:
+                gen_floors[elem_idx] = floor_idx
+            if items >> (count + elem_idx) & 1:
+                chip_floors[elem_idx] = floor_idx
+    return elevator, tuple(sorted(zip(gen_floors, chip_floors, strict=True)))
+
+
+def next_bitboards(
+    elevator: int, floors: tuple[int, ...], count: int
+) -> list[tuple[int, tuple[int, ...]]]:
+    """Generate the valid moves from a packed state.
+
+    Going down to empty floors never helps, so those moves are skipped.
+
+    Args:
+        elevator: Current floor
+        floors: Item bitmask of each floor
+        count: Number of elements
+
+    Returns:
+        (elevator, floors) of every valid next state
 
-    while queue:
-        state, steps = queue.popleft()
+    """
+    here = floors[elevator]
+    bits = [1 << i for i in range(2 * count) if here >> i & 1]
+    loads = bits + [a | b for a, b in combinations(bits, 2)]
+    targets = [elevator + 1] if elevator < 3 else []
+    if any(floors[:elevator]):
+        targets.append(elevator - 1)
+    moves = []
+    for target in targets:
+        for load in loads:
+            left = here & ~load
+            arrived = floors[target] | load
+            if is_safe_bitboard(left, count) and is_safe_bitboard(arrived, count):
+                new_floors = list(floors)
+                new_floors[elevator] = left
+                new_floors[target] = arrived
+                moves.append((target, tuple(new_floors)))
+    return moves
+
+
+def solve_bitboard(puzzle_input: str) -> str:
+    """Solve part 1 with each floor packed into an integer bitmask.
 
-        # Check if we've reached the goal
-        if state.items == goal_items:
-            return str(steps)
+    Approach:
+        Same BFS over canonical states as solve, but moves and safety checks
+        are integer bit operations on the two floors a move touches instead
+        of rebuilding and validating every floor.
 
-        # Generate next states
-        for next_state in get_next_states(state):
-            canon = canonical_state(next_state)
-            if canon not in visited:
-                visited.add(canon)
-                queue.append((next_state, steps + 1))
+    Args:
+        puzzle_input: Raw puzzle input string
+
+    Returns:
+        Minimum number of steps
+
+    """
+    with span("parse"):
+        initial_state = parse_input(puzzle_input)
+    count = len(initial_state.items)
+    goal = (0, 0, 0, (1 << (2 * count)) - 1)
+
+    with span("bfs"):
+        frontier = [(0, to_bitboard(initial_state))]
+        visited = {bitboard_key(*frontier[0], count)}
+        steps = 0
+        while frontier:
+            next_frontier = []
+            for elevator, floors in frontier:
+                if floors == goal:
+                    return str(steps)
+                for move in next_bitboards(elevator, floors, count):
+                    key = bitboard_key(*move, count)
+                    if key not in visited:
+                        visited.add(key)
+                        next_frontier.append(move)
+            frontier = next_frontier
+            steps += 1
 
     return "-1"  # No solution found
 
 
+VARIANTS = {"bitboard": solve_bitboard}
+
+
 if __name__ == "__main__":
     from aoc.helpers import read_puzzle_input
 
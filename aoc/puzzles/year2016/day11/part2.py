@@ -3,24 +3,23 @@
 Add 4 extra items and find minimum steps.
 """
 
+from aoc.puzzles.year2016.day11 import part1
 from aoc.puzzles.year2016.day11.part1 import solve as solve_part1
+from aoc.types import Budget
 
+BUDGET = Budget(time=10, memory=8 * 2**20)
 
-def solve(puzzle_input: str) -> str:
-    """Solve part 2.
 
-    Approach:
-        Add elerium and dilithium generators/chips to first floor,
-        then use the same BFS algorithm as Part 1.
+def add_extra_items(puzzle_input: str) -> str:
+    """Add the elerium and dilithium items to the first floor.
 
     Args:
         puzzle_input: Raw puzzle input string
 
     Returns:
-        Minimum number of steps with extra items
+        Puzzle input listing the extra items
 
     """
-    # Modify the first line to include the extra items
     lines = puzzle_input.strip().split("\n")
     first_line = lines[0]
 
@@ -37,9 +36,40 @@ def solve(puzzle_input: str) -> str:
         first_line = first_line + ", " + extra_items
 
     lines[0] = first_line
-    modified_input = "\n".join(lines)
+    return "\n".join(lines)
+
+
+def solve(puzzle_input: str) -> str:
+    """Solve part 2.
+
+    Approach:
+        Add elerium and dilithium generators/chips to first floor,
+        then use the same BFS algorithm as Part 1.
+
+    Args:
+        puzzle_input: Raw puzzle input string
+
+    Returns:
+        Minimum number of steps with extra items
+
+    """
+    return solve_part1(add_extra_items(puzzle_input))
+
+
+def solve_bitboard(puzzle_input: str) -> str:
+    """Solve part 2 with each floor packed into an integer bitmask.
+
+    Args:
+        puzzle_input: Raw puzzle input string
+
+    Returns:
+        Minimum number of steps with extra items
+
+    """
+    return part1.solve_bitboard(add_extra_items(puzzle_input))
+
 
-    return solve_part1(modified_input)
+VARIANTS = {"bitboard": solve_bitboard}
 
 
 if __name__ == "__main__":
@@ -3,6 +3,10 @@
 Execute assembunny code and return value in register a.
 """
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=2)
+
 
 def execute(instructions: list[str], registers: dict[str, int]) -> dict[str, int]:
     """Execute assembunny instructions.
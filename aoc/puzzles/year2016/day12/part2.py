@@ -4,6 +4,9 @@ Execute assembunny code with register c initialized to 1.
 """
 
 from aoc.puzzles.year2016.day12.part1 import execute
+from aoc.types import Budget
+
+BUDGET = Budget(time=60)
 
 
 def solve(puzzle_input: str) -> str:
@@ -5,6 +5,10 @@ Find shortest path in procedurally generated maze.
 
 from collections import deque
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.01)
+
 
 def is_open_space(x: int, y: int, favorite: int) -> bool:
     """Check if a coordinate is an open space.
@@ -6,6 +6,9 @@ Count locations reachable in at most 50 steps.
 from collections import deque
 
 from aoc.puzzles.year2016.day13.part1 import is_open_space
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.01)
 
 
 def count_reachable(favorite: int, max_steps: int) -> int:
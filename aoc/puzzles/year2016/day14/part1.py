@@ -5,6 +5,10 @@ Find 64th one-time pad key index using MD5 hashes.
 
 import hashlib
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=10)
+
 
 def get_hash(salt: str, index: int) -> str:
     """Generate MD5 hash for salt + index.
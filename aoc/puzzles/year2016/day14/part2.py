@@ -6,6 +6,10 @@ Same as Part 1 but with key stretching (rehash 2016 times).
 import hashlib
 
 from aoc.puzzles.year2016.day14.part1 import find_triplet, has_quintuplet
+from aoc.spans import span
+from aoc.types import Budget
+
+BUDGET = Budget(time=100)
 
 
 def get_stretched_hash(salt: str, index: int) -> str:
@@ -42,23 +46,27 @@ def find_64th_key_stretched(salt: str) -> int:
 
     def get_hash(idx: int) -> str:
         if idx not in hash_cache:
-            hash_cache[idx] = get_stretched_hash(salt, idx)
+            # Each miss stretches a hash (over a millisecond), so the span's
+            # own overhead stays negligible
+            with span("hashing"):
+                hash_cache[idx] = get_stretched_hash(salt, idx)
         return hash_cache[idx]
 
-    while keys_found < 64:
-        hash_str = get_hash(index)
-        triplet = find_triplet(hash_str)
-
-        if triplet:
-            for j in range(index + 1, index + 1001):
-                next_hash = get_hash(j)
-                if has_quintuplet(next_hash, triplet):
-                    keys_found += 1
-                    if keys_found == 64:
-                        return index
-                    break
-
-        index += 1
+    with span("scan"):
+        while keys_found < 64:
+            hash_str = get_hash(index)
+            triplet = find_triplet(hash_str)
+
+            if triplet:
+                for j in range(index + 1, index + 1001):
+                    next_hash = get_hash(j)
+                    if has_quintuplet(next_hash, triplet):
+                        keys_found += 1
+                        if keys_found == 64:
+                            return index
+                        break
+
+            index += 1
 
     return -1
 
@@ -5,6 +5,10 @@ Find first time to press button so capsule passes through all discs.
 
 import re
 
+from aoc.types import Budget, DayContext
+
+BUDGET = Budget(time=0.2)
+
 
 def parse_discs(puzzle_input: str) -> list[tuple[int, int, int]]:
     """Parse disc configuration.
@@ -30,25 +34,19 @@ def parse_discs(puzzle_input: str) -> list[tuple[int, int, int]]:
     return discs
 
 
-def solve(puzzle_input: str) -> str:
-    """Solve part 1.
-
-    Approach:
-        For capsule to pass, each disc must be at position 0 when
-        capsule reaches it. Disc i is reached at time t+i.
-        Find minimum t where (start_pos + t + disc_num) % positions == 0
-        for all discs.
+def first_time(discs: list[tuple[int, int, int]], start: int = 0, step: int = 1) -> int:
+    """Find the first time the capsule passes through every disc.
 
     Args:
-        puzzle_input: Raw puzzle input string
+        discs: List of (disc_num, positions, start_pos) tuples
+        start: First time to try
+        step: Interval between the times tried
 
     Returns:
-        First time to press button
+        First time to press button, among start, start + step, ...
 
     """
-    discs = parse_discs(puzzle_input)
-
-    t = 0
+    t = start
     while True:
         success = True
         for disc_num, positions, start_pos in discs:
@@ -59,9 +57,55 @@ def solve(puzzle_input: str) -> str:
                 break
 
         if success:
-            return str(t)
+            return t
+
+        t += step
+
+
+def parse(puzzle_input: str) -> list[tuple[int, int, int]]:
+    """Parse the discs once for both parts.
+
+    Args:
+        puzzle_input: Raw puzzle input string
+
+    Returns:
+        List of (disc_num, positions, start_pos) tuples
+
+    """
+    return parse_discs(puzzle_input)
+
 
-        t += 1
+def solve_parsed(discs: list[tuple[int, int, int]], ctx: DayContext) -> str:
+    """Solve part 1 on the parsed discs.
+
+    Approach:
+        For capsule to pass, each disc must be at position 0 when
+        capsule reaches it. Disc i is reached at time t+i.
+        Find minimum t where (start_pos + t + disc_num) % positions == 0
+        for all discs.
+
+    Args:
+        discs: List of (disc_num, positions, start_pos) tuples
+        ctx: Day context (part 2 continues from this time)
+
+    Returns:
+        First time to press button
+
+    """
+    return str(ctx.share(first_time, discs))
+
+
+def solve(puzzle_input: str) -> str:
+    """Solve part 1.
+
+    Args:
+        puzzle_input: Raw puzzle input string
+
+    Returns:
+        First time to press button
+
+    """
+    return solve_parsed(parse(puzzle_input), DayContext())
 
 
 if __name__ == "__main__":
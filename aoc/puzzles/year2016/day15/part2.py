@@ -3,41 +3,48 @@
 Add one more disc and find first time.
 """
 
-from aoc.puzzles.year2016.day15.part1 import parse_discs
+import math
 
+from aoc.puzzles.year2016.day15.part1 import first_time, parse
+from aoc.types import Budget, DayContext
 
-def solve(puzzle_input: str) -> str:
-    """Solve part 2.
+BUDGET = Budget(time=0.2)
+
+
+def solve_parsed(discs: list[tuple[int, int, int]], ctx: DayContext) -> str:
+    """Solve part 2 on the parsed discs.
 
     Approach:
-        Add a 7th disc with 11 positions starting at position 0.
+        Add a disc with 11 positions starting at position 0 below the
+        others. Every time the original discs let the capsule through is
+        part 1's answer plus a multiple of the lcm of their sizes, so only
+        those times are tried.
 
     Args:
-        puzzle_input: Raw puzzle input string
+        discs: List of (disc_num, positions, start_pos) tuples
+        ctx: Day context (holds part 1's answer)
 
     Returns:
         First time to press button with extra disc
 
     """
-    lines = puzzle_input.strip().split("\n")
-    lines.append("Disc #7 has 11 positions; at time=0, it is at position 0.")
-    modified_input = "\n".join(lines)
+    start = ctx.share(first_time, discs)
+    step = math.lcm(*(positions for _, positions, _ in discs))
+    extra_disc = (len(discs) + 1, 11, 0)
+    return str(first_time([extra_disc], start, step))
 
-    discs = parse_discs(modified_input)
 
-    t = 0
-    while True:
-        success = True
-        for disc_num, positions, start_pos in discs:
-            disc_position = (start_pos + t + disc_num) % positions
-            if disc_position != 0:
-                success = False
-                break
+def solve(puzzle_input: str) -> str:
+    """Solve part 2.
 
-        if success:
-            return str(t)
+    Args:
+        puzzle_input: Raw puzzle input string
+
+    Returns:
+        First time to press button with extra disc
 
-        t += 1
+    """
+    return solve_parsed(parse(puzzle_input), DayContext())
 
 
 if __name__ == "__main__":
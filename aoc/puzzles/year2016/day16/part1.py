@@ -3,6 +3,14 @@
 Generate data using modified dragon curve and compute checksum.
 """
 
+from itertools import pairwise
+
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.01)
+
+FLIP = str.maketrans("01", "10")
+
 
 def dragon_curve(data: str) -> str:
     """Apply one iteration of the modified dragon curve.
@@ -81,6 +89,82 @@ def solve(puzzle_input: str, disk_length: int = 272) -> str:
     return compute_checksum(data)
 
 
+def count_joiner_ones(count: int) -> int:
+    """Count the ones among the first joiner digits of the dragon curve.
+
+    The digits inserted between copies of the initial state form the regular
+    paperfolding sequence: joiner ``i`` (from 1) is 1 exactly when the odd
+    part of ``i`` is 3 modulo 4.
+
+    Args:
+        count: Number of joiner digits
+
+    Returns:
+        Number of ones among them
+
+    """
+    ones = 0
+    while count:
+        ones += (count + 1) // 4  # Odd numbers up to count that are 3 mod 4
+        count >>= 1
+    return ones
+
+
+def count_disk_ones(initial: str, length: int) -> int:
+    """Count the ones in the first digits of the disk without building it.
+
+    The disk repeats ``a 0 b j a j b j ...``: the initial state ``a``, its
+    flipped reverse ``b`` and the joiner digits in between. Each ``a b``
+    pair holds as many ones as ``a`` has digits.
+
+    Args:
+        initial: Initial state
+        length: Number of leading digits to count
+
+    Returns:
+        Number of ones among them
+
+    """
+    size = len(initial)
+    blocks, rest = divmod(length, size + 1)
+    ones = (blocks // 2) * size + count_joiner_ones(blocks)
+    if blocks % 2:
+        ones += initial.count("1")
+    block = initial if blocks % 2 == 0 else initial[::-1].translate(FLIP)
+    return ones + block.count("1", 0, rest)
+
+
+def solve_by_chunks(puzzle_input: str, disk_length: int = 272) -> str:
+    """Solve part 1 from the parity of each checksum chunk.
+
+    Approach:
+        Each pairing round turns two digits into 1 when they are equal, so a
+        final checksum digit covers a chunk of 2^k digits (the largest power
+        of two dividing the disk length) and is 1 when the chunk holds an
+        even number of ones. Counting ones up to each chunk boundary takes a
+        logarithmic number of steps, so the disk is never generated.
+
+    Args:
+        puzzle_input: Raw puzzle input string
+        disk_length: Target disk length (default 272 for part 1)
+
+    Returns:
+        The answer to part 1
+
+    """
+    initial_state = puzzle_input.strip()
+    chunk = disk_length & -disk_length
+    ones = [
+        count_disk_ones(initial_state, end) for end in range(0, disk_length + 1, chunk)
+    ]
+    return "".join(
+        "1" if (after - before) % 2 == 0 else "0" for before, after in pairwise(ones)
+    )
+
+
+VARIANTS = {"chunks": solve_by_chunks}
+
+
 if __name__ == "__main__":
     from aoc.helpers import read_puzzle_input
 
@@ -4,6 +4,9 @@ Generate data using dragon curve for larger disk and compute checksum.
 """
 
 from aoc.puzzles.year2016.day16 import part1
+from aoc.types import Budget
+
+BUDGET = Budget(time=40, memory=256 * 2**20)
 
 
 def solve(puzzle_input: str) -> str:
@@ -22,6 +25,22 @@ def solve(puzzle_input: str) -> str:
     return part1.solve(puzzle_input, disk_length=35651584)
 
 
+def solve_by_chunks(puzzle_input: str) -> str:
+    """Solve part 2 from the parity of each checksum chunk.
+
+    Args:
+        puzzle_input: Raw puzzle input string
+
+    Returns:
+        The answer to part 2
+
+    """
+    return part1.solve_by_chunks(puzzle_input, disk_length=35651584)
+
+
+VARIANTS = {"chunks": solve_by_chunks}
+
+
 if __name__ == "__main__":
     from aoc.helpers import read_puzzle_input
 
@@ -6,6 +6,10 @@ Find shortest path through MD5-based door maze.
 import hashlib
 from collections import deque
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.01)
+
 
 def get_open_doors(passcode: str, path: str) -> str:
     """Get which doors are open based on MD5 hash.
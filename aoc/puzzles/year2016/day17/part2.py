@@ -6,6 +6,9 @@ Find longest path through MD5-based door maze.
 from collections import deque
 
 from aoc.puzzles.year2016.day17 import part1
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.5)
 
 
 def find_longest_path_length(passcode: str) -> int:
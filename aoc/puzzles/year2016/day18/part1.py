@@ -3,6 +3,10 @@
 Count safe tiles in trap-filled room using cellular automaton rules.
 """
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.01)
+
 
 def is_trap(left: str, center: str, right: str) -> bool:
     """Determine if a tile is a trap based on the three tiles above it.
@@ -90,6 +94,48 @@ def solve(puzzle_input: str, total_rows: int = 40) -> str:
     return str(count_safe_tiles(first_row, total_rows))
 
 
+def count_safe_tiles_bitset(first_row: str, total_rows: int) -> int:
+    """Count safe tiles with each row packed into an integer.
+
+    The four trap rules amount to "the left and right tiles above differ",
+    so the next row is the XOR of the row shifted both ways, masked to the
+    row width.
+
+    Args:
+        first_row: The first row of tiles
+        total_rows: Total number of rows to generate
+
+    Returns:
+        Number of safe tiles
+
+    """
+    width = len(first_row)
+    mask = (1 << width) - 1
+    traps = int(first_row.translate(str.maketrans(".^", "01")), 2)
+    safe_count = 0
+    for _ in range(total_rows):
+        safe_count += width - traps.bit_count()
+        traps = ((traps << 1) ^ (traps >> 1)) & mask
+    return safe_count
+
+
+def solve_bitset(puzzle_input: str, total_rows: int = 40) -> str:
+    """Solve part 1 on integer bitsets.
+
+    Args:
+        puzzle_input: Raw puzzle input string
+        total_rows: Total number of rows (default 40)
+
+    Returns:
+        The answer to part 1
+
+    """
+    return str(count_safe_tiles_bitset(puzzle_input.strip(), total_rows))
+
+
+VARIANTS = {"bitset": solve_bitset}
+
+
 if __name__ == "__main__":
     from aoc.helpers import read_puzzle_input
 
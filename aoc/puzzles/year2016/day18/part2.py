@@ -4,6 +4,9 @@ Count safe tiles with many more rows.
 """
 
 from aoc.puzzles.year2016.day18 import part1
+from aoc.types import Budget
+
+BUDGET = Budget(time=50)
 
 
 def solve(puzzle_input: str) -> str:
@@ -22,6 +25,22 @@ def solve(puzzle_input: str) -> str:
     return part1.solve(puzzle_input, total_rows=400000)
 
 
+def solve_bitset(puzzle_input: str) -> str:
+    """Solve part 2 on integer bitsets.
+
+    Args:
+        puzzle_input: Raw puzzle input string
+
+    Returns:
+        The answer to part 2
+
+    """
+    return part1.solve_bitset(puzzle_input, total_rows=400000)
+
+
+VARIANTS = {"bitset": solve_bitset}
+
+
 if __name__ == "__main__":
     from aoc.helpers import read_puzzle_input
 
@@ -3,6 +3,10 @@
 Josephus problem - find the last remaining elf.
 """
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.01)
+
 
 def find_winner_josephus(num_elves: int) -> int:
     """Find the winner using Josephus problem solution.
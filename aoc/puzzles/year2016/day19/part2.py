@@ -3,6 +3,10 @@
 Josephus variant - steal from across the circle.
 """
 
+from aoc.types import Budget
+
+BUDGET = Budget(time=0.01)
+
 
 def find_winner_across(num_elves: int) -> int:
     """Find the winner when stealing from across the circle.
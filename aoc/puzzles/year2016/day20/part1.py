@@ -3,6 +3,10 @@
 Find the lowest IP not blocked by firewall rules.
 """
 
+from aoc.types import Budget, DayContext
+
+BUDGET = Budget(time=0.01, memory=512 * 2**10)
+
 
 def parse_ranges(puzzle_input: str) -> list[tuple[int, int]]:
     """Parse the blacklist ranges from input.
@@ -21,6 +25,27 @@ def parse_ranges(puzzle_input: str) -> list[tuple[int, int]]:
     return ranges
 
 
+def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merge overlapping and adjacent ranges.
+
+    Args:
+        ranges: List of (start, end) tuples representing blocked ranges
+
+    Returns:
+        Disjoint, non-adjacent ranges blocking the same IPs, sorted by start
+
+    """
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            # Overlapping or adjacent - merge
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            # Non-overlapping - add new range
+            merged.append((start, end))
+    return merged
+
+
 def find_lowest_allowed_ip(ranges: list[tuple[int, int]]) -> int:
     """Find the lowest IP not blocked by any range.
 
@@ -31,13 +56,11 @@ def find_lowest_allowed_ip(ranges: list[tuple[int, int]]) -> int:
         The lowest allowed IP address
 
     """
-    # Sort ranges by start position
-    ranges.sort()
-
     # Track the lowest unblocked IP we're looking for
     lowest_allowed = 0
 
-    for start, end in ranges:
+    # Visit ranges by start position
+    for start, end in sorted(ranges):
         # If this range starts after our current lowest, we found a gap
         if start > lowest_allowed:
             return lowest_allowed
@@ -50,13 +73,40 @@ def find_lowest_allowed_ip(ranges: list[tuple[int, int]]) -> int:
     return lowest_allowed
 
 
-def solve(puzzle_input: str) -> str:
-    """Solve part 1.
+def parse(puzzle_input: str) -> list[tuple[int, int]]:
+    """Parse the ranges once for both parts.
+
+    Args:
+        puzzle_input: Raw puzzle input string
+
+    Returns:
+        List of (start, end) tuples representing blocked ranges
+
+    """
+    return parse_ranges(puzzle_input)
+
+
+def solve_parsed(ranges: list[tuple[int, int]], ctx: DayContext) -> str:
+    """Solve part 1 on the parsed ranges.
 
     Approach:
-        Parse and sort the blocked IP ranges
+        Merge the blocked IP ranges (shared with part 2)
         Find the first gap in the ranges
 
+    Args:
+        ranges: List of (start, end) tuples representing blocked ranges
+        ctx: Day context
+
+    Returns:
+        The answer to part 1
+
+    """
+    return str(find_lowest_allowed_ip(ctx.share(merge_ranges, ranges)))
+
+
+def solve(puzzle_input: str) -> str:
+    """Solve part 1.
+
     Args:
         puzzle_input: Raw puzzle input string
 
@@ -64,8 +114,7 @@ def solve(puzzle_input: str) -> str:
         The answer to part 1
 
     """
-    ranges = parse_ranges(puzzle_input)
-    return str(find_lowest_allowed_ip(ranges))
+    return solve_parsed(parse(puzzle_input), DayContext())
 
 
 if __name__ == "__main__":
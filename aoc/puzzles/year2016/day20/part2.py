@@ -3,65 +3,80 @@
 Count how many IPs are allowed by the firewall.
 """
 
-from aoc.puzzles.year2016.day20 import part1
+from itertools import pairwise
 
+from aoc.puzzles.year2016.day20.part1 import merge_ranges, parse
+from aoc.types import Budget, DayContext
+
+BUDGET = Budget(time=0.01, memory=512 * 2**10)
+
+MAX_IP = 4294967295  # Highest 32-bit address
 
-def count_allowed_ips(ranges: list[tuple[int, int]], max_ip: int = 4294967295) -> int:
-    """Count how many IPs are not blocked by any range.
+
+def count_unblocked(merged: list[tuple[int, int]], max_ip: int = MAX_IP) -> int:
+    """Count the IPs left between merged blocked ranges.
 
     Args:
-        ranges: List of (start, end) tuples representing blocked ranges
-        max_ip: Maximum IP address value (default: 4294967295 for 32-bit)
+        merged: Disjoint, non-adjacent blocked ranges, sorted by start
+        max_ip: Maximum IP address value
 
     Returns:
         Number of allowed IPs
 
     """
-    # Sort ranges by start position
-    ranges.sort()
-
-    # Merge overlapping ranges
-    merged: list[tuple[int, int]] = []
-    for start, end in ranges:
-        if merged and start <= merged[-1][1] + 1:
-            # Overlapping or adjacent - merge
-            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
-        else:
-            # Non-overlapping - add new range
-            merged.append((start, end))
-
-    # Count allowed IPs (gaps between merged ranges + before first + after last)
-    allowed_count = 0
+    # If no ranges, all IPs are allowed
+    if not merged:
+        return max_ip + 1
 
     # Count IPs before first blocked range
-    if merged:
-        allowed_count += merged[0][0]
+    allowed_count = merged[0][0]
 
     # Count gaps between blocked ranges
-    for i in range(len(merged) - 1):
-        gap_start = merged[i][1] + 1
-        gap_end = merged[i + 1][0] - 1
-        if gap_end >= gap_start:
-            allowed_count += gap_end - gap_start + 1
+    for (_, end), (next_start, _) in pairwise(merged):
+        allowed_count += next_start - end - 1
 
     # Count IPs after last blocked range
-    if merged and merged[-1][1] < max_ip:
+    if merged[-1][1] < max_ip:
         allowed_count += max_ip - merged[-1][1]
 
-    # If no ranges, all IPs are allowed
-    if not merged:
-        allowed_count = max_ip + 1
-
     return allowed_count
 
 
-def solve(puzzle_input: str) -> str:
-    """Solve part 2.
+def count_allowed_ips(ranges: list[tuple[int, int]], max_ip: int = MAX_IP) -> int:
+    """Count how many IPs are not blocked by any range.
+
+    Args:
+        ranges: List of (start, end) tuples representing blocked ranges
+        max_ip: Maximum IP address value (default: 4294967295 for 32-bit)
+
+    Returns:
+        Number of allowed IPs
+
+    """
+    return count_unblocked(merge_ranges(ranges), max_ip)
+
+
+def solve_parsed(ranges: list[tuple[int, int]], ctx: DayContext) -> str:
+    """Solve part 2 on the parsed ranges.
 
     Approach:
-        Merge overlapping blocked ranges
+        Merge overlapping blocked ranges (shared with part 1)
         Count gaps between merged ranges
 
+    Args:
+        ranges: List of (start, end) tuples representing blocked ranges
+        ctx: Day context
+
+    Returns:
+        The answer to part 2
+
+    """
+    return str(count_unblocked(ctx.share(merge_ranges, ranges)))
+
+
+def solve(puzzle_input: str) -> str:
+    """Solve part 2.
+
     Args:
         puzzle_input: Raw puzzle input string
 
@@ -69,8 +84,7 @@ def solve(puzzle_input: str) -> str:
         The answer to part 2
 
     """
-    ranges = part1.parse_ranges(puzzle_input)
-    return str(count_allowed_ips(ranges))
+    return solve_parsed(parse(puzzle_input), DayContext())
 
 
 if __name__ == "__main__":
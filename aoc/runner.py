@@ -0,0 +1,284 @@
+"""Execution of individual puzzle parts.
+
+A part module either defines ``solve(raw) -> answer`` or follows the
+parse-once protocol: ``parse(raw) -> parsed`` and
+``solve_parsed(parsed, ctx) -> answer``, where ``ctx`` is a DayContext shared
+with the other part of the day. Protocol modules keep a ``solve`` wrapper for
+tests and the measurement modes, which always time ``solve`` as a whole.
+
+A part module may also declare a soft ``BUDGET`` (see Budget). Results
+exceeding it by more than the tolerance list the overruns in ``over_budget``;
+the part still counts as solved. Parts with ``VARIANTS`` run the implementation
+requested in the options, else this machine's default (see aoc.variants).
+"""
+
+import importlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any
+
+from aoc.bench.timing import BenchmarkConfig, benchmark
+from aoc.helpers import read_puzzle_input, timer
+from aoc.spans import recording, span
+from aoc.types import Budget, DayContext, PartResult, PartStatus
+from aoc.variants import REFERENCE, resolve
+
+# Measurements up to this factor over a budget count as noise
+BUDGET_TOLERANCE = 1.5
+
+
+@dataclass(frozen=True)
+class RunOptions:
+    """How to run and measure each part.
+
+    Attributes:
+        bench: Benchmark settings (None to time a single call)
+        profile: Run under cProfile and save a .pstats file per part
+        memory: Track peak memory, max RSS and top allocation sites
+        spans: Record the spans solvers mark their phases with
+        budget_tolerance: Factor a part may exceed its budget by before it is
+            reported as over budget
+        variant: Implementation to run (None for this machine's default)
+
+    """
+
+    bench: BenchmarkConfig | None = None
+    profile: bool = False
+    memory: bool = False
+    spans: bool = False
+    budget_tolerance: float = BUDGET_TOLERANCE
+    variant: str | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the combination of options.
+
+        Raises:
+            ValueError: If more than one measurement mode is requested
+
+        """
+        modes = (self.bench is not None) + self.profile + self.memory + self.spans
+        if modes > 1:
+            msg = (
+                "Profiling, memory tracing and span overhead would distort each "
+                "other and benchmarks; pick one of bench, profile, memory and spans"
+            )
+            raise ValueError(msg)
+
+    @property
+    def cacheable(self) -> bool:
+        """Whether results may be answered from (and stored in) the cache."""
+        measured = self.bench is not None or self.profile or self.memory or self.spans
+        return not (measured or self.variant is not None)
+
+
+DEFAULT_OPTIONS = RunOptions()
+
+
+def load_part(year: int, day: int, part: int) -> ModuleType:
+    """Import the solution module of a puzzle part.
+
+    Args:
+        year: Year of the puzzle
+        day: Day of the puzzle (1-25)
+        part: Part number (1 or 2)
+
+    Returns:
+        The imported partN module
+
+    """
+    return importlib.import_module(f"aoc.puzzles.year{year}.day{day:02d}.part{part}")
+
+
+def check_budget(
+    budget: Budget | None, result: PartResult, tolerance: float = BUDGET_TOLERANCE
+) -> list[str]:
+    """Describe the budgets a finished part exceeded.
+
+    Time is not checked on profiled or memory-traced runs, which the tooling
+    slows down, and memory is only known on memory-traced runs.
+
+    Args:
+        budget: The part's budget (None if it has none)
+        result: Result of running the part
+        tolerance: Factor the part may exceed each budget by
+
+    Returns:
+        One description per exceeded budget (empty when within budget)
+
+    """
+    if budget is None or result.status is not PartStatus.OK:
+        return []
+    overruns = []
+    measured_time = result.profile is None and result.memory is None
+    if (
+        budget.time is not None
+        and measured_time
+        and result.time > budget.time * tolerance
+    ):
+        overruns.append(
+            f"time {result.time * 1e3:.1f}ms over the {budget.time * 1e3:.1f}ms budget"
+        )
+    if (
+        budget.memory is not None
+        and result.memory is not None
+        and result.memory.peak_traced > budget.memory * tolerance
+    ):
+        overruns.append(
+            f"memory {result.memory.peak_traced / 2**20:.1f}MiB over the "
+            f"{budget.memory / 2**20:.1f}MiB budget"
+        )
+    return overruns
+
+
+def solve_module(
+    module: ModuleType,
+    puzzle_input: str,
+    context: DayContext,
+    solve: Callable[[str], Any] | None = None,
+) -> tuple[Any, float | None]:
+    """Solve a part, parsing through the day's context when the module can.
+
+    Args:
+        module: Part module
+        puzzle_input: Raw puzzle input
+        context: Context shared with the other part of the day
+        solve: Implementation to run instead of the module's reference (it
+            takes the raw input, so the context is not used)
+
+    Returns:
+        Tuple of (answer, seconds spent parsing, 0 if the other part's parse
+        was reused, or None for plain solvers)
+
+    """
+    if solve is not None:
+        return solve(puzzle_input), None
+    if not hasattr(module, "solve_parsed"):
+        return module.solve(puzzle_input), None
+    reused = module.parse in context.values
+    with span("parse"), timer() as t:
+        parsed = context.share(module.parse, puzzle_input)
+    return module.solve_parsed(parsed, context), 0.0 if reused else t[0]
+
+
+def run_part(
+    year: int,
+    day: int,
+    part: int,
+    options: RunOptions = DEFAULT_OPTIONS,
+    context: DayContext | None = None,
+) -> PartResult:
+    """Solve one part of a puzzle on its input and time it.
+
+    This is a module-level function so it can be sent to worker processes.
+
+    Args:
+        year: Year of the puzzle
+        day: Day of the puzzle (1-25)
+        part: Part number (1 or 2)
+        options: Measurement settings
+        context: Context shared with the other part of the day (None for a
+            fresh one)
+
+    Returns:
+        PartResult with the answer and execution time
+
+    """
+    module = load_part(year, day, part)
+    name, solve = resolve(module, year, day, part, options.variant)
+    result = _run_module(
+        module,
+        None if name == REFERENCE else solve,
+        year,
+        day,
+        part,
+        options,
+        context,
+    )
+    result.variant = name
+    result.over_budget = check_budget(
+        getattr(module, "BUDGET", None), result, options.budget_tolerance
+    )
+    return result
+
+
+def _run_module(
+    module: ModuleType,
+    variant: Callable[[str], Any] | None,
+    year: int,
+    day: int,
+    part: int,
+    options: RunOptions,
+    context: DayContext | None,
+) -> PartResult:
+    """Solve a loaded part on its input with the requested measurement.
+
+    Args:
+        module: Part module
+        variant: Implementation to run instead of the reference (None for the
+            reference)
+        year: Year of the puzzle
+        day: Day of the puzzle (1-25)
+        part: Part number (1 or 2)
+        options: Measurement settings
+        context: Context shared with the other part of the day (None for a
+            fresh one)
+
+    Returns:
+        PartResult with the answer and execution time
+
+    """
+    puzzle_input = read_puzzle_input(year, day)
+    solve = variant or module.solve
+
+    if options.bench is not None:
+        answer, stats = benchmark(solve, puzzle_input, options.bench)
+        return PartResult(
+            year=year,
+            day=day,
+            part=part,
+            answer=answer,
+            time=stats.wall.median_ns / 1e9,
+            stats=stats,
+        )
+
+    # Profiling and memory tooling load on demand to keep the solve path light
+    if options.profile:
+        from aoc.bench.profile import profile_call, profile_path
+
+        path = profile_path(year, day, part)
+        with timer() as t:
+            answer = profile_call(solve, puzzle_input, path)
+        return PartResult(
+            year=year, day=day, part=part, answer=answer, time=t[0], profile=path
+        )
+
+    if options.memory:
+        from aoc.bench.memory import measure_memory
+
+        with timer() as t:
+            answer, memory = measure_memory(solve, puzzle_input)
+        return PartResult(
+            year=year, day=day, part=part, answer=answer, time=t[0], memory=memory
+        )
+
+    context = DayContext() if context is None else context
+    if options.spans:
+        with recording(f"Part {part}") as root:
+            answer, parse_time = solve_module(module, puzzle_input, context, variant)
+        return PartResult(
+            year=year,
+            day=day,
+            part=part,
+            answer=answer,
+            time=root.ns / 1e9,
+            spans=root,
+            parse_time=parse_time,
+        )
+
+    with timer() as t:
+        answer, parse_time = solve_module(module, puzzle_input, context, variant)
+
+    return PartResult(
+        year=year, day=day, part=part, answer=answer, time=t[0], parse_time=parse_time
+    )
@@ -0,0 +1,470 @@
+"""Parallel scheduling of puzzle parts across supervised worker processes.
+
+Each (year, day, part) is an independent job. Jobs are started longest-first,
+using timings recorded by previous runs, so the wall time of a year run
+approaches the time of its slowest single part.
+
+Every job runs in a child process with a wall-clock budget and an
+address-space limit. A job that goes over is killed and reported as TIMEOUT
+or OOM without affecting the other jobs. Both parts of a day using the
+parse-once protocol run one after the other in the same child, so part 2
+reuses part 1's parse and shared work; each part keeps its own budget.
+"""
+
+import contextlib
+import json
+import multiprocessing
+import os
+import resource
+import signal
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import NamedTuple
+
+from aoc.cache import ResultCache, part_key
+from aoc.helpers import get_cache_dir, get_year_dir
+from aoc.runner import DEFAULT_OPTIONS, RunOptions, load_part, run_part
+from aoc.types import DayContext, PartResult, PartStatus
+
+
+class Job(NamedTuple):
+    """A single puzzle part to solve."""
+
+    year: int
+    day: int
+    part: int
+
+
+@dataclass(frozen=True)
+class ResourceLimits:
+    """Limits enforced on each job's child process.
+
+    Attributes:
+        timeout: Wall-clock budget in seconds (None for no limit). When
+            benchmarking, the budget covers all repetitions of the part.
+        memory: Address-space limit in bytes (None for no limit)
+
+    """
+
+    timeout: float | None = 600.0
+    memory: int | None = 4 * 1024**3
+
+
+DEFAULT_LIMITS = ResourceLimits()
+NO_LIMITS = ResourceLimits(timeout=None, memory=None)
+
+
+def find_days(year: int) -> list[int]:
+    """Find the days of a year that have both parts implemented.
+
+    Args:
+        year: Year to look for puzzles in
+
+    Returns:
+        Sorted list of day numbers
+
+    """
+    year_dir = get_year_dir(year)
+    if not year_dir.exists():
+        return []
+
+    return [
+        int(day_dir.name[3:])  # Extract day number from "day01"
+        for day_dir in sorted(year_dir.glob("day*"))
+        if (day_dir / "part1.py").exists() and (day_dir / "part2.py").exists()
+    ]
+
+
+class TimingHistory:
+    """Last known execution time of each job, persisted as JSON."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Load the history file.
+
+        Args:
+            path: JSON file to use (defaults to timings.json in the cache dir)
+
+        """
+        self.path = path or get_cache_dir() / "timings.json"
+        self.timings: dict[str, float] = {}
+        if self.path.exists():
+            try:
+                self.timings = json.loads(self.path.read_text())
+            except json.JSONDecodeError:
+                # A corrupt history only costs us the ordering heuristic
+                self.timings = {}
+
+    @staticmethod
+    def _key(job: Job) -> str:
+        return f"{job.year}/{job.day}/{job.part}"
+
+    def estimate(self, job: Job) -> float | None:
+        """Get the last recorded time of a job.
+
+        Args:
+            job: Job to look up
+
+        Returns:
+            Time in seconds, or None if the job has never been timed
+
+        """
+        return self.timings.get(self._key(job))
+
+    def record(self, result: PartResult) -> None:
+        """Remember the time of a finished job.
+
+        Args:
+            result: Result of the job
+
+        """
+        self.timings[self._key(Job(result.year, result.day, result.part))] = result.time
+
+    def save(self) -> None:
+        """Write the history back to disk."""
+        self.path.write_text(json.dumps(self.timings, indent=2, sort_keys=True))
+
+
+def order_jobs(jobs: Iterable[Job], history: TimingHistory) -> list[Job]:
+    """Order jobs so the slowest known ones start first.
+
+    Jobs without history are scheduled before all known ones, since they
+    could be arbitrarily slow. Ties keep day order.
+
+    Args:
+        jobs: Jobs to order
+        history: Past timings
+
+    Returns:
+        Jobs in dispatch order
+
+    """
+
+    def priority(job: Job) -> tuple[bool, float, Job]:
+        estimate = history.estimate(job)
+        if estimate is None:
+            return (False, 0.0, job)
+        return (True, -estimate, job)
+
+    return sorted(jobs, key=priority)
+
+
+def _attempt(
+    job: Job, options: RunOptions, context: DayContext | None = None
+) -> PartResult:
+    """Run a job, turning any failure into a PartResult.
+
+    Args:
+        job: Job to run
+        options: Measurement settings
+        context: Context shared with the other part of the day (None for a
+            fresh one)
+
+    Returns:
+        The job's result, with a non-OK status if it failed
+
+    """
+    start = time.perf_counter()
+    try:
+        return run_part(*job, options, context)
+    except MemoryError:
+        status, error = PartStatus.OOM, "MemoryError"
+    except Exception as e:  # noqa: BLE001 - a failing solver must not stop the run
+        status, error = PartStatus.ERROR, f"{type(e).__name__}: {e}"
+    return PartResult(
+        *job,
+        answer=None,
+        time=time.perf_counter() - start,
+        status=status,
+        error=error,
+    )
+
+
+def _child_main(
+    conn: Connection, jobs: list[Job], options: RunOptions, memory: int | None
+) -> None:
+    """Entry point of a child process running jobs of one day in order.
+
+    Args:
+        conn: Pipe end to send each result through as soon as it is known
+        jobs: Jobs to run, sharing one context
+        options: Measurement settings
+        memory: Address-space limit in bytes (None for no limit)
+
+    """
+    if memory is not None:
+        # Not supported on every platform (e.g. macOS); run unlimited there
+        with contextlib.suppress(ValueError, OSError):
+            resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+    context = DayContext()
+    for job in jobs:
+        conn.send(_attempt(job, options, context))
+    conn.close()
+
+
+class _Running(NamedTuple):
+    """A child process and the jobs it has yet to report."""
+
+    jobs: list[Job]  # The first one is running, since ``start``
+    process: BaseProcess
+    start: float
+
+    @property
+    def job(self) -> Job:
+        """Job currently running."""
+        return self.jobs[0]
+
+
+def _lost_result(running: _Running, elapsed: float) -> PartResult:
+    """Build the result of a child that exited without reporting.
+
+    Args:
+        running: The finished child
+        elapsed: Time the child ran for in seconds
+
+    Returns:
+        PartResult describing how the child died
+
+    """
+    exitcode = running.process.exitcode
+    # The kernel's OOM killer and failed allocations show up as SIGKILL/SIGSEGV
+    if exitcode in (-signal.SIGKILL, -signal.SIGSEGV):
+        status = PartStatus.OOM
+    else:
+        status = PartStatus.ERROR
+    return PartResult(
+        *running.job,
+        answer=None,
+        time=elapsed,
+        status=status,
+        error=f"Worker exited with code {exitcode}",
+    )
+
+
+def _shares_parse(job: Job) -> bool:
+    """Check whether a job's part uses the parse-once protocol.
+
+    Args:
+        job: Job to check
+
+    Returns:
+        True if the part defines solve_parsed
+
+    """
+    try:
+        module = load_part(*job)
+    except Exception:  # noqa: BLE001 - the child reports why the part fails
+        return False
+    return hasattr(module, "solve_parsed")
+
+
+def group_jobs(jobs: list[Job]) -> list[list[Job]]:
+    """Group the jobs that should share a child process.
+
+    Parts of a day using the parse-once protocol form one group, in part
+    order, placed where the first of them was; other jobs stay alone.
+
+    Args:
+        jobs: Jobs in start order
+
+    Returns:
+        Groups of jobs in start order
+
+    """
+    groups: list[list[Job]] = []
+    by_day: dict[tuple[int, int], list[Job]] = {}
+    for job in jobs:
+        if not _shares_parse(job):
+            groups.append([job])
+        elif (day := (job.year, job.day)) in by_day:
+            by_day[day].append(job)
+            by_day[day].sort()
+        else:
+            by_day[day] = [job]
+            groups.append(by_day[day])
+    return groups
+
+
+class _Supervisor:
+    """Children running groups of jobs, with the results they reported."""
+
+    def __init__(
+        self, jobs: list[Job], options: RunOptions, limits: ResourceLimits
+    ) -> None:
+        self.options = options
+        self.limits = limits
+        self.pending = deque(group_jobs(jobs))
+        self.running: dict[Connection, _Running] = {}
+        self.outcomes: dict[Job, PartResult] = {}
+
+    def start(self, workers: int) -> None:
+        """Start pending groups until ``workers`` children are running."""
+        while self.pending and len(self.running) < workers:
+            group = self.pending.popleft()
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(
+                target=_child_main,
+                args=(sender, group, self.options, self.limits.memory),
+                daemon=True,
+            )
+            process.start()
+            sender.close()  # Only the child writes; EOF means it died
+            self.running[receiver] = _Running(group, process, time.monotonic())
+
+    def wait_timeout(self) -> float | None:
+        """Seconds until the first running job overruns (None for no limit)."""
+        if self.limits.timeout is None:
+            return None
+        first_deadline = min(r.start for r in self.running.values())
+        return max(0.0, first_deadline + self.limits.timeout - time.monotonic())
+
+    def stop(self, conn: Connection, result: PartResult) -> None:
+        """Record why a child's current job failed and retry the rest alone."""
+        child = self.running.pop(conn)
+        self.outcomes[child.job] = result
+        conn.close()
+        if child.jobs[1:]:
+            self.pending.appendleft(child.jobs[1:])
+
+    def collect(self, conn: Connection) -> None:
+        """Receive the result of a child's current job."""
+        child = self.running[conn]
+        try:
+            result: PartResult = conn.recv()
+        except EOFError:
+            child.process.join()
+            self.stop(conn, _lost_result(child, time.monotonic() - child.start))
+            return
+        self.outcomes[child.job] = result
+        if child.jobs[1:]:
+            # The next part's budget starts now
+            self.running[conn] = child._replace(
+                jobs=child.jobs[1:], start=time.monotonic()
+            )
+        else:
+            conn.close()
+            child.process.join()
+            del self.running[conn]
+
+    def expire(self) -> None:
+        """Kill the children whose current job is over its budget."""
+        if self.limits.timeout is None:
+            return
+        now = time.monotonic()
+        for conn, overdue in list(self.running.items()):
+            if now - overdue.start >= self.limits.timeout:
+                overdue.process.kill()
+                overdue.process.join()
+                timed_out = PartResult(
+                    *overdue.job,
+                    answer=None,
+                    time=now - overdue.start,
+                    status=PartStatus.TIMEOUT,
+                    error=f"Exceeded {self.limits.timeout:g}s wall-clock budget",
+                )
+                self.stop(conn, timed_out)
+
+
+def _supervise(
+    jobs: list[Job],
+    workers: int,
+    options: RunOptions,
+    limits: ResourceLimits,
+) -> dict[Job, PartResult]:
+    """Run jobs in child processes, at most ``workers`` at a time.
+
+    Args:
+        jobs: Jobs in start order
+        workers: Maximum number of concurrent children
+        options: Measurement settings
+        limits: Limits enforced on each job
+
+    Returns:
+        Mapping from job to its result
+
+    """
+    supervisor = _Supervisor(jobs, options, limits)
+    try:
+        while supervisor.pending or supervisor.running:
+            supervisor.start(workers)
+            ready = wait(list(supervisor.running), timeout=supervisor.wait_timeout())
+            for conn in [conn for conn in supervisor.running if conn in ready]:
+                supervisor.collect(conn)
+            supervisor.expire()
+    finally:
+        # Don't leave orphans behind on Ctrl-C or unexpected errors
+        for leftover in supervisor.running.values():
+            leftover.process.kill()
+
+    return supervisor.outcomes
+
+
+def run_jobs(
+    jobs: Iterable[Job],
+    workers: int | None = None,
+    history: TimingHistory | None = None,
+    options: RunOptions = DEFAULT_OPTIONS,
+    limits: ResourceLimits = DEFAULT_LIMITS,
+    cache: ResultCache | None = None,
+) -> dict[Job, PartResult]:
+    """Run jobs in supervised child processes, slowest first.
+
+    Jobs found in the result cache are answered without starting a process.
+
+    Args:
+        jobs: Jobs to run
+        workers: Maximum number of concurrent child processes (None for one
+            per CPU). With 1 worker and NO_LIMITS, jobs run in the current
+            process instead.
+        history: Timing history used for ordering and updated with results
+        options: Measurement settings for every job
+        limits: Wall-clock and memory limits for each job
+        cache: Result cache to answer from and fill (None to always run;
+            ignored unless the options are cacheable)
+
+    Returns:
+        Mapping from job to its result; failed jobs have a non-OK status
+
+    """
+    history = history or TimingHistory()
+    ordered = order_jobs(jobs, history)
+
+    keys: dict[Job, str] = {}
+    hits: dict[Job, PartResult] = {}
+    if not options.cacheable:
+        cache = None
+    if cache is not None:
+        for job in ordered:
+            # Keys are computed before running, so edits made meanwhile miss
+            with contextlib.suppress(FileNotFoundError):
+                keys[job] = part_key(*job)
+                if (hit := cache.get(keys[job], *job)) is not None:
+                    hits[job] = hit
+        ordered = [job for job in ordered if job not in hits]
+
+    if workers == 1 and limits == NO_LIMITS:
+        # In one process, both parts of a day share parsing and work directly
+        contexts: dict[tuple[int, int], DayContext] = {}
+        outcomes = {
+            job: _attempt(
+                job, options, contexts.setdefault((job.year, job.day), DayContext())
+            )
+            for job in ordered
+        }
+    else:
+        outcomes = _supervise(ordered, workers or os.cpu_count() or 1, options, limits)
+
+    for job, outcome in outcomes.items():
+        if outcome.status is PartStatus.OK:
+            # Profiling and tracing overhead would skew the job ordering
+            if not (options.profile or options.memory):
+                history.record(outcome)
+            if cache is not None and job in keys:
+                cache.put(keys[job], outcome)
+    history.save()
+
+    return outcomes | hits
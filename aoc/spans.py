@@ -0,0 +1,111 @@
+"""Nested timing spans marking the phases of a solver.
+
+Solvers wrap their phases in ``span`` blocks:
+
+    from aoc.spans import span
+
+    def solve(puzzle_input: str) -> str:
+        with span("parse"):
+            grid = parse(puzzle_input)
+        with span("search"):
+            return str(search(grid))
+
+Outside of ``recording()`` a span is a shared no-op object, so leaving them in
+solvers costs one call and a list check per block. While recording (the
+runner does when spans are requested), every span adds its perf_counter_ns
+time to a node of a call tree under the span it is nested in. Spans with the
+same name under the same parent share one node, so a span entered in a loop
+shows up once with its total time and number of calls. Each span costs about
+a microsecond while recording: mark phases, not inner-loop steps.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from aoc.types import SpanNode
+
+# Open spans, innermost last; empty while nothing is recording
+_stack: list[SpanNode] = []
+
+
+class _NullSpan:
+    """Span returned while nothing is recording."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    # Named rather than *args: packing a tuple would double the cost
+    def __exit__(self, exc_type: object, exc: object, traceback: object) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Span adding its time to a node of the recorded tree."""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.start = 0
+
+    def __enter__(self) -> None:
+        parent = _stack[-1]
+        node = parent.children.get(self.name)
+        if node is None:
+            node = parent.children[self.name] = SpanNode(self.name)
+        _stack.append(node)
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, exc_type: object, exc: object, traceback: object) -> None:
+        elapsed = time.perf_counter_ns() - self.start
+        node = _stack.pop()
+        node.ns += elapsed
+        node.calls += 1
+
+
+def span(name: str) -> _Span | _NullSpan:
+    """Mark a phase of a solver.
+
+    Args:
+        name: Name of the phase, unique among its siblings
+
+    Returns:
+        Context manager timing its block while recording (a no-op otherwise)
+
+    """
+    return _Span(name) if _stack else _NULL_SPAN
+
+
+@contextmanager
+def recording(name: str = "solve") -> Iterator[SpanNode]:
+    """Record the spans entered in a block.
+
+    Args:
+        name: Name of the root node
+
+    Yields:
+        Root node of the tree; its time and children are final once the block
+        exits
+
+    Raises:
+        RuntimeError: If spans are already being recorded
+
+    """
+    if _stack:
+        msg = "Spans are already being recorded"
+        raise RuntimeError(msg)
+    root = SpanNode(name)
+    _stack.append(root)
+    start = time.perf_counter_ns()
+    try:
+        yield root
+    finally:
+        root.ns = time.perf_counter_ns() - start
+        root.calls = 1
+        _stack.clear()
@@ -0,0 +1,372 @@
+"""Answer submission with cooldown scheduling and a local answer ledger.
+
+Every submission is recorded per year/day/part: the correct answer once
+known, the answers known to be wrong and the bounds learned from "too high" /
+"too low" hints. Answers the ledger already rules out are rejected locally,
+without a request. Cooldowns announced by the server ("You have 34s left to
+wait", "please wait one minute") are remembered, and queued submissions are
+sent once their puzzle is allowed again instead of being bounced.
+"""
+
+import heapq
+import itertools
+import json
+import re
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from enum import StrEnum
+from pathlib import Path
+from typing import NamedTuple, Protocol
+
+from aoc.helpers import get_cache_dir
+
+
+class Verdict(StrEnum):
+    """What became of a submitted answer."""
+
+    CORRECT = "correct"
+    WRONG = "wrong"
+    ALREADY_SOLVED = "already solved"  # The part was completed before
+    TOO_SOON = "too soon"  # Bounced by the cooldown, not counted as a guess
+    REJECTED = "rejected"  # Ruled out by the ledger, never sent
+    UNKNOWN = "unknown"  # Response not recognized
+
+
+class Hint(StrEnum):
+    """Direction given along with a wrong numeric answer."""
+
+    TOO_HIGH = "too high"
+    TOO_LOW = "too low"
+
+
+class SubmissionResult(NamedTuple):
+    """Outcome of one submission."""
+
+    verdict: Verdict
+    wait: float = 0.0  # Seconds before the puzzle accepts another answer
+    hint: Hint | None = None
+    detail: str = ""  # Why a submission was rejected locally
+
+
+# Every phrase a response is classified by, found in a single scan of the page.
+# Alternatives sharing a prefix are factored, and the lookahead lets the scan
+# skip positions that cannot start any phrase.
+_SIGNALS = re.compile(
+    r"(?=[TDYyPp])(?:"
+    r"That's (?:(?P<correct>the right answer)|(?P<wrong>not the right answer))"
+    r"|(?P<solved>Did you already complete it)"
+    r"|You (?:(?P<too_soon>gave an answer too recently)"
+    r"|have (?:(?P<minutes>\d+)m )?(?P<seconds>\d+)s left to wait)"
+    r"|your answer is too (?P<hint>high|low)"
+    r"|[Pp]lease wait (?P<lockout>one|\d+) minutes? before trying again"
+    r")"
+)
+
+# Verdicts by precedence, for pages matching several phrases
+_VERDICTS = (
+    ("correct", Verdict.CORRECT),
+    ("solved", Verdict.ALREADY_SOLVED),
+    ("too_soon", Verdict.TOO_SOON),
+    ("wrong", Verdict.WRONG),
+)
+
+
+def parse_response(html: str) -> SubmissionResult:
+    """Classify the page returned by a submission.
+
+    The page is scanned once with a compiled alternation of every phrase of
+    interest, starting at the ``<article>`` holding the message, so a
+    response is classified in a few microseconds.
+
+    Args:
+        html: Response HTML from AoCClient.submit_answer()
+
+    Returns:
+        Verdict, cooldown and hint of the response
+
+    """
+    found: dict[str | None, re.Match[str]] = {}
+    for match in _SIGNALS.finditer(html, max(html.find("<article"), 0)):
+        found.setdefault(match.lastgroup, match)
+
+    verdict = next((v for name, v in _VERDICTS if name in found), Verdict.UNKNOWN)
+    if verdict in (Verdict.CORRECT, Verdict.ALREADY_SOLVED):
+        return SubmissionResult(verdict)
+
+    wait = 0.0
+    if time_left := found.get("seconds"):
+        wait = int(time_left["minutes"] or 0) * 60 + int(time_left["seconds"])
+    elif lockout := found.get("lockout"):
+        minutes = lockout["lockout"]
+        wait = 60.0 * (1 if minutes == "one" else int(minutes))
+
+    hint = None
+    if verdict is Verdict.WRONG and (direction := found.get("hint")):
+        hint = Hint.TOO_HIGH if direction["hint"] == "high" else Hint.TOO_LOW
+    return SubmissionResult(verdict, wait, hint)
+
+
+@dataclass
+class LedgerEntry:
+    """What is known about the answer of one part.
+
+    Attributes:
+        correct: The accepted answer (None until known)
+        wrong: Answers rejected by the server
+        above: The answer is greater than this (largest "too low" guess)
+        below: The answer is less than this (smallest "too high" guess)
+        not_before: Epoch time before which submissions are bounced
+
+    """
+
+    correct: str | None = None
+    wrong: list[str] = field(default_factory=list)
+    above: int | None = None
+    below: int | None = None
+    not_before: float = 0.0
+
+
+class AnswerLedger:
+    """Answers tried per puzzle part, persisted as JSON."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Load the ledger file.
+
+        Args:
+            path: JSON file to use (defaults to answers.json in the cache dir)
+
+        """
+        self.path = path or get_cache_dir() / "answers.json"
+        self.entries: dict[str, LedgerEntry] = {}
+        if self.path.exists():
+            try:
+                raw = json.loads(self.path.read_text())
+                self.entries = {key: LedgerEntry(**entry) for key, entry in raw.items()}
+            except (json.JSONDecodeError, TypeError):
+                # Losing the ledger only costs us local rejections
+                self.entries = {}
+
+    def entry(self, year: int, day: int, part: int) -> LedgerEntry:
+        """Get (and create if needed) the entry of a part.
+
+        Args:
+            year: Year of the puzzle
+            day: Day of the puzzle (1-25)
+            part: Part number (1 or 2)
+
+        Returns:
+            The part's entry, live in the ledger
+
+        """
+        return self.entries.setdefault(f"{year}/{day}/{part}", LedgerEntry())
+
+    def check(self, year: int, day: int, part: int, answer: str | int) -> str | None:
+        """Tell whether an answer is already known to be wrong.
+
+        Args:
+            year: Year of the puzzle
+            day: Day of the puzzle (1-25)
+            part: Part number (1 or 2)
+            answer: Candidate answer
+
+        Returns:
+            Reason to reject the answer, or None if it is worth submitting
+
+        """
+        entry = self.entry(year, day, part)
+        text = str(answer)
+        if entry.correct is not None:
+            if text == entry.correct:
+                return f"{text} is already the accepted answer"
+            return f"The accepted answer is {entry.correct}"
+        if text in entry.wrong:
+            return f"{text} was already rejected"
+        try:
+            number = int(text)
+        except ValueError:
+            return None
+        if entry.above is not None and number <= entry.above:
+            return f"{text} is too low: the answer is above {entry.above}"
+        if entry.below is not None and number >= entry.below:
+            return f"{text} is too high: the answer is below {entry.below}"
+        return None
+
+    def record(
+        self,
+        year: int,
+        day: int,
+        part: int,
+        answer: str | int,
+        result: SubmissionResult,
+        now: float,
+    ) -> None:
+        """Learn from a server response.
+
+        Args:
+            year: Year of the puzzle
+            day: Day of the puzzle (1-25)
+            part: Part number (1 or 2)
+            answer: Submitted answer
+            result: Parsed response
+            now: Epoch time the response arrived
+
+        """
+        entry = self.entry(year, day, part)
+        text = str(answer)
+        if result.wait:
+            entry.not_before = now + result.wait
+        if result.verdict is Verdict.CORRECT:
+            entry.correct = text
+        elif result.verdict is Verdict.WRONG:
+            if text not in entry.wrong:
+                entry.wrong.append(text)
+            if result.hint is not None and text.lstrip("-").isdigit():
+                number = int(text)
+                if result.hint is Hint.TOO_HIGH:
+                    entry.below = (
+                        number if entry.below is None else min(entry.below, number)
+                    )
+                else:
+                    entry.above = (
+                        number if entry.above is None else max(entry.above, number)
+                    )
+
+    def save(self) -> None:
+        """Write the ledger back to disk."""
+        raw = {key: asdict(entry) for key, entry in self.entries.items()}
+        self.path.write_text(json.dumps(raw, indent=2, sort_keys=True))
+
+
+class _Client(Protocol):
+    """The part of AoCClient used for submissions."""
+
+    def submit_answer(self, year: int, day: int, part: int, answer: str | int) -> str:
+        """Submit an answer and return the response HTML."""
+        ...
+
+
+class Submission(NamedTuple):
+    """An answer waiting in the queue."""
+
+    year: int
+    day: int
+    part: int
+    answer: str | int
+
+
+class SubmissionQueue:
+    """Sends answers as soon as their puzzle's cooldown allows.
+
+    Submissions are ordered by the time their part accepts answers again.
+    Answers bounced with "You gave an answer too recently" are put back and
+    retried once the announced wait is over.
+    """
+
+    def __init__(
+        self,
+        client: _Client,
+        ledger: AnswerLedger | None = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+        max_bounces: int = 3,
+    ) -> None:
+        """Create an empty queue.
+
+        Args:
+            client: Client used to submit (usually an AoCClient)
+            ledger: Ledger to check and update (defaults to answers.json)
+            clock: Epoch clock in seconds
+            sleep: Function used to wait for cooldowns
+            max_bounces: How often one answer may be bounced before giving up
+
+        """
+        self.client = client
+        self.ledger = ledger or AnswerLedger()
+        self.clock = clock
+        self.sleep = sleep
+        self.max_bounces = max_bounces
+        self._heap: list[tuple[float, int, Submission, int]] = []
+        self._order = itertools.count()
+
+    def add(self, year: int, day: int, part: int, answer: str | int) -> None:
+        """Queue an answer.
+
+        Args:
+            year: Year of the puzzle
+            day: Day of the puzzle (1-25)
+            part: Part number (1 or 2)
+            answer: Answer to submit
+
+        """
+        submission = Submission(year, day, part, answer)
+        heapq.heappush(self._heap, (0.0, next(self._order), submission, 0))
+
+    def run(self) -> list[tuple[Submission, SubmissionResult]]:
+        """Submit every queued answer, waiting out cooldowns.
+
+        Answers to the same part are sent in the order they were queued; a
+        part waiting for its cooldown does not hold up the other parts.
+
+        Returns:
+            Final result of each submission, in the order they completed
+
+        """
+        results = []
+        while self._heap:
+            not_before, order, submission, bounces = heapq.heappop(self._heap)
+            year, day, part, answer = submission
+
+            # Cooldowns learned since queuing push the submission back
+            cooldown = self.ledger.entry(year, day, part).not_before
+            if cooldown > not_before:
+                heapq.heappush(self._heap, (cooldown, order, submission, bounces))
+                continue
+
+            reason = self.ledger.check(year, day, part, answer)
+            if reason is not None:
+                result = SubmissionResult(Verdict.REJECTED, detail=reason)
+                results.append((submission, result))
+                continue
+
+            if (delay := not_before - self.clock()) > 0:
+                self.sleep(delay)
+
+            html = self.client.submit_answer(year, day, part, answer)
+            result = parse_response(html)
+            self.ledger.record(year, day, part, answer, result, self.clock())
+            self.ledger.save()
+
+            if result.verdict is Verdict.TOO_SOON and bounces < self.max_bounces:
+                heapq.heappush(self._heap, (not_before, order, submission, bounces + 1))
+                continue
+            results.append((submission, result))
+        return results
+
+
+def submit(
+    client: _Client,
+    year: int,
+    day: int,
+    part: int,
+    answer: str | int,
+    ledger: AnswerLedger | None = None,
+) -> SubmissionResult:
+    """Submit one answer through the ledger, waiting out any cooldown.
+
+    Args:
+        client: Client used to submit (usually an AoCClient)
+        year: Year of the puzzle
+        day: Day of the puzzle (1-25)
+        part: Part number (1 or 2)
+        answer: Answer to submit
+        ledger: Ledger to check and update (defaults to answers.json)
+
+    Returns:
+        Result of the submission (REJECTED if the ledger ruled it out)
+
+    """
+    queue = SubmissionQueue(client, ledger)
+    queue.add(year, day, part, answer)
+    [(_, result)] = queue.run()
+    return result
@@ -0,0 +1,160 @@
+"""Concurrent, resumable mirror of puzzle pages and inputs.
+
+Files already on disk are skipped, so an interrupted sync picks up where it
+stopped. Days are fetched on a bounded thread pool sharing one AoCClient,
+whose rate limiter caps the request rate across all workers.
+
+Usage:
+    aoc sync 2015-2016 --workers 4
+"""
+
+import sys
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import UTC, datetime
+from enum import StrEnum
+from pathlib import Path
+from typing import NamedTuple
+
+import requests
+
+from aoc.helpers import ensure_puzzle_dir, get_puzzle_dir, write_atomic
+from aoc.http import AoCClient, unlock_time
+from aoc.markdown import save_puzzle_markdown
+
+
+class SyncStatus(StrEnum):
+    """Outcome of syncing one file."""
+
+    FETCHED = "fetched"
+    SKIPPED = "skipped"  # Already on disk
+    LOCKED = "locked"  # Not released yet, nothing requested
+    FAILED = "failed"
+
+
+class SyncItem(NamedTuple):
+    """One file of the mirror."""
+
+    year: int
+    day: int
+    kind: str  # "input" or "puzzle"
+    status: SyncStatus
+    error: str | None = None
+
+
+def _target(year: int, day: int, kind: str) -> Path:
+    """Get the file a sync item writes.
+
+    Args:
+        year: Year of the puzzle
+        day: Day of the puzzle (1-25)
+        kind: "input" or "puzzle"
+
+    Returns:
+        Path to input.txt or puzzle.md
+
+    """
+    name = "input.txt" if kind == "input" else "puzzle.md"
+    return get_puzzle_dir(year, day) / name
+
+
+def _fetch(client: AoCClient, year: int, day: int, kind: str) -> SyncItem:
+    """Download one file and write it in place.
+
+    Args:
+        client: Client to fetch with
+        year: Year of the puzzle
+        day: Day of the puzzle (1-25)
+        kind: "input" or "puzzle"
+
+    Returns:
+        FETCHED or FAILED item
+
+    """
+    try:
+        if kind == "puzzle":
+            save_puzzle_markdown(client.fetch_puzzle(year, day), year, day)
+        else:
+            text = client.fetch_input(year, day)
+            # The client's cache already stored it (atomically) as input.txt
+            if client.cache is None:
+                write_atomic(ensure_puzzle_dir(year, day) / "input.txt", text)
+    except (requests.RequestException, ValueError) as e:
+        return SyncItem(year, day, kind, SyncStatus.FAILED, str(e))
+    return SyncItem(year, day, kind, SyncStatus.FETCHED)
+
+
+def _print_progress(done: int, total: int, item: SyncItem) -> None:
+    """Print one progress line to stderr.
+
+    Args:
+        done: Items finished so far
+        total: Items in the sync
+        item: Item that just finished
+
+    """
+    detail = f" ({item.error})" if item.error else ""
+    print(
+        f"[{done:{len(str(total))}d}/{total}] {item.year} day {item.day:2d} "
+        f"{item.kind:6}: {item.status.value}{detail}",
+        file=sys.stderr,
+    )
+
+
+def sync(
+    years: Iterable[int],
+    days: Iterable[int] = range(1, 26),
+    client: AoCClient | None = None,
+    workers: int = 4,
+    inputs: bool = True,
+    puzzles: bool = True,
+    progress: Callable[[int, int, SyncItem], None] | None = _print_progress,
+    now: datetime | None = None,
+) -> list[SyncItem]:
+    """Mirror puzzle pages and inputs that are missing on disk.
+
+    Args:
+        years: Years to mirror
+        days: Days to mirror in each year
+        client: Client to fetch with (defaults to a new AoCClient, whose rate
+            limiter is shared by all workers)
+        workers: Maximum number of concurrent downloads
+        inputs: Whether to mirror input.txt files
+        puzzles: Whether to mirror puzzle.md files
+        progress: Called after each item with (done, total, item), or None
+        now: Current time, to tell which days are released (defaults to now)
+
+    Returns:
+        One item per file, in year, day and kind order
+
+    """
+    now = now or datetime.now(UTC)
+    kinds = [kind for kind, on in (("input", inputs), ("puzzle", puzzles)) if on]
+    wanted = [(y, d, k) for y in years for d in days for k in kinds]
+
+    items: dict[tuple[int, int, str], SyncItem] = {}
+    pending = []
+    for year, day, kind in wanted:
+        if unlock_time(year, day) > now:
+            items[year, day, kind] = SyncItem(year, day, kind, SyncStatus.LOCKED)
+        elif _target(year, day, kind).exists():
+            items[year, day, kind] = SyncItem(year, day, kind, SyncStatus.SKIPPED)
+        else:
+            pending.append((year, day, kind))
+
+    total = len(wanted)
+    if progress is not None:
+        for done, item in enumerate(items.values(), 1):
+            progress(done, total, item)
+
+    if pending:
+        client = client or AoCClient()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_fetch, client, *key) for key in pending]
+            for future in as_completed(futures):
+                item = future.result()
+                items[item.year, item.day, item.kind] = item
+                if progress is not None:
+                    progress(len(items), total, item)
+
+    return [items[key] for key in wanted]
@@ -1,6 +1,218 @@
 """Type definitions for the AoC solver."""
 
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+
+class PartStatus(StrEnum):
+    """Outcome of running a puzzle part."""
+
+    OK = "OK"
+    ERROR = "ERROR"  # The solver raised or could not be loaded
+    TIMEOUT = "TIMEOUT"  # Killed after exceeding its wall-clock budget
+    OOM = "OOM"  # Ran out of its address-space limit
+
+
+@dataclass
+class TimingStats:
+    """Distribution of repeated timing samples.
+
+    Attributes:
+        samples: Raw samples in nanoseconds, in measurement order
+        min_ns: Fastest sample
+        median_ns: Median sample
+        mean_ns: Arithmetic mean
+        stdev_ns: Sample standard deviation (0 for a single sample)
+        iqr_ns: Interquartile range (Q3 - Q1)
+
+    """
+
+    samples: list[int] = field(repr=False)
+    min_ns: int
+    median_ns: float
+    mean_ns: float
+    stdev_ns: float
+    iqr_ns: float
+
+    @classmethod
+    def from_samples(cls, samples: list[int]) -> "TimingStats":
+        """Summarize a list of samples.
+
+        Args:
+            samples: Non-empty list of samples in nanoseconds
+
+        Returns:
+            TimingStats describing the samples
+
+        """
+        import statistics  # Costly to import and only needed when benchmarking
+
+        if len(samples) > 1:
+            q1, _, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+            stdev = statistics.stdev(samples)
+        else:
+            q1 = q3 = stdev = 0.0
+        return cls(
+            samples=samples,
+            min_ns=min(samples),
+            median_ns=statistics.median(samples),
+            mean_ns=statistics.fmean(samples),
+            stdev_ns=stdev,
+            iqr_ns=q3 - q1,
+        )
+
+
+@dataclass
+class BenchmarkStats:
+    """Wall and CPU time distributions of a benchmarked part.
+
+    Attributes:
+        wall: Wall-clock time distribution (perf_counter_ns)
+        cpu: CPU time distribution of the process (process_time_ns)
+
+    """
+
+    wall: TimingStats
+    cpu: TimingStats
+
+
+@dataclass
+class MemoryStats:
+    """Memory usage of a part.
+
+    Attributes:
+        peak_traced: Peak memory allocated by Python during solve (tracemalloc),
+            in bytes
+        max_rss: Maximum resident set size of the process while the part ran,
+            in bytes (None where the peak cannot be reset, as it would include
+            everything the process ran before)
+        top_allocations: Largest allocation sites near the peak, as
+            ("file:line", bytes) pairs
+
+    """
+
+    peak_traced: int
+    max_rss: int | None
+    top_allocations: list[tuple[str, int]] = field(default_factory=list)
+
+
+@dataclass
+class SpanNode:
+    """Time spent in one span of a solver, with the spans nested in it.
+
+    Attributes:
+        name: Name given to the span
+        ns: Total time spent in the span, in nanoseconds
+        calls: Number of times the span was entered
+        children: Spans entered inside this one, by name, in first-entry order
+
+    """
+
+    name: str
+    ns: int = 0
+    calls: int = 0
+    children: dict[str, "SpanNode"] = field(default_factory=dict)
+
+
+@dataclass
+class DayContext:
+    """Work shared by the parts of one day within a run.
+
+    Solvers using the parse-once protocol define ``parse(raw)`` and
+    ``solve_parsed(parsed, ctx)``. The runner parses through the context, so
+    a part whose ``parse`` is the other part's (imported from part 1) gets
+    the already parsed input, and parts share intermediate results with
+    ``ctx.share``. Shared values are used by both parts and must not be
+    mutated.
+
+    Attributes:
+        values: Shared results, by the function that computed them
+
+    """
+
+    values: dict[Callable[..., Any], Any] = field(default_factory=dict)
+
+    def share[T](self, compute: Callable[..., T], *args: Any) -> T:
+        """Compute a value once per day, reusing it in the other part.
+
+        Values are keyed by function alone: ``compute`` must be a pure
+        function of the day's input (``args`` are the parsed input or values
+        derived from it).
+
+        Args:
+            compute: Function computing the value
+            *args: Arguments of the function
+
+        Returns:
+            The value computed by this call or an earlier one
+
+        """
+        if compute not in self.values:
+            self.values[compute] = compute(*args)
+        return self.values[compute]
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Time and memory a part may use on its real input.
+
+    Part modules declare theirs as a module-level ``BUDGET``. Budgets are
+    soft: exceeding one is reported next to the answer rather than failing
+    the part.
+
+    Attributes:
+        time: Wall time in seconds (None for no time budget)
+        memory: Peak traced memory in bytes (None for no memory budget)
+
+    """
+
+    time: float | None = None
+    memory: int | None = None
+
+
+@dataclass
+class PartResult:
+    """Result from solving a single part of a puzzle.
+
+    Attributes:
+        year: The year of the puzzle
+        day: The day of the puzzle
+        part: The part number (1 or 2)
+        answer: The answer to the part
+        time: Execution time in seconds (median wall time when benchmarked)
+        stats: Timing distributions (None unless benchmarked)
+        status: Whether the part finished, failed or was stopped
+        error: Description of the failure (None when status is OK)
+        cached: Whether the answer and time came from the result cache
+        profile: Saved .pstats file (None unless profiled)
+        memory: Memory usage (None unless memory was tracked)
+        spans: Tree of the spans the solver entered (None unless recorded)
+        parse_time: Part of the time spent parsing, in seconds (None unless the
+            solver parses once; 0 when the other part's parse was reused)
+        over_budget: Descriptions of the budgets the part exceeded
+        variant: Name of the implementation that ran (None when the answer came
+            from the cache)
+
+    """
+
+    year: int
+    day: int
+    part: int
+    answer: int | str | None
+    time: float
+    stats: BenchmarkStats | None = None
+    status: PartStatus = PartStatus.OK
+    error: str | None = None
+    cached: bool = False
+    profile: Path | None = None
+    memory: MemoryStats | None = None
+    spans: SpanNode | None = None
+    parse_time: float | None = None
+    over_budget: list[str] = field(default_factory=list)
+    variant: str | None = None
 
 
 @dataclass
@@ -14,6 +226,24 @@ class SolveResult:
         part1_time: Execution time for part 1 in seconds
         part2_answer: The answer to part 2 (None if not solved)
         part2_time: Execution time for part 2 in seconds
+        part1_stats: Timing distributions for part 1 (None unless benchmarked)
+        part2_stats: Timing distributions for part 2 (None unless benchmarked)
+        part1_status: Outcome of part 1
+        part2_status: Outcome of part 2
+        part1_cached: Whether part 1 came from the result cache
+        part2_cached: Whether part 2 came from the result cache
+        part1_profile: Saved .pstats file of part 1 (None unless profiled)
+        part2_profile: Saved .pstats file of part 2 (None unless profiled)
+        part1_memory: Memory usage of part 1 (None unless tracked)
+        part2_memory: Memory usage of part 2 (None unless tracked)
+        part1_spans: Span tree of part 1 (None unless recorded)
+        part2_spans: Span tree of part 2 (None unless recorded)
+        part1_parse_time: Seconds of part 1 spent parsing (None unless parsed
+            once)
+        part2_parse_time: Seconds of part 2 spent parsing (None unless parsed
+            once)
+        part1_over_budget: Budgets part 1 exceeded
+        part2_over_budget: Budgets part 2 exceeded
 
     """
 
@@ -23,3 +253,56 @@ class SolveResult:
     part1_time: float
     part2_answer: int | str | None
     part2_time: float
+    part1_stats: BenchmarkStats | None = None
+    part2_stats: BenchmarkStats | None = None
+    part1_status: PartStatus = PartStatus.OK
+    part2_status: PartStatus = PartStatus.OK
+    part1_cached: bool = False
+    part2_cached: bool = False
+    part1_profile: Path | None = None
+    part2_profile: Path | None = None
+    part1_memory: MemoryStats | None = None
+    part2_memory: MemoryStats | None = None
+    part1_spans: SpanNode | None = None
+    part2_spans: SpanNode | None = None
+    part1_parse_time: float | None = None
+    part2_parse_time: float | None = None
+    part1_over_budget: list[str] = field(default_factory=list)
+    part2_over_budget: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_parts(cls, part1: PartResult, part2: PartResult) -> "SolveResult":
+        """Combine the results of both parts of a day.
+
+        Args:
+            part1: Result of part 1
+            part2: Result of part 2
+
+        Returns:
+            SolveResult for the day
+
+        """
+        return cls(
+            year=part1.year,
+            day=part1.day,
+            part1_answer=part1.answer,
+            part1_time=part1.time,
+            part2_answer=part2.answer,
+            part2_time=part2.time,
+            part1_stats=part1.stats,
+            part2_stats=part2.stats,
+            part1_status=part1.status,
+            part2_status=part2.status,
+            part1_cached=part1.cached,
+            part2_cached=part2.cached,
+            part1_profile=part1.profile,
+            part2_profile=part2.profile,
+            part1_memory=part1.memory,
+            part2_memory=part2.memory,
+            part1_spans=part1.spans,
+            part2_spans=part2.spans,
+            part1_parse_time=part1.parse_time,
+            part2_parse_time=part2.parse_time,
+            part1_over_budget=part1.over_budget,
+            part2_over_budget=part2.over_budget,
+        )
@@ -0,0 +1,360 @@
+"""Low-latency fetch of a puzzle and its input at unlock time.
+
+Ahead of the unlock, the fetcher opens one kept-alive connection for the
+puzzle page and one for the input, and estimates the offset between the local
+clock and the server's from the Date headers of cheap HEAD requests. At the
+unlock instant (in server time) both requests are sent at once on the warm
+connections. Each fetch records a latency breakdown: DNS lookup, connection
+setup, time to first byte and body transfer.
+
+It talks through http.client rather than requests, so the connections and
+the timing of each phase are under direct control.
+"""
+
+import http.client
+import socket
+import ssl
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, NamedTuple
+from urllib.parse import urlsplit
+
+import requests
+
+from aoc.http import AoCClient, unlock_time
+from aoc.httpcache import CachedPage
+
+
+class LatencyBreakdown(NamedTuple):
+    """Where the time of one request went, in seconds."""
+
+    dns: float  # Name resolution (0 on a warm connection)
+    connect: float  # TCP and TLS handshakes (0 on a warm connection)
+    ttfb: float  # From sending the request to the response headers
+    body: float  # Reading the response body
+
+    @property
+    def total(self) -> float:
+        """Total latency of the request."""
+        return self.dns + self.connect + self.ttfb + self.body
+
+
+class ClockOffset(NamedTuple):
+    """Server clock minus local clock, known within an interval."""
+
+    low: float
+    high: float
+
+    @property
+    def estimate(self) -> float:
+        """Middle of the interval."""
+        return (self.low + self.high) / 2
+
+
+class UnlockResult(NamedTuple):
+    """Puzzle page and input fetched at unlock."""
+
+    puzzle: str
+    input: str
+    puzzle_latency: LatencyBreakdown
+    input_latency: LatencyBreakdown
+    offset: ClockOffset  # Clock offset used to time the requests
+    sent_at: float  # Server time the requests were sent, as an epoch
+
+
+def _open_socket(addresses: list[tuple[Any, ...]], timeout: float) -> socket.socket:
+    """Connect to the first reachable address returned by getaddrinfo.
+
+    Args:
+        addresses: Results of socket.getaddrinfo
+        timeout: Timeout of each connection attempt, in seconds
+
+    Returns:
+        Connected socket, with Nagle's algorithm off like http.client's
+
+    Raises:
+        OSError: If no address accepts the connection
+
+    """
+    msg = "getaddrinfo returned no address"
+    error = OSError(msg)
+    for family, kind, proto, _, address in addresses:
+        sock = socket.socket(family, kind, proto)
+        try:
+            sock.settimeout(timeout)
+            sock.connect(address)
+        except OSError as e:
+            sock.close()
+            error = e
+            continue
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+    raise error
+
+
+class _WarmConnection:
+    """One kept-alive connection with timed requests."""
+
+    def __init__(self, fetcher: "UnlockFetcher") -> None:
+        self.fetcher = fetcher
+        self.connection: http.client.HTTPConnection | None = None
+
+    def _ensure(self) -> tuple[float, float]:
+        """Open the connection if it is not open yet.
+
+        Returns:
+            Seconds spent on (DNS, connect), zero when already open
+
+        """
+        if self.connection is not None and self.connection.sock is not None:
+            return 0.0, 0.0
+        fetcher = self.fetcher
+        start = time.perf_counter()
+        addresses = socket.getaddrinfo(
+            fetcher.host, fetcher.port, type=socket.SOCK_STREAM
+        )
+        resolved = time.perf_counter()
+        self.connection = fetcher.connection_class(
+            fetcher.host, fetcher.port, timeout=fetcher.client.timeout
+        )
+        # Connected to the resolved address, as connect() would resolve again
+        sock = _open_socket(addresses, fetcher.client.timeout)
+        if fetcher.tls is not None:
+            sock = fetcher.tls.wrap_socket(sock, server_hostname=fetcher.host)
+        self.connection.sock = sock
+        return resolved - start, time.perf_counter() - resolved
+
+    def _send(
+        self, method: str, path: str
+    ) -> tuple[int, str, str | None, LatencyBreakdown]:
+        dns, connect = self._ensure()
+        assert self.connection is not None  # noqa: S101 - set by _ensure
+        start = time.perf_counter()
+        self.connection.request(method, path, headers=self.fetcher.headers)
+        response = self.connection.getresponse()
+        headers_at = time.perf_counter()
+        body = response.read().decode()
+        latency = LatencyBreakdown(
+            dns, connect, headers_at - start, time.perf_counter() - headers_at
+        )
+        return response.status, body, response.getheader("Date"), latency
+
+    def request(
+        self, method: str, path: str
+    ) -> tuple[int, str, str | None, LatencyBreakdown]:
+        """Send a request, reconnecting once if the server closed the connection.
+
+        Args:
+            method: "GET" or "HEAD"
+            path: Path on the server
+
+        Returns:
+            Tuple of (status, body, Date header, latency breakdown)
+
+        """
+        try:
+            return self._send(method, path)
+        except (ConnectionError, http.client.HTTPException):
+            # Kept-alive connections may be closed by the server while idle
+            self.close()
+            return self._send(method, path)
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+class UnlockFetcher:
+    """Fetches a puzzle and its input as soon as they unlock."""
+
+    def __init__(
+        self,
+        client: AoCClient,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+        keepalive: float = 30.0,
+        retry_delay: float = 0.05,
+        retries: int = 40,
+    ) -> None:
+        """Prepare to fetch through a client's server and credentials.
+
+        Args:
+            client: Client whose base URL, cookie, rate limiter and cache are
+                used
+            clock: Local epoch clock in seconds
+            sleep: Function used to wait for the unlock
+            keepalive: Seconds between HEAD requests keeping connections warm
+                (and refining the clock offset) while waiting
+            retry_delay: Seconds between attempts if the puzzle is not
+                unlocked yet when requested (404)
+            retries: Maximum number of such attempts
+
+        """
+        self.client = client
+        self.clock = clock
+        self.sleep = sleep
+        self.keepalive = keepalive
+        self.retry_delay = retry_delay
+        self.retries = retries
+
+        url = urlsplit(client.base_url)
+        self.host = url.hostname or ""
+        self.port = url.port or (443 if url.scheme == "https" else 80)
+        self.connection_class: type[http.client.HTTPConnection] = (
+            http.client.HTTPSConnection
+            if url.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        # Sockets are opened here and wrapped in TLS before http.client sees them
+        self.tls = ssl.create_default_context() if url.scheme == "https" else None
+        self.headers = {
+            **client.headers,
+            "Cookie": f"session={client.session}",
+            "Connection": "keep-alive",
+        }
+        self.offset = ClockOffset(float("-inf"), float("inf"))
+        self.setup: list[LatencyBreakdown] = []
+        self._connections = [_WarmConnection(self), _WarmConnection(self)]
+
+    def _sample_clock(self, connection: _WarmConnection) -> LatencyBreakdown:
+        """Ping the server and narrow the clock offset with its Date header.
+
+        The Date header has one-second resolution: the server clock read some
+        time in [date, date + 1) while the request was in flight, which bounds
+        the offset. Intersecting the bounds of several samples narrows it.
+
+        Args:
+            connection: Connection to ping on
+
+        Returns:
+            Latency of the ping
+
+        """
+        self.client.limiter.acquire()
+        sent = self.clock()
+        _, _, date, latency = connection.request("HEAD", "/")
+        received = self.clock()
+        if date is not None:
+            server = parsedate_to_datetime(date).timestamp()
+            low = max(self.offset.low, server - received)
+            high = min(self.offset.high, server + 1 - sent)
+            if low <= high:
+                self.offset = ClockOffset(low, high)
+            else:
+                # The clocks drifted apart since the first samples; start over
+                self.offset = ClockOffset(server - received, server + 1 - sent)
+        return latency
+
+    def warm(self) -> ClockOffset:
+        """Open the connections and estimate the server clock offset.
+
+        Returns:
+            Offset of the server clock, for information
+
+        """
+        self.setup = [self._sample_clock(c) for c in self._connections]
+        if self.offset.low == float("-inf"):
+            # No Date header: trust the local clock and rely on 404 retries
+            self.offset = ClockOffset(0.0, 0.0)
+        return self.offset
+
+    def server_time(self) -> float:
+        """Get the estimated server time.
+
+        Returns:
+            Epoch seconds on the server clock
+
+        """
+        return self.clock() + self.offset.estimate
+
+    def wait_until(self, moment: datetime) -> None:
+        """Sleep until a moment in server time, keeping connections warm.
+
+        The wake-up time uses the low end of the offset interval, so the
+        server clock has certainly reached the moment when this returns.
+
+        Args:
+            moment: Aware datetime to wait for
+
+        """
+        target = moment.timestamp()
+        while (delay := target - self.offset.low - self.clock()) > self.keepalive:
+            self.sleep(self.keepalive)
+            for connection in self._connections:
+                self._sample_clock(connection)
+        if delay > 0:
+            self.sleep(delay)
+
+    def _get(
+        self, connection: _WarmConnection, path: str
+    ) -> tuple[str, LatencyBreakdown]:
+        """Fetch a path, retrying while the puzzle is still locked.
+
+        Args:
+            connection: Connection to use
+            path: Path on the server
+
+        Returns:
+            Tuple of (body, latency of the successful request)
+
+        Raises:
+            requests.HTTPError: If the server keeps refusing the request
+
+        """
+        status = 0
+        for attempt in range(self.retries):
+            self.client.limiter.acquire()
+            status, body, _, latency = connection.request("GET", path)
+            if status == http.client.OK:
+                return body, latency
+            if status != http.client.NOT_FOUND:
+                break
+            if attempt < self.retries - 1:
+                self.sleep(self.retry_delay)
+        msg = f"GET {path} failed with status {status}"
+        raise requests.HTTPError(msg)
+
+    def fetch_at_unlock(self, year: int, day: int) -> UnlockResult:
+        """Wait for a puzzle to unlock, then fetch its page and input at once.
+
+        Both are stored in the client's cache (input.txt and the page cache).
+
+        Args:
+            year: Year of the puzzle
+            day: Day of the puzzle (1-25)
+
+        Returns:
+            Page, input, latencies and timing information
+
+        """
+        if not self.setup:
+            self.warm()
+        self.wait_until(unlock_time(year, day))
+        sent_at = self.server_time()
+
+        puzzle_conn, input_conn = self._connections
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            puzzle = pool.submit(self._get, puzzle_conn, f"/{year}/day/{day}")
+            puzzle_input = pool.submit(
+                self._get, input_conn, f"/{year}/day/{day}/input"
+            )
+            (page, page_latency), (text, text_latency) = (
+                puzzle.result(),
+                puzzle_input.result(),
+            )
+
+        if self.client.cache is not None:
+            self.client.cache.store_page(year, day, CachedPage(page))
+            self.client.cache.store_input(year, day, text)
+        return UnlockResult(
+            page, text, page_latency, text_latency, self.offset, sent_at
+        )
+
+    def close(self) -> None:
+        """Close the warm connections."""
+        for connection in self._connections:
+            connection.close()
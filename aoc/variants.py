@@ -0,0 +1,136 @@
+"""Named implementations of puzzle parts and per-machine defaults.
+
+A part module's ``solve`` is its "reference" implementation. The module may
+register alternatives in a ``VARIANTS`` dict, mapping names to callables that
+take the raw input like ``solve``, so a readable reference can live next to
+optimized engines. ``aoc variants`` checks that every implementation gives the
+same answer, benchmarks them side by side and can record the fastest as the
+default of the machine it ran on. Runs use that default unless an
+implementation is requested explicitly.
+"""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from aoc.helpers import get_cache_dir
+
+REFERENCE = "reference"
+
+
+def implementations(module: ModuleType) -> dict[str, Callable[[str], Any]]:
+    """List the implementations of a part.
+
+    Args:
+        module: Part module
+
+    Returns:
+        Solvers by name, the reference first
+
+    """
+    return {REFERENCE: module.solve, **getattr(module, "VARIANTS", {})}
+
+
+class VariantDefaults:
+    """Implementation chosen for each part on each machine, persisted as JSON."""
+
+    def __init__(self, path: Path | None = None, machine: str | None = None) -> None:
+        """Load the defaults file.
+
+        Args:
+            path: JSON file to use (defaults to variants.json in the cache dir)
+            machine: Machine the defaults apply to (defaults to this one)
+
+        """
+        self.path = path or get_cache_dir() / "variants.json"
+        self._machine = machine
+        self.defaults: dict[str, dict[str, str]] = {}
+        if self.path.exists():
+            try:
+                self.defaults = json.loads(self.path.read_text())
+            except json.JSONDecodeError:
+                # A corrupt file only costs us the choice of implementation
+                self.defaults = {}
+
+    @property
+    def machine(self) -> str:
+        """Identifier of the machine the defaults apply to."""
+        if self._machine is None:
+            # Only needed once defaults exist, so sqlite stays off the solve path
+            from aoc.bench.history import machine_id
+
+            self._machine = machine_id()
+        return self._machine
+
+    @staticmethod
+    def _key(year: int, day: int, part: int) -> str:
+        return f"{year}/{day}/{part}"
+
+    def get(self, year: int, day: int, part: int) -> str | None:
+        """Get the default implementation of a part on this machine.
+
+        Args:
+            year: Year of the puzzle
+            day: Day of the puzzle
+            part: Part number
+
+        Returns:
+            Implementation name, or None to use the reference
+
+        """
+        if not self.defaults:
+            return None
+        return self.defaults.get(self.machine, {}).get(self._key(year, day, part))
+
+    def set(self, year: int, day: int, part: int, name: str) -> None:
+        """Choose the default implementation of a part on this machine.
+
+        Args:
+            year: Year of the puzzle
+            day: Day of the puzzle
+            part: Part number
+            name: Implementation name
+
+        """
+        self.defaults.setdefault(self.machine, {})[self._key(year, day, part)] = name
+
+    def save(self) -> None:
+        """Write the defaults back to disk."""
+        self.path.write_text(json.dumps(self.defaults, indent=2, sort_keys=True))
+
+
+def resolve(
+    module: ModuleType, year: int, day: int, part: int, name: str | None = None
+) -> tuple[str, Callable[[str], Any]]:
+    """Pick the implementation of a part to run.
+
+    Args:
+        module: Part module
+        year: Year of the puzzle
+        day: Day of the puzzle
+        part: Part number
+        name: Implementation to run (None for this machine's default, or the
+            reference when there is none or it no longer exists)
+
+    Returns:
+        Tuple of (implementation name, solver)
+
+    Raises:
+        ValueError: If the requested implementation does not exist
+
+    """
+    solvers = implementations(module)
+    if name is None:
+        if len(solvers) == 1:
+            return REFERENCE, module.solve
+        chosen = VariantDefaults().get(year, day, part)
+        name = chosen if chosen in solvers else REFERENCE
+    if name not in solvers:
+        msg = (
+            f"{year} day {day} part {part} has no implementation {name!r} "
+            f"(available: {', '.join(solvers)})"
+        )
+        raise ValueError(msg)
+    return name, solvers[name]
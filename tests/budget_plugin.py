@@ -0,0 +1,91 @@
+"""Pytest plugin checking puzzle parts against their budgets.
+
+Tests marked ``budget`` use the ``enforce_budget`` fixture to run a part on
+its real input and fail with BudgetExceeded when it overruns by more than the
+tolerance. Those failures are counted and listed as "over budget", apart from
+wrong answers, but still make the run fail.
+
+The budget tests re-solve every part on its real input, so they are
+deselected by default and run with ``-m budget``.
+
+Usage:
+    pytest tests/puzzles -m budget --budget-tolerance 2
+
+"""
+
+from collections.abc import Callable, Generator
+
+import pytest
+
+from aoc.bench.budgets import measure_overruns
+from aoc.runner import BUDGET_TOLERANCE
+
+
+class BudgetExceeded(Exception):  # noqa: N818 - reads as the outcome it reports
+    """A part ran over its budget."""
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the tolerance option."""
+    parser.addoption(
+        "--budget-tolerance",
+        type=float,
+        default=BUDGET_TOLERANCE,
+        help=f"factor over a part's budget still counted as noise ({BUDGET_TOLERANCE})",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the budget marker."""
+    config.addinivalue_line(
+        "markers", "budget: checks puzzle parts against their declared budget"
+    )
+
+
+@pytest.fixture
+def enforce_budget(request: pytest.FixtureRequest) -> Callable[[int, int, int], None]:
+    """Check a part against its budget, raising BudgetExceeded on overruns."""
+    tolerance = request.config.getoption("budget_tolerance")
+
+    def enforce(year: int, day: int, part: int) -> None:
+        if overruns := measure_overruns(year, day, part, tolerance):
+            raise BudgetExceeded("; ".join(overruns))
+
+    return enforce
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(
+    call: pytest.CallInfo[None],
+) -> Generator[None, pytest.TestReport, pytest.TestReport]:
+    """Tag the reports of tests that failed on a budget."""
+    report = yield
+    if call.excinfo is not None and call.excinfo.errisinstance(BudgetExceeded):
+        report.user_properties.append(("over_budget", str(call.excinfo.value)))
+    return report
+
+
+def _overrun(report: pytest.TestReport) -> str | None:
+    """Get the overrun a report was tagged with, if any."""
+    return next(
+        (str(value) for name, value in report.user_properties if name == "over_budget"),
+        None,
+    )
+
+
+def pytest_report_teststatus(
+    report: pytest.TestReport,
+) -> tuple[str, str, str] | None:
+    """Count budget failures in their own category."""
+    if report.failed and _overrun(report) is not None:
+        return "over budget", "O", "OVER BUDGET"
+    return None
+
+
+def pytest_terminal_summary(terminalreporter: pytest.TerminalReporter) -> None:
+    """List the overruns, apart from the failures section."""
+    reports = terminalreporter.stats.get("over budget", [])
+    if reports:
+        terminalreporter.write_sep("=", "budget overruns", yellow=True)
+        for report in reports:
+            terminalreporter.write_line(f"{report.nodeid}: {_overrun(report)}")
@@ -0,0 +1,18 @@
+"""Shared fixtures."""
+
+import pytest
+
+from aoc.fakeserver import FakeAoCServer, FakeServerConfig
+
+pytest_plugins = ["budget_plugin"]
+
+
+@pytest.fixture
+def fake_aoc(request):
+    """Local stand-in for adventofcode.com serving the committed puzzles.
+
+    Parametrize indirectly with a FakeServerConfig to change its behaviour.
+    """
+    config = getattr(request, "param", None) or FakeServerConfig()
+    with FakeAoCServer(config) as server:
+        yield server
@@ -0,0 +1,12 @@
+"""Budget checks of the Advent of Code 2016 parts on their real inputs."""
+
+import pytest
+
+from aoc.bench.budgets import budgeted_parts
+
+pytestmark = pytest.mark.budget
+
+
+@pytest.mark.parametrize(("day", "part"), budgeted_parts(2016))
+def test_within_budget(enforce_budget, day, part):
+    enforce_budget(2016, day, part)
@@ -13,6 +13,21 @@ The fourth floor contains nothing relevant."""
 
         assert part1.solve(puzzle_input) == "11"
 
+    def test_bitboard_variant_matches_reference(self):
+        """Test the bitboard variant on the example."""
+        puzzle_input = "\n".join(
+            [
+                "The first floor contains a hydrogen-compatible microchip and a "
+                "lithium-compatible microchip.",
+                "The second floor contains a hydrogen generator.",
+                "The third floor contains a lithium generator.",
+                "The fourth floor contains nothing relevant.",
+            ]
+        )
+
+        assert part1.solve_bitboard(puzzle_input) == "11"
+        assert part2.solve_bitboard(puzzle_input) == part2.solve(puzzle_input)
+
 
 class TestPart2:
     def test_example(self):
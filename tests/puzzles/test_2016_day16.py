@@ -19,6 +19,16 @@ class TestPart1:
         """Test full example with length 20."""
         assert part1.solve("10000\n", disk_length=20) == "01100"
 
+    def test_chunks_variant_matches_reference(self):
+        """Test the chunk parity variant against the pairing rounds."""
+        assert part1.solve_by_chunks("10000\n", disk_length=20) == "01100"
+        for initial in ("1", "0110", "10111100110001111"):
+            assert part1.solve_by_chunks(initial) == part1.solve(initial)
+            for disk_length in (2, 12, 1000):
+                assert part1.solve_by_chunks(initial, disk_length) == part1.solve(
+                    initial, disk_length
+                )
+
 
 class TestPart2:
     def test_reuses_part1(self):
@@ -23,6 +23,11 @@ class TestPart1:
         assert part1.generate_next_row("..^^.") == ".^^^^"
         assert part1.generate_next_row(".^^^^") == "^^..^"
 
+    def test_bitset_variant_matches_reference(self):
+        """Test the bitset variant on both examples."""
+        assert part1.count_safe_tiles_bitset("..^^.", 3) == 6
+        assert part1.solve_bitset(".^^.^.^^^^", total_rows=10) == "38"
+
 
 class TestPart2:
     def test_reuses_part1(self):
@@ -0,0 +1,55 @@
+"""Tests for the synthetic input generators."""
+
+import importlib
+
+import pytest
+
+from aoc.bench.generators import available_days, generate, main
+from aoc.scheduler import find_days
+
+# Parts too slow to check on every run, even on small inputs
+SLOW_PARTS = {(16, 2), (18, 2)}
+
+
+def test_every_solved_day_has_a_generator():
+    assert available_days(2016) == find_days(2016)
+    assert available_days(1999) == []
+
+
+def test_generation_is_seeded_and_scales():
+    small = generate(2016, 3, scale=30, seed=1)
+
+    assert small.text == generate(2016, 3, scale=30, seed=1).text
+    assert small.text != generate(2016, 3, scale=30, seed=2).text
+    assert len(generate(2016, 3, scale=300, seed=1).text) > 5 * len(small.text)
+
+
+@pytest.mark.parametrize("day", available_days(2016))
+def test_reference_answers_match_solvers(day):
+    generated = generate(2016, day, scale=4 if day == 15 else 40, seed=day)
+
+    for part, expected in enumerate(generated.answers, start=1):
+        if expected is None or (day, part) in SLOW_PARTS:
+            continue
+        module = importlib.import_module(
+            f"aoc.puzzles.year2016.day{day:02d}.part{part}"
+        )
+        assert str(module.solve(generated.text)) == expected, f"part {part}"
+
+
+def test_generate_rejects_bad_requests():
+    with pytest.raises(ValueError, match="at least 1"):
+        generate(2016, 1, scale=0)
+    with pytest.raises(ValueError, match="day 25"):
+        generate(2016, 25, scale=1)
+    with pytest.raises(ValueError, match="1999"):
+        generate(1999, 1, scale=1)
+
+
+def test_cli_prints_input_and_answers(capsys):
+    exit_code = main(["2016", "19", "--scale", "5", "--answers"])
+    captured = capsys.readouterr()
+
+    assert exit_code == 0
+    assert 5 <= int(captured.out) <= 10
+    assert captured.err.splitlines()[0].startswith("Part 1: ")
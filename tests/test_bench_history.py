@@ -0,0 +1,66 @@
+"""Tests for the SQLite benchmark history."""
+
+import pytest
+
+from aoc.bench.history import BenchmarkHistory, mann_whitney_p
+from aoc.types import BenchmarkStats, SolveResult, TimingStats
+
+
+def make_result(day, samples):
+    stats = BenchmarkStats(
+        wall=TimingStats.from_samples(samples), cpu=TimingStats.from_samples(samples)
+    )
+    return SolveResult(2016, day, 1, 0.0, 2, 0.0, part1_stats=stats, part2_stats=stats)
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = BenchmarkHistory(tmp_path / "bench.sqlite3")
+    yield history
+    history.close()
+
+
+def test_mann_whitney_p():
+    assert mann_whitney_p([5, 5, 5], [5, 5, 5]) == 1.0
+    assert mann_whitney_p(list(range(10)), list(range(100, 110))) < 0.001
+    assert mann_whitney_p([1, 3, 5, 7, 9], [2, 4, 6, 8, 10]) > 0.5
+
+
+def test_record_run_stores_metadata_and_samples(history):
+    run_id = history.record_run([make_result(1, [10, 20, 30])], note="first")
+
+    (run,) = history.runs()
+    assert (run.id, run.note) == (run_id, "first")
+    assert run.python_version
+    assert history.samples(run_id) == {
+        (2016, 1, 1): [10, 20, 30],
+        (2016, 1, 2): [10, 20, 30],
+    }
+    assert history.samples(run_id, "cpu")[(2016, 1, 1)] == [10, 20, 30]
+
+
+def test_compare_flags_significant_changes_only(history):
+    base = list(range(1000, 1020))
+    baseline = history.record_run([make_result(1, base), make_result(2, base)])
+    candidate = history.record_run(
+        [make_result(1, [2 * x for x in base]), make_result(2, base[::-1])]
+    )
+
+    comparisons = history.compare(baseline, candidate)
+    verdicts = {(c.day, c.part): c.verdict for c in comparisons}
+
+    assert verdicts[(1, 1)] == "regression"
+    assert verdicts[(2, 1)] == "unchanged"
+    reverse = history.compare(candidate, baseline)
+    assert reverse[0].verdict == "improvement"
+
+
+def test_compare_flags_default_sized_runs(history):
+    # Five samples, as benchmarked by default
+    baseline = history.record_run([make_result(1, [1, 2, 3, 4, 5])])
+    candidate = history.record_run([make_result(1, [10, 11, 12, 13, 14])])
+    few = history.record_run([make_result(1, [10, 11, 12])])
+
+    assert mann_whitney_p([1, 2, 3, 4, 5], [10, 11, 12, 13, 14]) < 0.01
+    assert history.compare(baseline, candidate)[0].verdict == "regression"
+    assert history.compare(few, few)[0].verdict == "inconclusive"
@@ -0,0 +1,44 @@
+"""Tests for per-part memory tracking."""
+
+import time
+
+from aoc.bench.memory import max_rss, measure_memory
+from aoc.runner import RunOptions, run_part
+
+
+def allocate(puzzle_input: str) -> int:
+    chunks = [bytearray(1024 * 1024) for _ in range(int(puzzle_input))]
+    time.sleep(0.1)  # Give the peak watcher time to take a snapshot
+    return len(chunks)
+
+
+def test_measure_memory_reports_peak_and_sites():
+    answer, stats = measure_memory(allocate, "8")
+
+    assert answer == 8
+    assert stats.peak_traced >= 8 * 1024 * 1024
+    assert stats.max_rss >= stats.peak_traced
+    site, size = stats.top_allocations[0]
+    assert "test_bench_memory.py" in site
+    assert size >= 8 * 1024 * 1024
+
+
+def test_max_rss_is_positive():
+    assert max_rss() > 0
+
+
+def test_rss_peak_covers_only_the_measured_call():
+    _, large = measure_memory(lambda size: len(b"x" * int(size)), str(256 * 2**20))
+    _, small = measure_memory(len, "1")
+
+    assert large.max_rss is not None
+    assert small.max_rss is not None
+    assert small.max_rss < large.max_rss - 128 * 2**20
+
+
+def test_run_part_tracks_memory():
+    result = run_part(2016, 1, 2, RunOptions(memory=True))
+
+    assert result.answer == 110
+    assert result.memory is not None
+    assert result.memory.peak_traced > 0
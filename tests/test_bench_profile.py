@@ -0,0 +1,47 @@
+"""Tests for per-part cProfile profiling."""
+
+import pytest
+
+from aoc.bench.profile import format_profile, profile_call, top_functions
+from aoc.bench.timing import BenchmarkConfig
+from aoc.puzzles.year2016.day04 import part1
+from aoc.runner import RunOptions, run_part
+
+
+def test_profile_call_ranks_solver_functions(tmp_path):
+    path = tmp_path / "day04.pstats"
+    puzzle_input = "aaaaa-bbb-z-y-x-123[abxyz]\n" * 200
+
+    assert profile_call(part1.solve, puzzle_input, path) == 123 * 200
+
+    by_cumulative = top_functions(path, limit=3)
+    assert "day04/part1.py" in by_cumulative[0].function
+    assert by_cumulative[0].function.endswith("(solve)")
+    by_own = top_functions(path, limit=50, sort="own")
+    assert by_own == sorted(by_own, key=lambda e: e.tottime, reverse=True)
+    assert any("compute_checksum" in e.function for e in by_own)
+
+
+def test_format_profile(tmp_path):
+    path = tmp_path / "day04.pstats"
+    profile_call(part1.solve, "aaaaa-bbb-z-y-x-123[abxyz]", path)
+
+    text = format_profile(path, limit=5)
+
+    assert "Top 5 by cumulative time:" in text
+    assert "Top 5 by own time:" in text
+
+
+def test_run_part_saves_profile(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path))
+
+    result = run_part(2016, 1, 1, RunOptions(profile=True))
+
+    assert result.answer == 161
+    assert result.profile == tmp_path / "profiles" / "year2016" / "day01_part1.pstats"
+    assert result.profile.exists()
+
+
+def test_profile_and_benchmark_are_exclusive():
+    with pytest.raises(ValueError, match="pick one of"):
+        RunOptions(bench=BenchmarkConfig(), profile=True)
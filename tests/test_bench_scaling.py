@@ -0,0 +1,58 @@
+"""Tests for the empirical complexity suite."""
+
+import pytest
+
+from aoc.bench.scaling import (
+    ScalingPoint,
+    ScalingReport,
+    fit_exponent,
+    main,
+    measure_scaling,
+    scaling_days,
+)
+
+
+def test_fit_exponent_recovers_power_laws():
+    sizes = [100, 200, 400, 800]
+
+    assert fit_exponent(sizes, [3 * n**2 for n in sizes]) == pytest.approx(2)
+    assert fit_exponent(sizes, [7 * n for n in sizes]) == pytest.approx(1)
+    # Costs under the floor fit as constant
+    assert fit_exponent(sizes, [n / 1000 for n in sizes]) == pytest.approx(0)
+    with pytest.raises(ValueError, match="two distinct"):
+        fit_exponent([100, 100], [1, 2])
+
+
+def test_super_linear_flags_each_resource():
+    point = ScalingPoint(1, 1, 1.0, 1)
+    report = ScalingReport(2016, 10, 1, [point], time_exponent=1.9, memory_exponent=1)
+
+    assert report.super_linear() == ["time"]
+    assert report.super_linear(tolerance=1) == []
+
+
+def test_measure_scaling_fits_a_linear_part():
+    report = measure_scaling(2016, 1, 1, steps=3, factor=4)
+
+    assert [point.scale for point in report.points] == [1000, 4000, 16000]
+    assert report.points[0].input_size < report.points[-1].input_size
+    assert 0.5 < report.time_exponent < 1.5
+
+
+def test_fixed_and_exponential_days_have_no_scaling_run():
+    days = scaling_days(2016)
+
+    assert {5, 11, 13, 14, 15, 17}.isdisjoint(days)
+    assert 10 in days
+    with pytest.raises(ValueError, match="no scaling run"):
+        measure_scaling(2016, 5, 1)
+    with pytest.raises(ValueError, match="at least 2 steps"):
+        measure_scaling(2016, 1, 1, steps=1)
+
+
+def test_cli_reports_exponents(capsys):
+    exit_code = main(["2016", "-d", "6", "-p", "2", "--steps", "2"])
+    [line] = capsys.readouterr().out.splitlines()
+
+    assert "2016 day  6 part 2: time n^" in line
+    assert exit_code == int("super-linear" in line)
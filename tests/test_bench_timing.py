@@ -0,0 +1,45 @@
+"""Tests for statistical benchmarking of solvers."""
+
+import pytest
+
+from aoc.bench.timing import BenchmarkConfig, benchmark
+from aoc.types import TimingStats
+
+
+def test_timing_stats_from_samples():
+    stats = TimingStats.from_samples([10, 20, 30, 40, 50])
+    assert stats.min_ns == 10
+    assert stats.median_ns == 30
+    assert stats.mean_ns == 30
+    assert stats.iqr_ns == 20
+    assert stats.stdev_ns == pytest.approx(15.811, rel=1e-3)
+
+
+def test_timing_stats_single_sample():
+    stats = TimingStats.from_samples([42])
+    assert (stats.median_ns, stats.stdev_ns, stats.iqr_ns) == (42, 0, 0)
+
+
+def test_benchmark_counts_warmup_and_repeats():
+    calls = []
+
+    def solve(puzzle_input: str) -> int:
+        calls.append(puzzle_input)
+        return len(calls)
+
+    answer, stats = benchmark(solve, "x", BenchmarkConfig(warmup=2, repeat=3))
+
+    assert answer == 5
+    assert len(stats.wall.samples) == len(stats.cpu.samples) == 3
+
+
+def test_benchmark_min_time_extends_repeats():
+    config = BenchmarkConfig(warmup=0, repeat=1, min_time=0.01, max_repeat=10**6)
+    _, stats = benchmark(lambda _: None, "", config)
+    assert len(stats.wall.samples) > 1
+    assert sum(stats.wall.samples) <= 10**9
+
+
+def test_invalid_config():
+    with pytest.raises(ValueError, match="repeat"):
+        BenchmarkConfig(repeat=0)
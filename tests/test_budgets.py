@@ -0,0 +1,82 @@
+"""Tests for per-part time and memory budgets."""
+
+import pytest
+
+from aoc.cli import main
+from aoc.puzzles.year2016.day01 import part1
+from aoc.runner import RunOptions, check_budget, run_part
+from aoc.types import Budget, MemoryStats, PartResult, PartStatus
+
+pytest_plugins = ["pytester"]
+
+
+def test_check_budget_allows_noise():
+    result = PartResult(2016, 1, 1, 161, time=0.12)
+
+    assert check_budget(Budget(time=0.1), result) == []
+    assert check_budget(Budget(time=0.05), result) == [
+        "time 120.0ms over the 50.0ms budget"
+    ]
+    assert check_budget(Budget(time=0.1), result, tolerance=1) != []
+    assert check_budget(None, result) == []
+
+
+def test_check_budget_uses_the_measurements_of_the_run():
+    traced = PartResult(2016, 1, 1, 161, time=5.0, memory=MemoryStats(3 * 2**20, 2**30))
+    failed = PartResult(2016, 1, 1, None, time=5.0, status=PartStatus.TIMEOUT)
+    budget = Budget(time=0.1, memory=2**20)
+
+    # Tracing inflates the time, so only memory counts
+    assert check_budget(budget, traced) == ["memory 3.0MiB over the 1.0MiB budget"]
+    assert check_budget(budget, PartResult(2016, 1, 1, 161, time=0.01)) == []
+    assert check_budget(budget, failed) == []
+
+
+def test_run_part_reports_overruns_but_keeps_the_answer(monkeypatch):
+    monkeypatch.setattr(part1, "BUDGET", Budget(time=1e-9), raising=False)
+
+    result = run_part(2016, 1, 1)
+    relaxed = run_part(2016, 1, 1, RunOptions(budget_tolerance=1e12))
+
+    assert (result.answer, result.status) == (161, PartStatus.OK)
+    assert result.over_budget[0].startswith("time ")
+    assert relaxed.over_budget == []
+
+
+def test_cli_exits_with_3_on_overruns(monkeypatch, capsys):
+    monkeypatch.setattr(part1, "BUDGET", Budget(time=1e-9), raising=False)
+
+    argv = ["run", "2016", "-d", "1", "-p", "1", "--no-cache", "--no-limits"]
+    exit_code = main([*argv, "-j", "1"])
+    captured = capsys.readouterr()
+
+    assert exit_code == 3
+    assert '"over_budget": "time ' in captured.out
+    assert captured.err.startswith("Over budget: 2016 day 1 part 1: time ")
+
+
+def test_plugin_reports_overruns_apart_from_failures(pytester):
+    pytester.makepyfile(
+        """
+        import pytest
+        from budget_plugin import BudgetExceeded
+
+        @pytest.mark.budget
+        def test_slow():
+            raise BudgetExceeded("time 90.0ms over the 50.0ms budget")
+
+        def test_wrong():
+            assert 1 == 2
+        """
+    )
+
+    result = pytester.runpytest("-p", "budget_plugin")
+
+    assert result.ret == pytest.ExitCode.TESTS_FAILED
+    result.stdout.fnmatch_lines(
+        [
+            "*budget overruns*",
+            "*test_slow: time 90.0ms over the 50.0ms budget",
+            "*1 failed, 1 over budget*",
+        ]
+    )
@@ -0,0 +1,64 @@
+"""Tests for the content-addressed result cache."""
+
+from aoc.cache import ResultCache, part_key, source_closure
+from aoc.scheduler import NO_LIMITS, Job, TimingHistory, run_jobs
+from aoc.types import PartResult, PartStatus
+
+
+def test_source_closure_follows_puzzle_imports():
+    closure = source_closure(2016, 4, 2)
+    assert set(closure) == {
+        "aoc.puzzles.year2016.day04.part2",
+        "aoc.puzzles.year2016.day04.part1",
+        "aoc.puzzles.year2016.day04",
+    }
+    # Names imported from a module are not modules themselves
+    assert set(source_closure(2016, 10, 2)) == {
+        "aoc.puzzles.year2016.day10.part2",
+        "aoc.puzzles.year2016.day10.part1",
+    }
+
+
+def test_part_key_depends_on_part():
+    assert part_key(2016, 1, 1) == part_key(2016, 1, 1)
+    assert part_key(2016, 1, 1) != part_key(2016, 1, 2)
+
+
+def test_put_and_get(tmp_path):
+    cache = ResultCache(tmp_path)
+    assert cache.get("abc", 2016, 1, 1) is None
+
+    cache.put("abc", PartResult(2016, 1, 1, 161, 0.25))
+    hit = cache.get("abc", 2016, 1, 1)
+
+    assert hit == PartResult(2016, 1, 1, 161, 0.25, cached=True)
+
+
+def test_failed_results_are_not_stored(tmp_path):
+    cache = ResultCache(tmp_path)
+    cache.put("abc", PartResult(2016, 1, 1, None, 1.0, status=PartStatus.TIMEOUT))
+    assert cache.get("abc", 2016, 1, 1) is None
+
+
+def test_eviction_keeps_recent_entries(tmp_path):
+    cache = ResultCache(tmp_path, max_bytes=100)
+    for i in range(10):
+        cache.put(f"key{i}", PartResult(2016, 1, 1, i, 0.1))
+
+    assert cache.get("key9", 2016, 1, 1) is not None
+    assert cache.get("key0", 2016, 1, 1) is None
+    assert sum(p.stat().st_size for p in tmp_path.glob("*.json")) <= 100
+
+
+def test_run_jobs_answers_from_cache(tmp_path):
+    cache = ResultCache(tmp_path / "results")
+    history = TimingHistory(tmp_path / "timings.json")
+    jobs = [Job(2016, 1, 1), Job(2016, 1, 2)]
+
+    first = run_jobs(jobs, workers=1, history=history, limits=NO_LIMITS, cache=cache)
+    second = run_jobs(jobs, workers=1, history=history, limits=NO_LIMITS, cache=cache)
+
+    assert not first[Job(2016, 1, 1)].cached
+    assert second[Job(2016, 1, 1)].cached
+    assert second[Job(2016, 1, 1)].answer == 161
+    assert second[Job(2016, 1, 2)].time == first[Job(2016, 1, 2)].time
@@ -0,0 +1,58 @@
+"""Tests for the machine-readable command-line entry point."""
+
+import argparse
+import csv
+import io
+import json
+
+import pytest
+
+from aoc.cli import CSV_FIELDS, main, parse_days, parse_years, select_jobs
+from aoc.scheduler import Job, find_days
+
+
+def test_parse_days():
+    assert parse_days("3,1-2,2") == [1, 2, 3]
+    assert parse_days("25") == [25]
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_days("0-3")
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_days("one")
+
+
+def test_parse_years_stops_at_the_current_year():
+    assert parse_years("2016,2015-2016") == [2015, 2016]
+    with pytest.raises(argparse.ArgumentTypeError, match="between 2015 and"):
+        parse_years("2015-20150")
+    with pytest.raises(argparse.ArgumentTypeError, match="between 2015 and"):
+        parse_years("2014")
+
+
+def test_select_jobs():
+    assert select_jobs(2016, [2], [1, 2]) == [Job(2016, 2, 1), Job(2016, 2, 2)]
+    assert len(select_jobs(2016, None, [2])) == len(find_days(2016))
+    with pytest.raises(ValueError, match="No solutions"):
+        select_jobs(1999, [1], [1])
+
+
+def test_run_prints_json_lines(capsys):
+    exit_code = main(["run", "2016", "-d", "1,2", "-p", "1", "--no-cache"])
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert exit_code == 0
+    assert [(r["day"], r["part"], r["status"]) for r in records] == [
+        (1, 1, "OK"),
+        (2, 1, "OK"),
+    ]
+    assert records[0]["answer"] == 161
+
+
+def test_bench_prints_csv_with_distributions(capsys):
+    argv = ["bench", "2016", "-d", "1", "-p", "2", "-f", "csv", "--repeat", "3"]
+    exit_code = main([*argv, "--warmup", "0", "--no-record", "--no-limits"])
+    rows = list(csv.DictReader(io.StringIO(capsys.readouterr().out)))
+
+    assert exit_code == 0
+    assert list(rows[0]) == CSV_FIELDS
+    assert rows[0]["samples"] == "3"
+    assert float(rows[0]["wall_min_ns"]) <= float(rows[0]["wall_median_ns"])
@@ -0,0 +1,63 @@
+"""Tests for the warm solver daemon."""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from aoc.daemon import SolverDaemon, request, serve, solve
+from aoc.runner import load_part, run_part
+
+
+def test_modules_stay_loaded_until_their_sources_change():
+    daemon = SolverDaemon()
+    first = daemon.handle({"op": "solve", "year": 2016, "day": 4, "part": 2})
+    second = daemon.handle({"op": "solve", "year": 2016, "day": 4, "part": 2})
+    assert first["status"] == second["status"] == "OK"
+    assert first["answer"] == second["answer"]
+    assert second["reloaded"] is False
+
+    # A change to an imported module reloads the part that depends on it
+    path = Path(str(load_part(2016, 4, 1).__file__))
+    stat = path.stat()
+    try:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        third = daemon.handle({"op": "solve", "year": 2016, "day": 4, "part": 2})
+    finally:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert third["reloaded"] is True
+    assert third["answer"] == first["answer"]
+
+
+def test_errors_are_reported_to_the_client():
+    daemon = SolverDaemon()
+    response = daemon.handle({"op": "solve", "year": 2016, "day": 99, "part": 1})
+    assert response["status"] == "ERROR"
+    assert daemon.handle({"op": "dance"})["status"] == "ERROR"
+
+
+def test_serve_over_unix_socket(tmp_path):
+    path = tmp_path / "daemon.sock"
+    server = threading.Thread(target=serve, args=(path,))
+    server.start()
+    try:
+        for _ in range(100):
+            if path.exists():
+                break
+            time.sleep(0.01)
+
+        response = solve(2016, 1, 1, path)
+        assert response["status"] == "OK"
+        assert response["answer"] == run_part(2016, 1, 1).answer
+        with pytest.raises(RuntimeError, match="already running"):
+            serve(path)
+    finally:
+        request({"op": "stop"}, path)
+        server.join(timeout=5)
+
+    assert not server.is_alive()
+    assert not path.exists()
+    with pytest.raises(ConnectionError):
+        solve(2016, 1, 1, path)
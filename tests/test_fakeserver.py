@@ -0,0 +1,93 @@
+"""Tests for the local stand-in server, driving the real AoCClient against it."""
+
+import pytest
+import requests
+
+from aoc.fakeserver import FakeServerConfig, Puzzle
+from aoc.helpers import get_puzzle_dir
+from aoc.http import AoCClient, RetryPolicy, TokenBucket
+from aoc.httpcache import CacheStats, HttpCache
+from aoc.markdown import generate_puzzle_markdown
+from aoc.submit import Hint, Verdict, parse_response
+
+
+def make_client(server, **kwargs):
+    kwargs.setdefault("limiter", TokenBucket(rate=1000, capacity=1000))
+    kwargs.setdefault("retry", RetryPolicy(attempts=3, base_delay=0.001))
+    kwargs.setdefault("cache", False)
+    return AoCClient("secret", base_url=server.url, **kwargs)
+
+
+def test_inputs_are_served_from_the_tree(fake_aoc):
+    with make_client(fake_aoc) as client:
+        text = client.fetch_input(2016, 3)
+    assert text == (get_puzzle_dir(2016, 3) / "input.txt").read_text()
+
+
+def test_pages_convert_back_to_the_committed_puzzle(fake_aoc):
+    markdown = (get_puzzle_dir(2016, 2) / "puzzle.md").read_text()
+    with make_client(fake_aoc) as client:
+        regenerated = generate_puzzle_markdown(client.fetch_puzzle(2016, 2), 2)
+
+    original, copy = Puzzle(2016, 2, markdown), Puzzle(2016, 2, regenerated)
+    assert copy.title == original.title
+    assert copy.answers == original.answers
+    assert len(copy.parts) == 2
+
+
+def test_unknown_and_locked_days_are_not_found(fake_aoc):
+    with make_client(fake_aoc) as client:
+        with pytest.raises(requests.HTTPError, match="404"):
+            client.fetch_puzzle(2016, 26)
+        with pytest.raises(requests.HTTPError, match="404"):
+            client.fetch_puzzle(2099, 1)
+
+
+def test_injected_errors_are_retried(fake_aoc):
+    fake_aoc.fail_next(503, times=2)
+    with make_client(fake_aoc) as client:
+        client.fetch_input(2016, 1)
+    assert [status for _, _, status in fake_aoc.log] == [503, 503, 200]
+
+
+@pytest.mark.parametrize("fake_aoc", [FakeServerConfig(rate_limit=2)], indirect=True)
+def test_rate_limit_answers_429_with_retry_after(fake_aoc):
+    delays = []
+    retry = RetryPolicy(attempts=2, base_delay=0.001)
+    with make_client(fake_aoc, retry=retry, sleep=delays.append) as client:
+        client.fetch_input(2016, 1)
+        client.fetch_input(2016, 1)
+        with pytest.raises(requests.HTTPError, match="429"):
+            client.fetch_input(2016, 1)
+    assert delays == [1.0]  # Retry-After honoured
+
+
+def test_pages_are_revalidated_with_etags(fake_aoc, tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "aoc.httpcache.get_puzzle_dir", lambda _, day: tmp_path / f"{day:02d}"
+    )
+    with make_client(fake_aoc, cache=HttpCache()) as client:
+        first = client.fetch_puzzle(2016, 1)
+        assert client.fetch_puzzle(2016, 1) == first
+
+    assert client.cache.stats == CacheStats(hits=0, revalidated=1, misses=1)
+    assert [status for _, _, status in fake_aoc.log] == [200, 304]
+
+
+def test_submissions_are_judged_with_cooldowns(fake_aoc):
+    answer = Puzzle(2016, 1, (get_puzzle_dir(2016, 1) / "puzzle.md").read_text())
+    correct = int(answer.answers[0])
+    with make_client(fake_aoc) as client:
+        wrong = parse_response(client.submit_answer(2016, 1, 1, correct + 1))
+        bounced = parse_response(client.submit_answer(2016, 1, 1, correct))
+        fake_aoc.cooldowns.clear()
+        right = parse_response(client.submit_answer(2016, 1, 1, correct))
+        again = parse_response(client.submit_answer(2016, 1, 1, correct))
+
+    assert wrong.verdict is Verdict.WRONG
+    assert wrong.hint is Hint.TOO_HIGH
+    assert wrong.wait == 60
+    assert bounced.verdict is Verdict.TOO_SOON
+    assert 0 < bounced.wait <= 60
+    assert right.verdict is Verdict.CORRECT
+    assert again.verdict is Verdict.ALREADY_SOLVED
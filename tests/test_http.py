@@ -0,0 +1,164 @@
+"""Tests for the pooled, rate-limited AoC client against a local stub server."""
+
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from aoc.http import AoCClient, RetryPolicy, TokenBucket
+from aoc.httpcache import CacheStats, HttpCache
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, so connection reuse is visible
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, self.client_address[1]))
+            server.cookies.add(self.headers.get("Cookie"))
+            status, body = server.replies.popleft() if server.replies else (200, "ok")
+        if server.etag is not None and self.headers.get("If-None-Match") == server.etag:
+            status, body = 304, ""
+        payload = body.encode()
+        self.send_response(status)
+        if server.etag is not None:
+            self.send_header("ETag", server.etag)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.cookies = set()
+    server.replies = deque()
+    server.etag = None
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(server, **kwargs):
+    host, port = server.server_address
+    kwargs.setdefault("limiter", TokenBucket(rate=1000, capacity=1000))
+    kwargs.setdefault("retry", RetryPolicy(attempts=3, base_delay=0.001))
+    kwargs.setdefault("cache", False)
+    return AoCClient("secret", base_url=f"http://{host}:{port}", **kwargs)
+
+
+def test_connection_is_reused(stub):
+    with make_client(stub) as client:
+        assert client.fetch_input(2016, 1) == "ok"
+        assert client.fetch_puzzle(2016, 1) == "ok"
+
+    assert [path for path, _ in stub.requests] == ["/2016/day/1/input", "/2016/day/1"]
+    assert len({port for _, port in stub.requests}) == 1
+    assert stub.cookies == {"session=secret"}
+
+
+def test_transient_errors_are_retried(stub):
+    stub.replies.extend([(503, "busy"), (502, "bad gateway"), (200, "input")])
+    delays = []
+    with make_client(stub, sleep=delays.append) as client:
+        assert client.fetch_input(2016, 1) == "input"
+    assert len(stub.requests) == 3
+    assert len(delays) == 2
+    assert all(0 <= delay <= 0.002 for delay in delays)
+
+
+def test_retries_are_bounded_and_client_errors_raise_at_once(stub):
+    stub.replies.extend([(500, "")] * 3 + [(404, "")])
+    with make_client(stub, sleep=lambda _: None) as client:
+        with pytest.raises(requests.HTTPError, match="500"):
+            client.fetch_input(2016, 1)
+        assert len(stub.requests) == 3
+
+        with pytest.raises(requests.HTTPError, match="404"):
+            client.fetch_input(2016, 1)
+        assert len(stub.requests) == 4
+
+
+def test_client_is_shared_between_threads(stub):
+    errors = []
+
+    def fetch(client):
+        try:
+            for _ in range(5):
+                client.fetch_input(2016, 1)
+        except requests.RequestException as e:
+            errors.append(e)
+
+    with make_client(stub, pool_size=4) as client:
+        threads = [threading.Thread(target=fetch, args=(client,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert not errors
+    assert len(stub.requests) == 20
+    assert len({port for _, port in stub.requests}) <= 4
+
+
+def test_token_bucket_allows_bursts_then_holds_the_rate():
+    now = [0.0]
+    waits = []
+
+    def sleep(seconds):
+        waits.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=2, capacity=3, clock=lambda: now[0], sleep=sleep)
+    for _ in range(5):
+        bucket.acquire()
+
+    assert waits == [0.5, 0.5]
+    assert now[0] == pytest.approx(1.0)
+
+
+def test_retry_delay_honours_retry_after():
+    policy = RetryPolicy(base_delay=1, max_delay=8)
+    assert policy.delay(0, "3") == 3
+    assert policy.delay(0, "60") == 8
+    assert all(0 <= policy.delay(10) <= 8 for _ in range(100))
+
+
+@pytest.fixture
+def puzzles(tmp_path, monkeypatch):
+    monkeypatch.setattr("aoc.helpers.get_year_dir", lambda year: tmp_path / str(year))
+    return tmp_path
+
+
+def test_puzzle_pages_are_revalidated(stub, puzzles):
+    stub.etag = '"v1"'
+    stub.replies.extend([(200, "part one"), (200, "unused"), (200, "part two")])
+    with make_client(stub, cache=HttpCache()) as client:
+        assert client.fetch_puzzle(2016, 1) == "part one"
+        assert client.fetch_puzzle(2016, 1) == "part one"  # 304 Not Modified
+        stub.etag = '"v2"'  # Part 2 unlocked
+        assert client.fetch_puzzle(2016, 1) == "part two"
+
+    assert client.cache.stats == CacheStats(hits=0, revalidated=1, misses=2)
+    assert (puzzles / "2016" / "day01" / ".http-cache" / "puzzle.json").exists()
+
+
+def test_inputs_are_fetched_once(stub, puzzles):
+    stub.replies.append((200, "1 2 3\n"))
+    with make_client(stub, cache=HttpCache()) as client:
+        assert client.fetch_input(2016, 1) == "1 2 3\n"
+        assert client.fetch_input(2016, 1) == "1 2 3\n"
+
+    assert len(stub.requests) == 1
+    assert client.cache.stats == CacheStats(hits=1, revalidated=0, misses=1)
+    assert (puzzles / "2016" / "day01" / "input.txt").read_text() == "1 2 3\n"
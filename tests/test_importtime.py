@@ -0,0 +1,52 @@
+"""Tests for the cold-start import cost of the solving path."""
+
+import pytest
+
+from aoc import helpers
+from aoc.bench.importtime import (
+    SOLVER_PATH,
+    STARTUP_BUDGET_US,
+    format_import_report,
+    measure_imports,
+)
+from aoc.cli import main
+from aoc.helpers import get_year_dir
+
+
+def test_solver_path_is_stdlib_only_and_within_budget():
+    report = measure_imports(SOLVER_PATH)
+
+    assert report.third_party == []
+    assert {r.module for r in report.records if r.depth == 0} >= set(SOLVER_PATH)
+    assert report.total_us <= STARTUP_BUDGET_US, format_import_report(report)
+    # Loaded by run_year and profiled runs only
+    assert not {"multiprocessing", "pstats"} & {r.module for r in report.records}
+
+
+def test_solutions_do_not_load_html_libraries():
+    parts = tuple(
+        f"aoc.puzzles.year2016.{path.parent.name}.{path.stem}"
+        for path in sorted(get_year_dir(2016).glob("day*/part[12].py"))
+    )
+
+    report = measure_imports((*parts, "aoc.helpers"))
+
+    assert report.third_party == []
+
+
+def test_markdown_helpers_still_reachable_from_helpers():
+    from aoc import markdown
+
+    assert helpers.save_puzzle_markdown is markdown.save_puzzle_markdown
+    with pytest.raises(AttributeError):
+        _ = helpers.no_such_helper
+
+
+def test_cli_prints_the_report(capsys):
+    exit_code = main(["importtime", "aoc.spans"])
+    lines = capsys.readouterr().out.splitlines()
+
+    assert exit_code == 0
+    assert lines[0].endswith("imported package")
+    assert lines[-1].startswith("Total: ")
+    assert "for aoc.spans (budget" in lines[-1]
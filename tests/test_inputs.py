@@ -0,0 +1,74 @@
+"""Tests for the memoized, memory-mapped input layer."""
+
+import os
+
+import pytest
+
+from aoc.helpers import get_puzzle_dir, read_puzzle_input
+from aoc.inputs import PuzzleInput, get_input, open_input
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"\n  abc\r\ndef\n\nghi  \n\n")
+    return path
+
+
+def test_views_cover_the_stripped_input(input_file):
+    puzzle = PuzzleInput(input_file)
+
+    assert puzzle.text == "abc\ndef\n\nghi"
+    assert bytes(puzzle.data) == b"abc\r\ndef\n\nghi"
+    assert list(puzzle.lines()) == puzzle.text.splitlines()
+    assert [bytes(line) for line in puzzle.byte_lines()] == [
+        b"abc",
+        b"def",
+        b"",
+        b"ghi",
+    ]
+
+
+def test_byte_lines_are_views_of_the_mapping(input_file):
+    puzzle = PuzzleInput(input_file)
+    first = next(puzzle.byte_lines())
+    assert isinstance(first, memoryview)
+    assert first.obj is puzzle.data.obj
+
+
+def test_empty_input(tmp_path):
+    (tmp_path / "input.txt").write_text("\n")
+    puzzle = PuzzleInput(tmp_path / "input.txt")
+    assert puzzle.text == ""
+    assert list(puzzle.lines()) == []
+    assert list(puzzle.byte_lines()) == []
+
+    (tmp_path / "empty.txt").touch()
+    assert PuzzleInput(tmp_path / "empty.txt").text == ""
+
+
+def test_inputs_are_memoized_until_replaced(input_file):
+    first = open_input(input_file)
+    assert open_input(input_file) is first
+    assert first.text is open_input(input_file).text
+
+    replacement = input_file.with_suffix(".part")
+    replacement.write_text("new")
+    replacement.replace(input_file)
+    assert open_input(input_file).text == "new"
+
+
+def test_rewritten_inputs_are_reloaded(input_file):
+    assert open_input(input_file).text.startswith("abc")
+    input_file.write_text("xyz\n")
+    os.utime(input_file, ns=(1, 1))
+    assert open_input(input_file).text == "xyz"
+
+
+def test_read_puzzle_input_uses_the_memo():
+    path = get_puzzle_dir(2016, 7) / "input.txt"
+    text = read_puzzle_input(2016, 7)
+
+    assert text == path.read_text().strip()
+    assert read_puzzle_input(2016, 7) is text
+    assert get_input(2016, 7).text is text
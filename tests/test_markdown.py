@@ -0,0 +1,103 @@
+"""Tests for the stdlib puzzle page extractor against the BeautifulSoup original."""
+
+import pytest
+
+from aoc import markdown
+from aoc.bench.markdown import reference_markdown, sample_pages
+from aoc.markdown import generate_puzzle_markdown
+
+pytest.importorskip("bs4")
+pytest.importorskip("markdownify")
+
+# Shaped like a real day page, with the markup the site uses inside articles
+SITE_PAGE = """<!DOCTYPE html>
+<html lang="en-us">
+<head><title>Day 9 - Advent of Code 2016</title></head>
+<body>
+<header><h1 class="title-global"><a href="/">Advent of Code</a></h1></header>
+<main>
+<script>window.addEventListener('click', function(e) {});</script>
+<article class="day-desc"><h2>--- Day 9: Explosives in <em>Cyberspace</em> ---</h2>
+<p>Wandering around a secure area, you come across a <span title="It's a
+pun.">datalink port</span> to a new part of the network. After briefly
+scanning it for interesting files, you find one file in particular that
+catches your attention. It's compressed with an <em>experimental</em> format,
+<a href="https://en.wikipedia.org/wiki/Data_compression"
+target="_blank">however</a>.</p>
+<!-- a comment between blocks -->
+<p>The format has <em>markers</em> like <code>(10x2)</code>;
+a_b * c &amp; d &lt; e&nbsp;f.</p>
+<ul>
+<li><code>ADVENT</code> contains no markers and decompresses to itself with no
+changes, resulting in a <span title="Ho ho ho">decompressed length</span> of
+<code><em>6</em></code>.</li>
+<li>Nested:
+<ul><li>one <em class="star">*</em></li><li>two<br/>lines</li></ul>
+</li>
+</ul>
+<ol start="3"><li>third</li><li>fourth</li></ol>
+<pre><code>#.#..
+<em>##</em>..#  trailing   spaces
+</code></pre>
+<p>Use <a href="https://example.com/a_b">https://example.com/a_b</a> and
+<a href="/x" title="say &quot;hi&quot;">this</a>. <code>`tick`</code></p>
+<p>What is the <em>decompressed length</em> of the file?</p>
+</article>
+<p>Your puzzle answer was <code>98135</code>.</p><article class="day-desc"><h2 \
+id="part2">--- Part Two ---</h2><p>Apparently, the file actually uses <em>version
+two</em>.</p>
+<blockquote>Quoted
+text</blockquote></article>
+<p>Your puzzle answer was <code>10964557606</code>.</p>
+<p class="day-success">Both parts of this puzzle are complete!</p>
+</main>
+</body>
+</html>
+"""
+
+
+@pytest.mark.parametrize(("day", "html"), sorted(sample_pages(2016).items()))
+def test_committed_days_match_the_reference(day, html):
+    assert generate_puzzle_markdown(html, day) == reference_markdown(html, day)
+
+
+def test_site_markup_matches_the_reference():
+    assert generate_puzzle_markdown(SITE_PAGE, 9) == reference_markdown(SITE_PAGE, 9)
+
+
+def test_unanswered_part_has_no_answer_line():
+    page = SITE_PAGE.split('<article class="day-desc"><h2 id="part2">')[0]
+    page = page.replace("<p>Your puzzle answer was <code>98135</code>.</p>", "")
+    result = generate_puzzle_markdown(page + "<p>Answer: <input></p>", 9)
+    assert result == reference_markdown(page + "<p>Answer: <input></p>", 9)
+    assert "Your puzzle answer" not in result
+
+
+@pytest.mark.parametrize(
+    ("html", "error"),
+    [
+        ("<p>no title</p>", "title"),
+        ("<h2>Day 9</h2>", "Unexpected title"),
+        ("<h2>--- Day 9: X ---</h2>", "article"),
+    ],
+)
+def test_malformed_pages_raise(html, error):
+    with pytest.raises(ValueError, match=error):
+        generate_puzzle_markdown(html, 9)
+
+
+def test_conversions_are_cached_by_html_hash(monkeypatch):
+    calls = []
+    original = markdown._PageExtractor.feed
+    monkeypatch.setattr(
+        markdown._PageExtractor,
+        "feed",
+        lambda self, data: calls.append(data) or original(self, data),
+    )
+    first = generate_puzzle_markdown(SITE_PAGE + "<!-- cache -->", 9)
+    again = generate_puzzle_markdown(SITE_PAGE + "<!-- cache -->", 9)
+    other_day = generate_puzzle_markdown(SITE_PAGE + "<!-- cache -->", 10)
+
+    assert first == again
+    assert other_day.startswith("# Day 10:")
+    assert len(calls) == 2
@@ -0,0 +1,99 @@
+"""Tests for running parts through the parse-once protocol."""
+
+import pytest
+
+from aoc.display import display_result_table
+from aoc.puzzles.year2016.day15 import part1 as day15_part1
+from aoc.puzzles.year2016.day15 import part2 as day15_part2
+from aoc.puzzles.year2016.day20 import part1, part2
+from aoc.runner import run_part
+from aoc.scheduler import DEFAULT_LIMITS, NO_LIMITS, Job, TimingHistory, run_jobs
+from aoc.types import DayContext, PartStatus, SolveResult
+
+
+def test_day_context_shares_values_by_function():
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return value * 2
+
+    ctx = DayContext()
+
+    assert ctx.share(compute, 21) == 42
+    assert ctx.share(compute, 21) == 42
+    assert calls == [21]
+
+
+def test_parts_share_one_parse(monkeypatch):
+    parsed = []
+
+    def counting_parse(puzzle_input):
+        parsed.append(puzzle_input)
+        return part1.parse_ranges(puzzle_input)
+
+    # Part 2 imports part 1's parse, so both modules hold the same function
+    monkeypatch.setattr(part1, "parse", counting_parse)
+    monkeypatch.setattr(part2, "parse", counting_parse)
+    ctx = DayContext()
+
+    first = run_part(2016, 20, 1, context=ctx)
+    second = run_part(2016, 20, 2, context=ctx)
+
+    assert (first.answer, second.answer) == ("14975795", "101")
+    assert len(parsed) == 1
+    assert first.parse_time is not None
+    assert second.parse_time is not None
+    assert part1.merge_ranges in ctx.values
+
+
+def test_plain_solvers_report_no_parse_time():
+    result = run_part(2016, 1, 1)
+
+    assert result.answer == 161
+    assert result.parse_time is None
+
+
+def test_in_process_jobs_share_a_context_per_day(tmp_path, monkeypatch):
+    parsed = []
+    parse = day15_part1.parse
+
+    def counting_parse(puzzle_input):
+        parsed.append(puzzle_input)
+        return parse(puzzle_input)
+
+    monkeypatch.setattr(day15_part1, "parse", counting_parse)
+    monkeypatch.setattr(day15_part2, "parse", counting_parse)
+    history = TimingHistory(tmp_path / "timings.json")
+    jobs = [Job(2016, 15, 1), Job(2016, 15, 2), Job(2016, 4, 1)]
+
+    outcomes = run_jobs(jobs, workers=1, history=history, limits=NO_LIMITS)
+
+    assert outcomes[Job(2016, 15, 1)].answer == "122318"
+    assert outcomes[Job(2016, 15, 2)].answer == "3208583"
+    assert outcomes[Job(2016, 4, 1)].answer == 245102
+    assert len(parsed) == 1
+    assert outcomes[Job(2016, 15, 2)].parse_time == 0
+
+
+@pytest.mark.parametrize("day", [4, 10, 15, 20])
+def test_supervised_parts_of_a_day_share_the_parse(tmp_path, day):
+    history = TimingHistory(tmp_path / "timings.json")
+    jobs = [Job(2016, day, 1), Job(2016, day, 2)]
+
+    outcomes = run_jobs(jobs, workers=2, history=history, limits=DEFAULT_LIMITS)
+
+    assert all(o.status is PartStatus.OK for o in outcomes.values())
+    assert outcomes[Job(2016, day, 1)].parse_time > 0
+    assert outcomes[Job(2016, day, 2)].parse_time == 0
+
+
+def test_table_shows_parse_times(capsys):
+    result = SolveResult(2016, 20, "3", 0.5, "2", 0.25, part1_parse_time=0.125)
+
+    display_result_table([result])
+    header, _, row = capsys.readouterr().out.splitlines()[3:6]
+
+    assert header.split("|")[-3:-1] == [" Part 1 Parse ", " Part 2 Parse "]
+    assert row.split("|")[-3].strip() == "125ms"
+    assert row.split("|")[-2].strip() == "-"
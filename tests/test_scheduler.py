@@ -0,0 +1,89 @@
+"""Tests for the parallel part scheduler."""
+
+from aoc.scheduler import (
+    NO_LIMITS,
+    Job,
+    ResourceLimits,
+    TimingHistory,
+    find_days,
+    group_jobs,
+    order_jobs,
+    run_jobs,
+)
+from aoc.types import PartResult, PartStatus
+
+
+def test_find_days():
+    days = find_days(2016)
+    assert days[:3] == [1, 2, 3]
+    assert find_days(1999) == []
+
+
+def test_order_jobs_slowest_known_first(tmp_path):
+    history = TimingHistory(tmp_path / "timings.json")
+    history.record(PartResult(2016, 1, 1, 0, 0.5))
+    history.record(PartResult(2016, 1, 2, 0, 2.0))
+    history.record(PartResult(2016, 2, 1, 0, 0.1))
+    jobs = [Job(2016, 1, 1), Job(2016, 1, 2), Job(2016, 2, 1), Job(2016, 2, 2)]
+
+    # Unknown jobs go first, then known ones by decreasing time
+    assert order_jobs(jobs, history) == [
+        Job(2016, 2, 2),
+        Job(2016, 1, 2),
+        Job(2016, 1, 1),
+        Job(2016, 2, 1),
+    ]
+
+
+def test_group_jobs_keeps_parse_once_days_together():
+    jobs = [Job(2016, 20, 2), Job(2016, 1, 1), Job(2016, 20, 1), Job(2016, 1, 2)]
+
+    assert group_jobs(jobs) == [
+        [Job(2016, 20, 1), Job(2016, 20, 2)],
+        [Job(2016, 1, 1)],
+        [Job(2016, 1, 2)],
+    ]
+    assert group_jobs([Job(2016, 25, 1)]) == [[Job(2016, 25, 1)]]
+
+
+def test_run_jobs_in_pool_records_history(tmp_path):
+    history = TimingHistory(tmp_path / "timings.json")
+    jobs = [Job(2016, 1, 1), Job(2016, 1, 2), Job(2016, 6, 1)]
+
+    outcomes = run_jobs(jobs, workers=2, history=history)
+
+    assert outcomes[Job(2016, 1, 1)].answer == 161
+    assert outcomes[Job(2016, 1, 2)].answer == 110
+    assert outcomes[Job(2016, 6, 1)].answer == "ikerpcty"
+    reloaded = TimingHistory(tmp_path / "timings.json")
+    assert reloaded.estimate(Job(2016, 6, 1)) is not None
+
+
+def test_run_jobs_in_process(tmp_path):
+    history = TimingHistory(tmp_path / "timings.json")
+    outcomes = run_jobs([Job(2016, 2, 1)], workers=1, history=history, limits=NO_LIMITS)
+    assert outcomes[Job(2016, 2, 1)].answer == "92435"
+
+
+def test_run_jobs_reports_missing_part(tmp_path):
+    history = TimingHistory(tmp_path / "timings.json")
+    outcomes = run_jobs([Job(2016, 25, 1)], workers=1, history=history)
+
+    result = outcomes[Job(2016, 25, 1)]
+    assert result.status is PartStatus.ERROR
+    assert "ModuleNotFoundError" in result.error
+
+
+def test_run_jobs_kills_parts_over_budget(tmp_path):
+    history = TimingHistory(tmp_path / "timings.json")
+    jobs = [Job(2016, 5, 2), Job(2016, 16, 2), Job(2016, 1, 1)]
+    limits = ResourceLimits(timeout=0.5, memory=64 * 1024**2)
+
+    outcomes = run_jobs(jobs, workers=2, history=history, limits=limits)
+
+    # Day 5 hashes for ~30s, day 16 builds a 35M character string
+    assert outcomes[Job(2016, 5, 2)].status is PartStatus.TIMEOUT
+    assert outcomes[Job(2016, 16, 2)].status is PartStatus.OOM
+    assert outcomes[Job(2016, 1, 1)].answer == 161
+    # Stopped parts must not poison the timing history
+    assert history.estimate(Job(2016, 5, 2)) is None
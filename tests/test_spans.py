@@ -0,0 +1,84 @@
+"""Tests for solver phase spans."""
+
+import json
+
+import pytest
+
+from aoc.cli import main
+from aoc.display import display_spans
+from aoc.runner import RunOptions, run_part
+from aoc.spans import recording, span
+from aoc.types import SolveResult
+
+
+def test_spans_are_shared_no_ops_outside_recording():
+    assert span("parse") is span("search")
+    with span("parse"):
+        pass
+
+    with recording() as root:
+        pass
+
+    assert root.children == {}
+
+
+def test_recording_builds_merged_tree():
+    with recording("Part 1") as root:
+        with span("parse"):
+            pass
+        with span("search"):
+            for _ in range(3):
+                with span("expand"):
+                    pass
+
+    assert list(root.children) == ["parse", "search"]
+    search = root.children["search"]
+    assert (search.calls, search.children["expand"].calls) == (1, 3)
+    assert root.calls == 1
+    assert root.ns >= search.ns >= search.children["expand"].ns > 0
+
+
+def test_recording_survives_errors_and_is_not_reentrant():
+    with pytest.raises(ZeroDivisionError), recording() as root, span("divide"):
+        _ = 1 / 0
+
+    assert root.children["divide"].calls == 1
+    assert span("after") is span("again")  # Recording stopped
+    with recording(), pytest.raises(RuntimeError, match="already"), recording():
+        pass
+
+
+def test_run_part_records_solver_spans(capsys):
+    part1 = run_part(2016, 11, 1, RunOptions(spans=True))
+    part2 = run_part(2016, 11, 2, RunOptions(spans=True))
+
+    assert part1.answer == "31"
+    assert part1.spans is not None
+    assert list(part1.spans.children) == ["parse", "bfs"]
+    assert part1.time == part1.spans.ns / 1e9
+
+    display_spans([SolveResult.from_parts(part1, part2)])
+    lines = capsys.readouterr().out.splitlines()
+
+    assert lines[1] == "## 2016 Day 11 Spans"
+    assert lines[3].startswith("Day 11")
+    assert lines[3].endswith("100.0%")
+    assert lines[4].startswith("├── Part 1")
+    assert lines[5].startswith("│   ├── parse")
+    assert any(line.startswith("    └── (other)") for line in lines)
+
+
+def test_spans_exclude_other_measurements():
+    assert not RunOptions(spans=True).cacheable
+    with pytest.raises(ValueError, match="pick one of"):
+        RunOptions(memory=True, spans=True)
+
+
+def test_cli_writes_span_trees(capsys):
+    exit_code = main(["run", "2016", "-d", "11", "-p", "1", "--spans", "--no-limits"])
+    [record] = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+    assert exit_code == 0
+    assert record["spans"]["name"] == "Part 1"
+    assert record["spans"]["children"]["bfs"]["calls"] == 1
+    assert record["spans"]["ns"] >= record["spans"]["children"]["bfs"]["ns"]
@@ -0,0 +1,120 @@
+"""Tests for answer submission, the answer ledger and cooldown scheduling."""
+
+from aoc.bench.responses import sample_pages
+from aoc.submit import (
+    AnswerLedger,
+    Hint,
+    SubmissionQueue,
+    SubmissionResult,
+    Verdict,
+    parse_response,
+)
+
+RIGHT = "<article><p>That's the right answer!  You are one gold star closer.</p>"
+WRONG_HIGH = (
+    "<article><p>That's not the right answer; your answer is too high.  If you're"
+    " stuck, make sure you're using the full input data.  Please wait one minute"
+    " before trying again.</p></article>"
+)
+WRONG_LOW_LOCKOUT = (
+    "<article><p>That's not the right answer; your answer is too low.  Because you"
+    " have guessed incorrectly 4 times on this puzzle, please wait 5 minutes"
+    " before trying again.</p></article>"
+)
+TOO_SOON = (
+    "<article><p>You gave an answer too recently; you have to wait after submitting"
+    " an answer before trying again.  You have 1m 5s left to wait.</p></article>"
+)
+DONE = (
+    "<article><p>You don't seem to be solving the right level.  Did you already"
+    " complete it?</p></article>"
+)
+
+
+def test_parse_response():
+    assert parse_response(RIGHT) == SubmissionResult(Verdict.CORRECT)
+    assert parse_response(WRONG_HIGH) == SubmissionResult(
+        Verdict.WRONG, 60, Hint.TOO_HIGH
+    )
+    assert parse_response(WRONG_LOW_LOCKOUT) == SubmissionResult(
+        Verdict.WRONG, 300, Hint.TOO_LOW
+    )
+    assert parse_response(TOO_SOON) == SubmissionResult(Verdict.TOO_SOON, 65)
+    assert parse_response(DONE).verdict is Verdict.ALREADY_SOLVED
+    assert parse_response("<html></html>").verdict is Verdict.UNKNOWN
+
+
+def test_parse_response_reads_full_pages():
+    pages = sample_pages()
+    assert parse_response(pages["correct"]) == SubmissionResult(Verdict.CORRECT)
+    assert parse_response(pages["wrong, lockout"]) == SubmissionResult(
+        Verdict.WRONG, 300, Hint.TOO_LOW
+    )
+    assert parse_response(pages["too soon"]) == SubmissionResult(Verdict.TOO_SOON, 65)
+
+    # Only the message counts, not text before it
+    decoy = "<head><!-- That's the right answer --></head>" + TOO_SOON
+    assert parse_response(decoy).verdict is Verdict.TOO_SOON
+
+
+def test_ledger_rejects_known_bad_answers(tmp_path):
+    ledger = AnswerLedger(tmp_path / "answers.json")
+    ledger.record(2016, 1, 1, 300, parse_response(WRONG_HIGH), now=0)
+    ledger.record(2016, 1, 1, 100, parse_response(WRONG_LOW_LOCKOUT), now=0)
+    ledger.record(2016, 1, 1, "abc", SubmissionResult(Verdict.WRONG), now=0)
+    ledger.save()
+
+    ledger = AnswerLedger(tmp_path / "answers.json")
+    assert ledger.check(2016, 1, 1, 200) is None
+    assert "already rejected" in ledger.check(2016, 1, 1, 300)
+    assert "too high" in ledger.check(2016, 1, 1, 400)
+    assert "too low" in ledger.check(2016, 1, 1, "42")
+    assert "already rejected" in ledger.check(2016, 1, 1, "abc")
+    assert ledger.entry(2016, 1, 1).not_before == 300
+
+    ledger.record(2016, 1, 1, 161, parse_response(RIGHT), now=0)
+    assert "accepted" in ledger.check(2016, 1, 1, 200)
+    assert ledger.check(2016, 1, 2, 300) is None
+
+
+class FakeClient:
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.sent = []
+
+    def submit_answer(self, year, day, part, answer):
+        self.sent.append((year, day, part, answer))
+        return self.replies.pop(0)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_queue_waits_out_cooldowns_and_skips_known_bad(tmp_path):
+    client = FakeClient([TOO_SOON, WRONG_HIGH, RIGHT])
+    clock = FakeClock()
+    ledger = AnswerLedger(tmp_path / "answers.json")
+    queue = SubmissionQueue(client, ledger, clock=clock, sleep=clock.sleep)
+
+    queue.add(2016, 1, 1, 500)
+    queue.add(2016, 1, 1, 600)  # Above 500 once that is known to be too high
+    queue.add(2016, 1, 1, 161)
+    results = queue.run()
+
+    # 500 was bounced once, then retried after the announced 65s
+    assert client.sent == [(2016, 1, 1, 500), (2016, 1, 1, 500), (2016, 1, 1, 161)]
+    assert [r.verdict for _, r in results] == [
+        Verdict.WRONG,
+        Verdict.REJECTED,
+        Verdict.CORRECT,
+    ]
+    # 161 had to wait out the one-minute penalty of the wrong answer
+    assert clock.now == 1000 + 65 + 60
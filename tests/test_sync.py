@@ -0,0 +1,91 @@
+"""Tests for the concurrent, resumable puzzle mirror."""
+
+import threading
+from datetime import UTC, datetime
+
+import pytest
+import requests
+
+from aoc.sync import SyncStatus, sync
+
+PAGE = """<main>
+<article class="day-desc"><h2>--- Day {day}: Stub ---</h2><p>Text.</p></article>
+</main>"""
+
+
+class FakeClient:
+    cache = None  # Inputs are written by sync, not by a client cache
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def _record(self, call):
+        with self.lock:
+            self.calls.append(call)
+        if call in self.fail:
+            raise requests.HTTPError("500 Server Error")
+
+    def fetch_puzzle(self, year, day):
+        self._record(("puzzle", year, day))
+        return PAGE.format(day=day)
+
+    def fetch_input(self, year, day):
+        self._record(("input", year, day))
+        return f"input {year} {day}\n"
+
+
+@pytest.fixture
+def puzzles(tmp_path, monkeypatch):
+    monkeypatch.setattr("aoc.helpers.get_year_dir", lambda year: tmp_path / str(year))
+    return tmp_path
+
+
+def test_sync_fetches_missing_files_and_resumes(puzzles):
+    (puzzles / "2016" / "day02").mkdir(parents=True)
+    (puzzles / "2016" / "day02" / "input.txt").write_text("already here")
+    client = FakeClient(fail={("puzzle", 2016, 3)})
+    seen = []
+
+    items = sync(
+        [2016],
+        days=[1, 2, 3],
+        client=client,
+        workers=3,
+        progress=lambda done, total, item: seen.append((done, total, item.kind)),
+    )
+
+    statuses = {(i.day, i.kind): i.status for i in items}
+    assert statuses[2, "input"] is SyncStatus.SKIPPED
+    assert statuses[3, "puzzle"] is SyncStatus.FAILED
+    assert sum(s is SyncStatus.FETCHED for s in statuses.values()) == 4
+    assert (puzzles / "2016" / "day01" / "input.txt").read_text() == "input 2016 1\n"
+    assert (
+        (puzzles / "2016" / "day01" / "puzzle.md")
+        .read_text()
+        .startswith("# Day 1: Stub")
+    )
+    assert (puzzles / "2016" / "day02" / "input.txt").read_text() == "already here"
+    assert sorted(done for done, _, _ in seen) == list(range(1, 7))
+
+    # A second run only retries what is still missing
+    client = FakeClient()
+    items = sync([2016], days=[1, 2, 3], client=client, progress=None)
+    assert client.calls == [("puzzle", 2016, 3)]
+    assert all(i.status is not SyncStatus.FAILED for i in items)
+
+
+def test_unreleased_days_are_not_requested(puzzles):
+    client = FakeClient()
+    now = datetime(2030, 12, 2, 12, tzinfo=UTC)
+    items = sync(
+        [2030], days=[1, 2, 3], client=client, puzzles=False, progress=None, now=now
+    )
+    assert [i.status for i in items] == [
+        SyncStatus.FETCHED,
+        SyncStatus.FETCHED,
+        SyncStatus.LOCKED,
+    ]
+    assert ("input", 2030, 3) not in client.calls
+    assert (puzzles / "2030" / "day01" / "input.txt").exists()
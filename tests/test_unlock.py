@@ -0,0 +1,119 @@
+"""Tests for the unlock-time fetcher against a local server with a fake clock."""
+
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from aoc.http import AoCClient, TokenBucket, unlock_time
+from aoc.unlock import UnlockFetcher
+
+UNLOCK = unlock_time(2016, 1).timestamp()
+SERVER_AHEAD = 7.0  # Server clock minus local clock
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class UnlockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def date_time_string(self, timestamp=None):
+        return super().date_time_string(timestamp or self.server.clock() + SERVER_AHEAD)
+
+    def _reply(self, body):
+        server_time = self.server.clock() + SERVER_AHEAD
+        if body is not None and server_time < UNLOCK:
+            body, status = "not yet", 404
+        else:
+            status = 200
+        payload = (body or "").encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        return payload, server_time
+
+    def do_HEAD(self):
+        self._reply(None)
+
+    def do_GET(self):
+        body = {"/2016/day/1": "<h2>page</h2>", "/2016/day/1/input": "R2, L3\n"}
+        payload, server_time = self._reply(body[self.path])
+        self.server.gets.append((self.path, server_time, self.client_address[1]))
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), UnlockHandler)
+    server.gets = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_at_unlock(server):
+    clock = FakeClock(UNLOCK - SERVER_AHEAD - 100.3)
+    server.clock = clock
+    host, port = server.server_address
+    client = AoCClient(
+        "secret",
+        base_url=f"http://{host}:{port}",
+        limiter=TokenBucket(rate=1000, capacity=1000),
+        cache=False,
+    )
+    fetcher = UnlockFetcher(client, clock=clock, sleep=clock.sleep, keepalive=30)
+
+    offset = fetcher.warm()
+    assert offset.low <= SERVER_AHEAD <= offset.high
+    assert all(latency.connect > 0 for latency in fetcher.setup)
+
+    result = fetcher.fetch_at_unlock(2016, 1)
+    fetcher.close()
+
+    assert result.puzzle == "<h2>page</h2>"
+    assert result.input == "R2, L3\n"
+    # Woke up at most a second after the unlock, never before
+    assert all(UNLOCK <= t < UNLOCK + 1 for _, t, _ in server.gets)
+    assert len(server.gets) == 2
+    # Both requests went out on the connections opened while warming
+    assert result.puzzle_latency.connect == result.input_latency.connect == 0
+    assert result.puzzle_latency.ttfb > 0
+    assert len(clock.sleeps) > 1  # Keep-alive pings while waiting
+
+
+def test_each_connection_resolves_the_host_once(server, monkeypatch):
+    lookups = []
+    getaddrinfo = socket.getaddrinfo
+
+    def counting_getaddrinfo(*args, **kwargs):
+        lookups.append(args[0])
+        return getaddrinfo(*args, **kwargs)
+
+    monkeypatch.setattr(socket, "getaddrinfo", counting_getaddrinfo)
+    server.clock = FakeClock(UNLOCK)
+    host, port = server.server_address
+    client = AoCClient("secret", base_url=f"http://{host}:{port}", cache=False)
+    fetcher = UnlockFetcher(client)
+
+    fetcher.warm()
+    fetcher.close()
+
+    # The DNS phase is the only lookup, so "connect" is only the handshake
+    assert lookups == [host, host]
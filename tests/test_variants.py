@@ -0,0 +1,82 @@
+"""Tests for named part implementations and their head-to-head runs."""
+
+import json
+
+import pytest
+
+from aoc.cli import main
+from aoc.puzzles.year2016.day18 import part1
+from aoc.runner import RunOptions, run_part
+from aoc.variants import VariantDefaults, implementations, resolve
+
+
+def test_implementations_start_with_the_reference():
+    solvers = implementations(part1)
+
+    assert list(solvers) == ["reference", "bitset"]
+    assert solvers["reference"] is part1.solve
+
+
+def test_defaults_are_per_machine(tmp_path):
+    path = tmp_path / "variants.json"
+    mine = VariantDefaults(path, machine="mine")
+    mine.set(2016, 18, 1, "bitset")
+    mine.save()
+
+    assert VariantDefaults(path, machine="mine").get(2016, 18, 1) == "bitset"
+    assert VariantDefaults(path, machine="other").get(2016, 18, 1) is None
+
+
+def test_resolve_uses_the_machine_default(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path))
+
+    assert resolve(part1, 2016, 18, 1)[0] == "reference"
+    defaults = VariantDefaults()
+    defaults.set(2016, 18, 1, "bitset")
+    defaults.save()
+    assert resolve(part1, 2016, 18, 1) == ("bitset", part1.solve_bitset)
+    assert resolve(part1, 2016, 18, 1, "reference")[0] == "reference"
+    with pytest.raises(ValueError, match="no implementation 'gpu'"):
+        resolve(part1, 2016, 18, 1, "gpu")
+
+    # A default whose implementation was removed falls back to the reference
+    defaults.set(2016, 18, 1, "removed")
+    defaults.save()
+    assert resolve(part1, 2016, 18, 1)[0] == "reference"
+
+
+def test_run_part_runs_the_requested_implementation():
+    result = run_part(2016, 18, 1, RunOptions(variant="bitset"))
+
+    assert (result.answer, result.variant) == ("1961", "bitset")
+    assert not RunOptions(variant="bitset").cacheable
+
+
+def test_cli_races_variants_and_sets_the_default(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path))
+    argv = ["variants", "2016", "-d", "18", "-p", "1", "--repeat", "3"]
+
+    exit_code = main([*argv, "--warmup", "0", "--set-default"])
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+
+    assert exit_code == 0
+    assert [(r["variant"], r["answer"]) for r in records] == [
+        ("reference", "1961"),
+        ("bitset", "1961"),
+    ]
+    assert captured.err.startswith("2016 day 18 part 1: bitset ")
+    assert VariantDefaults().get(2016, 18, 1) == "bitset"
+
+
+def test_cli_reports_disagreeing_variants(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(part1, "VARIANTS", {"wrong": lambda _: "0"})
+    argv = ["variants", "2016", "-d", "18", "-p", "1", "--no-limits"]
+
+    exit_code = main([*argv, "--repeat", "1", "--warmup", "0"])
+
+    assert exit_code == 1
+    assert "implementations disagree (reference=1961, wrong=0)" in (
+        capsys.readouterr().err
+    )